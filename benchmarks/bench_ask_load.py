@@ -0,0 +1,143 @@
+# benchmarks/bench_ask_load.py
+"""
+Concurrent ask() load against the local OpenAI stand-in (jimbruz_fakeapi).
+Run: python benchmarks/bench_ask_load.py [--targets core phase6] [--concurrency 1 4 16]
+         [--requests 200] [--latency lognormal:300,0.5] [--token-delay 5]
+         [--error-rate 0.02] [--rps 20] [--retries N]
+ - Throughput and p50 / p95 / p99 ask latency per target and concurrency
+ - Fallback rate (replies that didn't come from the API)
+ - Memory-file contention: journal.append latency under load and flush count
+ - Server side: 500s injected, 429s returned, peak requests in flight
+Each run is a fresh interpreter in a temporary directory (real data/ untouched).
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import threading
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.join(HERE, "..")
+QUESTIONS = ["what do you know about my sister", "do you remember my birthday",
+             "tell me about the garden", "what music do I like", "are you tired"]
+
+
+def pct(samples, p):
+    s = sorted(samples)
+    return s[min(len(s) - 1, int(len(s) * p))] * 1000 if s else 0.0
+
+
+# ---- one run (child process) ----
+def run_child(target, concurrency, requests, base_url, retries):
+    os.environ["OPENAI_API_KEY"] = "local"
+    os.environ["OPENAI_BASE_URL"] = base_url
+    from jimbruz_fakeapi import DEFAULT_REPLY
+    if target == "core":
+        import jimbruz_core as mod
+    else:
+        import jimbruz_phase6 as mod
+    if target == "phase6" or retries is not None:
+        from openai import OpenAI
+        kwargs = {} if retries is None else {"max_retries": retries}
+        mod.client = OpenAI(api_key="local", base_url=base_url, **kwargs)
+    pet = mod.Jimbruz()
+    journal = mod.journal
+
+    # measure how long writers wait on the memory file
+    appends, flushes = [], [0, 0.0]
+    lock = threading.Lock()
+    append, flush = journal.append, journal.flush
+
+    def timed_append(*a, **k):
+        t = time.perf_counter()
+        try:
+            return append(*a, **k)
+        finally:
+            with lock:
+                appends.append(time.perf_counter() - t)
+
+    def timed_flush():
+        t = time.perf_counter()
+        try:
+            return flush()
+        finally:
+            with lock:
+                flushes[0] += 1
+                flushes[1] += time.perf_counter() - t
+    journal.append, journal.flush = timed_append, timed_flush
+
+    def one(i):
+        t = time.perf_counter()
+        out = pet.ask(f"{QUESTIONS[i % len(QUESTIONS)]} #{i}")  # unique: no reply-cache hits
+        return time.perf_counter() - t, (out or "").strip() != DEFAULT_REPLY
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(one, range(requests)))
+    wall = time.perf_counter() - started
+    journal.flush()
+    lat = [r[0] for r in results]
+    return {
+        "throughput": requests / wall,
+        "p50": pct(lat, .5), "p95": pct(lat, .95), "p99": pct(lat, .99),
+        "fallback_rate": sum(r[1] for r in results) / requests,
+        "append_p99_ms": pct(appends, .99), "append_max_ms": pct(appends, 1.0),
+        "flushes": flushes[0], "flush_ms": flushes[1] * 1000,
+    }
+
+
+# ---- driver ----
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--targets", nargs="+", default=["core", "phase6"], choices=["core", "phase6"])
+    ap.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16])
+    ap.add_argument("--requests", type=int, default=200)
+    ap.add_argument("--latency", default="lognormal:300,0.5", help="first-token latency distribution (ms)")
+    ap.add_argument("--token-delay", type=float, default=5.0, help="ms between streamed tokens")
+    ap.add_argument("--error-rate", type=float, default=0.0)
+    ap.add_argument("--rps", type=float, default=None, help="server rate limit (429 beyond it)")
+    ap.add_argument("--retries", type=int, default=None, help="OpenAI client max_retries (default: client's)")
+    ap.add_argument("--seed", type=int, default=1)
+    args = ap.parse_args()
+
+    sys.path.insert(0, ROOT)
+    from jimbruz_fakeapi import FakeChatServer
+    server = FakeChatServer(latency=args.latency, token_delay=args.token_delay / 1000,
+                            error_rate=args.error_rate, rps=args.rps, seed=args.seed).start()
+    print(f"{'target':>7} {'conc':>4} | {'ask/s':>6} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+          f"{'fallback':>8} | {'append p99/max ms':>17} {'flushes':>7} | {'500s':>4} {'429s':>4} {'peak':>4}")
+    try:
+        for target in args.targets:
+            for conc in args.concurrency:
+                server.reset_stats()
+                with tempfile.TemporaryDirectory(prefix="jimbruz-load-") as tmp:
+                    env = dict(os.environ, PYTHONPATH=os.path.abspath(ROOT))
+                    cmd = [sys.executable, os.path.abspath(__file__), "--child", target, str(conc),
+                           str(args.requests), server.base_url, str(args.retries)]
+                    out = subprocess.run(cmd, cwd=tmp, env=env, capture_output=True, text=True)
+                srv = server.stats()
+                if out.returncode != 0:
+                    err = out.stderr.strip().splitlines()
+                    print(f"{target:>7} {conc:>4} | failed: {err[-1] if err else '?'}")
+                    continue
+                r = json.loads(out.stdout.strip().splitlines()[-1])
+                print(f"{target:>7} {conc:>4} | {r['throughput']:6.1f} {r['p50']:8.1f} {r['p95']:8.1f} "
+                      f"{r['p99']:8.1f} {r['fallback_rate']:8.1%} | "
+                      f"{r['append_p99_ms']:8.3f}/{r['append_max_ms']:8.3f} {r['flushes']:7d} | "
+                      f"{srv['errors']:4d} {srv['rate_limited']:4d} {srv['peak_in_flight']:4d}")
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 7 and sys.argv[1] == "--child":
+        _, _, target, conc, n, url, retries = sys.argv
+        print(json.dumps(run_child(target, int(conc), int(n), url,
+                                   None if retries == "None" else int(retries))))
+    else:
+        main()
@@ -0,0 +1,122 @@
+# benchmarks/bench_canvas.py
+"""
+N pets as moving native windows (Herd) vs painted on one transparent canvas (CanvasHerd).
+Run: python benchmarks/bench_canvas.py [--seconds 5] [--counts 1 5 10 25] [--compositor picom]
+ - app CPU%: the pet process, painting and backing-store flushes included
+ - compositor CPU%: the named process (kwin_x11, gnome-shell, picom, ...)
+   sampled from /proc over the run; needs a real display, so set
+   QT_QPA_PLATFORM to your platform instead of the default offscreen
+ - moves/s: native window moves; repaint kpx/s: area of every paint event
+ - tick p99: the move + animation ticks; paint p99: the canvas paintEvent
+Each case runs in a fresh interpreter.
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import subprocess
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+MODES = ["windows", "canvas"]
+
+
+def find_pid(name):
+    for pid in os.listdir("/proc"):
+        if pid.isdigit():
+            try:
+                with open(f"/proc/{pid}/comm") as f:
+                    if f.read().strip() == name:
+                        return int(pid)
+            except OSError:
+                pass
+    return None
+
+
+def cpu_ticks(pid):
+    with open(f"/proc/{pid}/stat") as f:
+        fields = f.read().rsplit(")", 1)[1].split()
+    return int(fields[11]) + int(fields[12])  # utime + stime
+
+
+def run_case(mode, count, seconds, compositor):
+    sys.path.insert(0, ROOT)
+    os.chdir(ROOT)
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt5.QtWidgets import QApplication
+    from PyQt5.QtCore import QObject, QEvent, QTimer, QEventLoop
+    from jimbruz_sprites import FrameStats
+    app = QApplication([])
+    from jimbruz_phase4 import Herd, CanvasHerd
+    random.seed(1)
+
+    class PaintArea(QObject):
+        px = 0
+
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Paint:
+                self.px += sum(r.width() * r.height() for r in event.region().rects())
+            return False
+
+    herd = (CanvasHerd if mode == "canvas" else Herd)(count)
+    herd.show()
+    herd.scheduler.set_interval("behavior", 1000)  # re-roll often so pets spend more time moving
+    app.processEvents()
+    painted = PaintArea()
+    app.installEventFilter(painted)
+    ticks = FrameStats(keep=100000)
+
+    pid = find_pid(compositor) if compositor else None
+    hz = os.sysconf("SC_CLK_TCK")
+    loop = QEventLoop()
+    QTimer.singleShot(int(seconds * 1000), loop.quit)
+    comp0 = cpu_ticks(pid) if pid else 0
+    moves0 = herd.native_moves.total
+    herd.move_stats.samples.clear()
+    herd.frame_stats.samples.clear()
+    cpu0, wall0 = time.process_time(), time.perf_counter()
+    loop.exec_()
+    wall = time.perf_counter() - wall0
+    ticks.samples = herd.move_stats.samples + herd.frame_stats.samples
+    paint = herd.canvas.paint_stats.summary() if mode == "canvas" else None
+    print(json.dumps({
+        "cpu": (time.process_time() - cpu0) / wall * 100,
+        "compositor": (cpu_ticks(pid) - comp0) / hz / wall * 100 if pid else None,
+        "moves": (herd.native_moves.total - moves0) / wall,
+        "kpx": painted.px / wall / 1000,
+        "tick_p99": ticks.summary()["p99_us"],
+        "paint_p99": paint["p99_us"] if paint else None,
+    }))
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--seconds", type=float, default=5.0)
+    ap.add_argument("--counts", type=int, nargs="+", default=[1, 5, 10, 25])
+    ap.add_argument("--compositor", default="", help="compositor process name to sample")
+    args = ap.parse_args()
+
+    print(f"{'pets':>5} {'mode':>8} | {'app CPU%':>8} {'comp CPU%':>9} {'moves/s':>8} {'repaint kpx/s':>13} "
+          f"{'tick p99 us':>11} {'paint p99 us':>12}")
+    for n in args.counts:
+        for mode in MODES:
+            out = subprocess.run([sys.executable, os.path.abspath(__file__), "--case", mode, str(n),
+                                  str(args.seconds), args.compositor], capture_output=True, text=True)
+            try:
+                r = json.loads(out.stdout.strip().splitlines()[-1])
+            except Exception:
+                print(f"{n:>5} {mode:>8} | failed")
+                continue
+            comp = f"{r['compositor']:9.1f}" if r["compositor"] is not None else f"{'-':>9}"
+            paint = f"{r['paint_p99']:12.0f}" if r["paint_p99"] is not None else f"{'-':>12}"
+            print(f"{n:>5} {mode:>8} | {r['cpu']:8.1f} {comp} {r['moves']:8.1f} {r['kpx']:13.0f} "
+                  f"{r['tick_p99']:11.0f} {paint}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 6 and sys.argv[1] == "--case":
+        run_case(sys.argv[2], int(sys.argv[3]), float(sys.argv[4]), sys.argv[5])
+    else:
+        main()
@@ -0,0 +1,84 @@
+# benchmarks/bench_herd.py
+"""
+Memory and CPU for N pets: N independent phase 4 windows vs one Herd
+(shared frame store, one scheduler).
+Run: python benchmarks/bench_herd.py [seconds] [counts ...]   (default: 5s, 1 5 10 25 50)
+Each case runs in a fresh interpreter so decoded frames are never shared between them.
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import subprocess
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+_app = None  # the QApplication, kept alive for the whole run
+
+
+def peak_rss_mb():
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_case(mode, count, seconds):
+    sys.path.insert(0, ROOT)
+    os.chdir(ROOT)
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt5.QtWidgets import QApplication
+    from PyQt5.QtCore import QTimer, QEventLoop
+    global _app
+    _app = QApplication([])
+    from jimbruz_phase4 import Jimbruz, Herd
+    random.seed(1)
+    base = peak_rss_mb()
+
+    if mode == "herd":
+        herd = Herd(count)
+        herd.show()
+        schedulers = [herd.scheduler]
+    else:
+        pets = [Jimbruz() for _ in range(count)]
+        for pet in pets:
+            pet.show()
+        schedulers = [pet.scheduler for pet in pets]
+    for sch in schedulers:  # re-roll behavior more often so pets spend more time moving
+        sch.set_interval("behavior", 1000)
+
+    loop = QEventLoop()
+    QTimer.singleShot(int(seconds * 1000), loop.quit)
+    cpu0, wall0 = time.process_time(), time.perf_counter()
+    before = sum(s.wakeups for s in schedulers)
+    loop.exec_()
+    wall = time.perf_counter() - wall0
+    print(json.dumps({
+        "cpu": (time.process_time() - cpu0) / wall * 100,
+        "wakeups": (sum(s.wakeups for s in schedulers) - before) / wall,
+        "rss": peak_rss_mb() - base,
+    }))
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 5.0
+    counts = [int(a) for a in sys.argv[2:]] or [1, 5, 10, 25, 50]
+    print(f"{'pets':>5} | {'windows: MB':>11} {'CPU%':>6} {'wakeups/s':>9} | {'herd: MB':>8} {'CPU%':>6} {'wakeups/s':>9}")
+    for n in counts:
+        row = []
+        for mode in ("windows", "herd"):
+            out = subprocess.run([sys.executable, os.path.abspath(__file__), "--case", mode, str(n), str(seconds)],
+                                 capture_output=True, text=True)
+            try:
+                row.append(json.loads(out.stdout.strip().splitlines()[-1]))
+            except Exception:
+                row.append(None)
+        cells = [f"{r['rss']:11.1f} {r['cpu']:6.1f} {r['wakeups']:9.1f}" if r else f"{'failed':>28}" for r in row]
+        print(f"{n:>5} | {cells[0]} | {cells[1].strip():>26}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 5 and sys.argv[1] == "--case":
+        run_case(sys.argv[2], int(sys.argv[3]), float(sys.argv[4]))
+    else:
+        main()
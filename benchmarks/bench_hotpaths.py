@@ -0,0 +1,210 @@
+# benchmarks/bench_hotpaths.py
+"""
+Memory, prompt and reply hot paths of jimbruz_core and jimbruz_phase6 on
+synthetic memory histories, fully offline.
+Run: python benchmarks/bench_hotpaths.py [--sizes 1000 10000 100000 1000000]
+                                          [--latency MS] [--update-baseline]
+ - Times save_memory, load_memories, ask() context building, ask() against a
+   local OpenAI stand-in, the fallback reply and the memories listing
+ - Reports p50 / p99 per operation and the peak RSS of each run
+ - Compares with benchmarks/baseline_hotpaths.json and exits 1 on regressions
+Each (implementation, size) pair runs in a fresh interpreter inside a
+temporary directory, so the real data/ folder is never touched.
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import subprocess
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.join(HERE, "..")
+BASELINE = os.path.join(HERE, "baseline_hotpaths.json")
+
+IMPLS = ["core", "phase6"]
+SIZES = [1000, 10000, 100000, 1000000]
+TOLERANCE = 1.0      # p50/p99 may double before it counts as a regression
+MIN_DELTA_MS = {"p50_ms": 0.5, "p99_ms": 2.0}  # ...and grow by at least this much (timer/GC noise)
+RSS_TOLERANCE = 0.25
+STUB_REPLY = "Hm. The snow remembers. Sit a while."
+
+
+def pct(samples, p):
+    s = sorted(samples)
+    return s[min(len(s) - 1, int(len(s) * p))] * 1000
+
+
+def timed(fn, repeat):
+    samples = []
+    for i in range(repeat):
+        t = time.perf_counter()
+        fn(i)
+        samples.append(time.perf_counter() - t)
+    return {"p50_ms": pct(samples, .5), "p99_ms": pct(samples, .99), "runs": repeat}
+
+
+def peak_rss_mb():
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+    except ImportError:
+        try:
+            import psutil
+            return psutil.Process().memory_info().peak_wset / (1024 * 1024)
+        except Exception:
+            return None
+
+
+# ---- one run (child process) ----
+def write_history(n):
+    from bench_recall import synthetic
+    from jimbruz_memory import _encode
+    os.makedirs("data", exist_ok=True)
+    with open(os.path.join("data", "memories.jsonl"), "w", encoding="utf8") as f:
+        for i in range(0, n, 10000):
+            f.write("".join(_encode(m) for m in synthetic(min(10000, n - i), seed=i)))
+
+
+def run_child(impl, n, base_url):
+    from bench_recall import QUESTIONS
+    write_history(n)
+    os.environ["OPENAI_API_KEY"] = "local"
+    os.environ["OPENAI_BASE_URL"] = base_url
+    if impl == "core":
+        import jimbruz_core as mod
+    else:
+        import jimbruz_phase6 as mod
+        from openai import OpenAI
+        mod.client = OpenAI(api_key="local", base_url=base_url)
+    pet = mod.Jimbruz()
+    results = {}
+
+    results["load_memories"] = timed(lambda i: mod.load_memories(), max(3, min(30, 100000 // n)))
+
+    page_size = 20 if impl == "core" else 5
+
+    def listing(i):
+        "\n".join(mod.memories_command(mod.journal, "", page_size))
+    results["memories_list"] = timed(listing, 500)
+
+    results["save_memory"] = timed(lambda i: mod.save_memory(f"bench note {i}"), 2000)
+    mod.journal.flush()
+
+    t = time.perf_counter()
+    mod.relevant_memories(QUESTIONS[0], 6)  # builds the recall index
+    results["recall_build"] = {"p50_ms": (time.perf_counter() - t) * 1000,
+                               "p99_ms": (time.perf_counter() - t) * 1000, "runs": 1}
+    k = 6 if impl == "core" else 5
+
+    def context(i):
+        notes = [m["note"] for m in mod.relevant_memories(QUESTIONS[i % len(QUESTIONS)], k)]
+        " | ".join(notes)
+    results["ask_context"] = timed(context, 200)
+
+    if impl == "core":
+        mod.openai_ready()  # main() warms the client up before the first prompt
+    # unique prompts, so every ask misses the reply cache and reaches the stub
+    results["ask_stub"] = timed(lambda i: pet.ask(f"{QUESTIONS[i % len(QUESTIONS)]} #{i}"), 50)
+
+    if impl == "core":
+        results["fallback_reply"] = timed(lambda i: mod.fallback_reply(QUESTIONS[i % len(QUESTIONS)]), 5000)
+    else:
+        mod.client = None  # phase 6 has no separate helper; its ask() falls back inline
+        results["fallback_reply"] = timed(lambda i: pet.ask(QUESTIONS[i % len(QUESTIONS)]), 200)
+
+    mod.journal.flush()
+    return {"ops": results, "peak_rss_mb": peak_rss_mb()}
+
+
+# ---- driver ----
+def run(impl, n, base_url):
+    with tempfile.TemporaryDirectory(prefix="jimbruz-bench-") as tmp:
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join([os.path.abspath(ROOT), HERE]))
+        out = subprocess.run([sys.executable, os.path.abspath(__file__), "--child", impl, str(n), base_url],
+                             cwd=tmp, env=env, capture_output=True, text=True)
+    if out.returncode != 0:
+        raise RuntimeError(out.stderr.strip().splitlines()[-1] if out.stderr.strip() else "child failed")
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def compare(results, baseline, latency):
+    problems = []
+    same_stub = baseline.get("latency_ms") == latency
+    for key, cur in results.items():
+        old = baseline.get("runs", {}).get(key)
+        if not old:
+            continue
+        for op, stats in cur["ops"].items():
+            if op == "ask_stub" and not same_stub:
+                continue
+            prev = old["ops"].get(op)
+            if not prev:
+                continue
+            for field, slack in MIN_DELTA_MS.items():
+                a, b = prev[field], stats[field]
+                if b > a * (1 + TOLERANCE) and b - a > slack:
+                    problems.append(f"{key} {op} {field}: {a:.3f} -> {b:.3f} ms")
+        a, b = old.get("peak_rss_mb"), cur.get("peak_rss_mb")
+        if a and b and b > a * (1 + RSS_TOLERANCE):
+            problems.append(f"{key} peak RSS: {a:.1f} -> {b:.1f} MB")
+    return problems
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    ap.add_argument("--impls", nargs="+", default=IMPLS, choices=IMPLS)
+    ap.add_argument("--latency", type=float, default=0.0, help="stub first-token delay in ms")
+    ap.add_argument("--baseline", default=BASELINE)
+    ap.add_argument("--update-baseline", action="store_true")
+    args = ap.parse_args()
+
+    sys.path.insert(0, ROOT)
+    from jimbruz_fakeapi import FakeChatServer
+    server = FakeChatServer(STUB_REPLY, first_token_delay=args.latency / 1000, token_delay=0).start()
+
+    results = {}
+    try:
+        for n in args.sizes:
+            for impl in args.impls:
+                key = f"{impl}/{n}"
+                try:
+                    res = run(impl, n, server.base_url)
+                except Exception as e:
+                    print(f"{key:>16}  failed: {e}")
+                    continue
+                results[key] = res
+                print(f"{key:>16}  peak RSS {res['peak_rss_mb'] or 0:7.1f} MB")
+                for op, s in res["ops"].items():
+                    print(f"{'':>16}  {op:<15} p50 {s['p50_ms']:9.3f} ms  p99 {s['p99_ms']:9.3f} ms")
+    finally:
+        server.stop()
+
+    if args.update_baseline:
+        with open(args.baseline, "w", encoding="utf8") as f:
+            json.dump({"latency_ms": args.latency, "runs": results}, f, indent=1, sort_keys=True)
+        print(f"\nbaseline written to {args.baseline}")
+        return 0
+    if not os.path.exists(args.baseline):
+        print("\nno baseline yet (run with --update-baseline)")
+        return 0
+    with open(args.baseline, encoding="utf8") as f:
+        problems = compare(results, json.load(f), args.latency)
+    if problems:
+        print("\nREGRESSIONS:")
+        for p in problems:
+            print("  " + p)
+        return 1
+    print("\nno regressions against baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 5 and sys.argv[1] == "--child":
+        print(json.dumps(run_child(sys.argv[2], int(sys.argv[3]), sys.argv[4])))
+    else:
+        sys.exit(main())
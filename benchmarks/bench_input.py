@@ -0,0 +1,68 @@
+# benchmarks/bench_input.py
+"""
+Idle CPU of the phase 4 keyboard listener: old busy loop vs KeyInput.
+Run: python benchmarks/bench_input.py [seconds]
+Nothing is pressed during the run, which is the pet's normal state.
+"""
+
+import os
+import sys
+import time
+import threading
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtCore import QCoreApplication, QTimer
+
+import jimbruz_input
+from jimbruz_input import KeyInput, DEFAULT_KEYMAP
+
+
+def _is_pressed():
+    kb = jimbruz_input.keyboard
+    try:
+        kb.is_pressed("a")
+        return kb.is_pressed
+    except Exception:
+        # no keyboard access here (e.g. CI without /dev/input): time the loop itself
+        return lambda key: False
+
+
+def measure(app, seconds, start):
+    stop = threading.Event()
+    start(stop)
+    cpu0, wall0 = time.process_time(), time.perf_counter()
+    QTimer.singleShot(int(seconds * 1000), app.quit)
+    app.exec_()
+    cpu = time.process_time() - cpu0
+    wall = time.perf_counter() - wall0
+    stop.set()
+    return cpu / wall * 100
+
+
+def legacy(stop):
+    is_pressed = _is_pressed()
+
+    def loop():
+        while not stop.is_set():  # the old listen_keys(), minus the state writes
+            for key in ["a", "d", "left", "right", "shift", "space", "h", "k"]:
+                is_pressed(key)
+    threading.Thread(target=loop, daemon=True).start()
+
+
+def event_driven(stop):
+    ki = KeyInput(DEFAULT_KEYMAP).start()
+    print(f"  KeyInput mode: {ki.mode or 'unavailable (no keyboard access)'}")
+    threading.Thread(target=lambda: (stop.wait(), ki.stop()), daemon=True).start()
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 3.0
+    app = QCoreApplication(sys.argv)
+    print(f"busy loop (old listen_keys): {measure(app, seconds, legacy):6.1f}% CPU")
+    print(f"KeyInput (hooks / 30 Hz poll): {measure(app, seconds, event_driven):6.1f}% CPU")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+# benchmarks/bench_launch.py
+"""
+Time to first interaction for each launcher mode (python jimbruz.py <mode>).
+Run: python benchmarks/bench_launch.py [--modes cli sprite ...] [--runs 5]
+ - ready: process spawn -> prompt shown / window with the pet on screen
+ - warm:  process spawn -> background warm-up done (OpenAI client, recall index)
+ - eager: importing everything up front, as the entry points used to
+Fails (exit 1) if a mode's median time to first interaction is over its target.
+Runs in a temporary directory with the assets linked in (real data/ untouched).
+"""
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+import subprocess
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.abspath(os.path.join(HERE, ".."))
+LAUNCHER = os.path.join(ROOT, "jimbruz.py")
+
+TARGET_MS = {"cli": 150, "overlay": 400, "sprite": 600, "pygame": 600}
+WARMS = {"cli", "overlay"}  # modes with a background warm-up
+
+
+def milestone(mode, at, cwd, env):
+    """ms from spawn to `at` in a fresh `jimbruz.py mode`, or None if it never got there."""
+    env = dict(env, JIMBRUZ_STARTUP_EXIT=at)
+    started = time.time()
+    # stdin stays open (the cli would quit on EOF) until the milestone is reached
+    proc = subprocess.Popen([sys.executable, LAUNCHER, mode], cwd=cwd, env=env, stdin=subprocess.PIPE,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    try:
+        for line in proc.stderr:
+            parts = line.split()
+            if parts[:2] == ["jimbruz-startup", at]:
+                return (float(parts[3]) - started) * 1000
+        return None
+    finally:
+        proc.kill()
+        proc.wait()
+        proc.stdin.close()
+        proc.stderr.close()
+
+
+def eager(mode, cwd, env):
+    from jimbruz import MODES, DEFERRED
+    code = "; ".join(f"import {m}" for m in MODES[mode] + DEFERRED.get(mode, []))
+    started = time.time()
+    proc = subprocess.run([sys.executable, "-c", code], cwd=cwd, env=env, capture_output=True)
+    return (time.time() - started) * 1000 if proc.returncode == 0 else None
+
+
+def median(xs):
+    xs = sorted(x for x in xs if x is not None)
+    return xs[len(xs) // 2] if xs else None
+
+
+def fmt(ms):
+    return f"{ms:8.1f}" if ms is not None else f"{'-':>8}"
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--modes", nargs="+", default=list(TARGET_MS), choices=list(TARGET_MS))
+    ap.add_argument("--runs", type=int, default=5)
+    args = ap.parse_args()
+
+    sys.path.insert(0, ROOT)
+    env = dict(os.environ, PYTHONPATH=ROOT, QT_QPA_PLATFORM="offscreen", SDL_VIDEODRIVER="dummy",
+               OPENAI_API_KEY=os.getenv("OPENAI_API_KEY") or "local",
+               OPENAI_BASE_URL=os.getenv("OPENAI_BASE_URL") or "http://127.0.0.1:9/v1")
+    failed = []
+    with tempfile.TemporaryDirectory(prefix="jimbruz-launch-") as tmp:
+        os.symlink(os.path.join(ROOT, "assets"), os.path.join(tmp, "assets"))
+        subprocess.run([sys.executable, "-c", "from jimbruz_spritecache import ensure_cache; ensure_cache()"],
+                       cwd=tmp, env=env, capture_output=True)  # built outside the timed runs
+        print(f"{'mode':>8} | {'ready ms':>8} {'target':>6} | {'warm ms':>8} | {'eager ms':>8}")
+        for mode in args.modes:
+            ready = median(milestone(mode, "ready", tmp, env) for _ in range(args.runs))
+            if ready is None:
+                print(f"{mode:>8} | skipped (no display / missing dependency)")
+                continue
+            warm = median(milestone(mode, "warm", tmp, env) for _ in range(args.runs)) if mode in WARMS else None
+            full = median(eager(mode, tmp, env) for _ in range(args.runs))
+            ok = ready <= TARGET_MS[mode]
+            print(f"{mode:>8} | {fmt(ready)} {TARGET_MS[mode]:6d} | {fmt(warm)} | {fmt(full)}"
+                  + ("" if ok else "  OVER TARGET"))
+            if not ok:
+                failed.append(mode)
+    if failed:
+        print(f"time to first interaction over target: {', '.join(failed)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+# benchmarks/bench_memstore.py
+"""
+Memory store query latency: SQLite (jimbruz_memdb) vs the JSONL journal.
+Run: python benchmarks/bench_memstore.py [entries ...]   (default: 1000000)
+ - build: write the store from scratch (SQLite includes the trigram FTS5 index)
+ - tail / since: what state replay and the prompt use
+ - recent page / between / search: the `memories` command, 20 rows a page
+ - count: the whole table (SQLite) vs parsing every line (JSONL)
+Median of a few runs per query; the JSONL journal is skipped past --jsonl-max.
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import tempfile
+import statistics
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from jimbruz_memory import MemoryJournal, memories_command
+from jimbruz_memdb import SQLiteMemoryStore
+
+EVENTS = ["Accepted food. Energy->7, Trust->3", "Refused food (too shy).", "Slept; energy restored.",
+          "Played together. Happiness increased.", "Tried to play but it hid."]
+WORDS = ("snow frost tea garden mountain river friend sister cat winter blanket music book "
+         "birthday lichen cave storm quiet stars moon tired happy sad coffee walk").split()
+PAGE = 20
+T0 = 1.7e9
+
+
+def synthetic(n, seed=7):
+    rng = random.Random(seed)
+    for i in range(n):
+        r = rng.random()
+        if r < 0.6:
+            note = rng.choice(EVENTS)
+        elif r < 0.85:
+            note = f"Asked: {' '.join(rng.sample(WORDS, 4))} -> {' '.join(rng.sample(WORDS, 8))}"
+        else:
+            note = "I " + " ".join(rng.sample(WORDS, 6))
+        yield {"time": T0 + i * 30, "note": note}  # one memory every 30 s
+
+
+def build_jsonl(path, n):
+    with open(path, "w", encoding="utf8") as f:
+        for m in synthetic(n):
+            f.write(json.dumps(m) + "\n")
+    return MemoryJournal(path, commit_interval=0)
+
+
+def build_sqlite(path, n):
+    store = SQLiteMemoryStore(path, batch_size=10000, commit_interval=60)
+    with store.group():
+        for m in synthetic(n):
+            store.append(m["note"], m["time"])
+    return store
+
+
+def timed(fn, runs):
+    samples = []
+    for _ in range(runs):
+        t = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t)
+    return statistics.median(samples) * 1000
+
+
+def queries(store, n):
+    end = T0 + n * 30
+    mid = T0 + n * 15
+    return [
+        ("tail 6", lambda: store.tail(6)),
+        ("since last hour", lambda: store.since(end - 3600)),
+        ("recent page 1", lambda: list(store.recent(PAGE))),
+        ("recent page 500", lambda: list(store.recent(PAGE, PAGE * 499))),
+        ("between 1 day", lambda: list(store.between(mid, mid + 86400, PAGE))),
+        ("search 1 word", lambda: list(store.search("lichen", PAGE))),
+        ("search 2 words p10", lambda: list(store.search("sister birthday", PAGE, PAGE * 9))),
+        ("search no match", lambda: list(store.search("zebra", PAGE))),
+        ("memories command", lambda: list(memories_command(store, "search snow", PAGE))),
+        ("count", lambda: store.count()),
+    ]
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("entries", type=int, nargs="*", default=[1000000])
+    ap.add_argument("--runs", type=int, default=5)
+    ap.add_argument("--jsonl-max", type=int, default=1000000, help="skip the JSONL journal above this size")
+    args = ap.parse_args()
+
+    for n in args.entries:
+        with tempfile.TemporaryDirectory() as tmp:
+            stores = {}
+            t = time.perf_counter()
+            stores["sqlite"] = build_sqlite(os.path.join(tmp, "memories.db"), n)
+            build = {"sqlite": time.perf_counter() - t}
+            if n <= args.jsonl_max:
+                t = time.perf_counter()
+                stores["jsonl"] = build_jsonl(os.path.join(tmp, "memories.jsonl"), n)
+                build["jsonl"] = time.perf_counter() - t
+            names = list(stores)
+
+            print(f"\n{n} memories")
+            print(f"{'':>20} | " + " ".join(f"{name + ' ms':>11}" for name in names))
+            print(f"{'build (s)':>20} | " + " ".join(f"{build[name]:11.1f}" for name in names))
+            sizes = {"sqlite": os.path.getsize(stores["sqlite"].path)}
+            if "jsonl" in stores:
+                sizes["jsonl"] = os.path.getsize(stores["jsonl"].path)
+            print(f"{'size (MB)':>20} | " + " ".join(f"{sizes[name] / 1e6:11.1f}" for name in names))
+            results = {name: queries(store, n) for name, store in stores.items()}
+            for i, (label, _) in enumerate(results["sqlite"]):
+                cells = [f"{timed(results[name][i][1], args.runs):11.2f}" for name in names]
+                print(f"{label:>20} | " + " ".join(cells))
+            stores["sqlite"].close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# benchmarks/bench_motion.py
+"""
+Pet movement: fixed pixels per tick (the old update_position) vs jimbruz_motion.Mover.
+Run: python benchmarks/bench_motion.py [--jitter 0.5] [--interval 30] [--legs 200]
+Both walk the same random legs at the same nominal speed, driven by a
+simulated move timer whose ticks are late by up to `jitter` x the interval.
+ - speed error: how far the real average speed is from the nominal one
+ - off-line px: how far the path strays from the straight line to the target
+ - native moves/s: window move() calls actually issued
+"""
+
+import os
+import sys
+import math
+import random
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from jimbruz_motion import Mover, WALK_SPEED, RUN_SPEED
+
+
+def off_line(x0, y0, x1, y1, x, y):
+    """Distance from (x, y) to the segment (x0, y0)-(x1, y1)."""
+    dx, dy = x1 - x0, y1 - y0
+    length = math.hypot(dx, dy) or 1.0
+    return abs(dy * (x - x0) - dx * (y - y0)) / length
+
+
+def legacy_leg(x, y, tx, ty, speed_px_s, ticks):
+    """The old loop: `speed` px per tick on each axis, move() every tick."""
+    step = round(speed_px_s * 0.030)  # 3 / 7 px: tuned for a 30 ms tick
+    sx, sy = x, y
+    t, moves, worst = 0.0, 0, 0.0
+    for dt in ticks:
+        t += dt
+        dx, dy = tx - x, ty - y
+        if abs(dx) < step and abs(dy) < step:
+            x, y = tx, ty
+            moves += 1
+            break
+        x += step if dx > 0 else -step if dx < 0 else 0
+        y += step if dy > 0 else -step if dy < 0 else 0
+        moves += 1  # the old code called move() on every tick
+        worst = max(worst, off_line(sx, sy, tx, ty, x, y))
+    return t, moves, worst
+
+
+def mover_leg(x, y, tx, ty, speed_px_s, ticks):
+    clock = [0.0]
+    m = Mover(x, y, clock=lambda: clock[0])
+    m.go(tx, ty, speed_px_s)
+    moves, worst = 0, 0.0
+    for dt in ticks:
+        clock[0] += dt
+        if m.step():
+            moves += 1
+            worst = max(worst, off_line(x, y, tx, ty, *m.shown))
+        if not m.moving:
+            break
+    return clock[0], moves, worst
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--jitter", type=float, default=0.5, help="max tick lateness, as a fraction of the interval")
+    ap.add_argument("--interval", type=float, default=30.0, help="move timer interval (ms)")
+    ap.add_argument("--legs", type=int, default=200)
+    ap.add_argument("--seed", type=int, default=1)
+    args = ap.parse_args()
+
+    rng = random.Random(args.seed)
+    interval = args.interval / 1000
+    legs = [(rng.randint(0, 1800), rng.randint(0, 950), rng.randint(0, 1800), rng.randint(0, 950),
+             rng.choice([WALK_SPEED, RUN_SPEED])) for _ in range(args.legs)]
+    print(f"{args.legs} legs, {args.interval:.0f} ms timer, ticks up to {args.jitter:.0%} late")
+    print(f"{'engine':>12} | {'speed err':>9} {'off-line px':>11} {'moves/s':>8} {'moves':>7}")
+    for name, run in (("fixed-step", legacy_leg), ("Mover", mover_leg)):
+        tick_rng = random.Random(args.seed + 1)  # same tick timing for both
+        err, worst, moves, seconds = [], 0.0, 0, 0.0
+        for x0, y0, x1, y1, speed in legs:
+            ticks = (interval * (1 + tick_rng.random() * args.jitter) for _ in range(10 ** 6))
+            t, n, w = run(x0, y0, x1, y1, speed, ticks)
+            dist = math.hypot(x1 - x0, y1 - y0)
+            if dist and t:
+                err.append(abs(dist / t - speed) / speed)
+            worst, moves, seconds = max(worst, w), moves + n, seconds + t
+        print(f"{name:>12} | {sum(err) / len(err):8.1%} {worst:11.1f} {moves / seconds:8.1f} {moves:7d}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+# benchmarks/bench_recall.py
+"""
+MemoryIndex build, incremental update and query latency on synthetic journals.
+Run: python benchmarks/bench_recall.py [entries ...]   (default: 10000 100000)
+"""
+
+import os
+import sys
+import time
+import random
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from jimbruz_recall import MemoryIndex
+
+EVENTS = ["Accepted food. Energy->7, Trust->3", "Refused food (too shy).", "Slept; energy restored.",
+          "Played together. Happiness increased.", "Tried to play but it hid."]
+WORDS = ("snow frost tea garden mountain river friend sister cat winter blanket music book "
+         "birthday lichen cave storm quiet stars moon tired happy sad coffee walk").split()
+QUESTIONS = ["what do you know about my sister", "do you remember my birthday",
+             "tell me about the garden", "what music do I like", "are you tired"]
+
+
+def synthetic(n, seed=7):
+    rng = random.Random(seed)
+    out = []
+    for i in range(n):
+        r = rng.random()
+        if r < 0.6:
+            note = rng.choice(EVENTS)
+        elif r < 0.85:
+            note = f"Asked: {' '.join(rng.sample(WORDS, 4))} -> {' '.join(rng.sample(WORDS, 8))}"
+        else:
+            note = "I " + " ".join(rng.sample(WORDS, 6))
+        out.append({"time": 1.7e9 + i, "note": note})
+    return out
+
+
+def pct(samples, p):
+    s = sorted(samples)
+    return s[min(len(s) - 1, int(len(s) * p))] * 1000
+
+
+def bench(n):
+    entries = synthetic(n)
+    index = MemoryIndex()
+    t = time.perf_counter()
+    index.add_many(entries)
+    build = time.perf_counter() - t
+
+    extra = synthetic(1000, seed=n)
+    t = time.perf_counter()
+    for e in extra:
+        index.add(e)
+    update_us = (time.perf_counter() - t) / len(extra) * 1e6
+
+    index.query(QUESTIONS[0], 6)  # warm the NumPy posting arrays
+    lat = []
+    for i in range(200):
+        index.add(extra[i])  # interleave writes, like ask() does
+        t = time.perf_counter()
+        index.query(QUESTIONS[i % len(QUESTIONS)], 6)
+        lat.append(time.perf_counter() - t)
+    print(f"{n:>8} entries  build {build:6.2f}s  update {update_us:6.1f} us/entry  "
+          f"query p50 {pct(lat, .5):6.2f} ms  p99 {pct(lat, .99):6.2f} ms")
+
+
+if __name__ == "__main__":
+    for n in [int(a) for a in sys.argv[1:]] or [10000, 100000]:
+        bench(n)
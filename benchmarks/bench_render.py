@@ -0,0 +1,54 @@
+# benchmarks/bench_render.py
+"""
+Per-tick CPU cost of next_frame(): scaling every tick vs the RenderCache.
+Run: python benchmarks/bench_render.py [ticks]
+(uses the offscreen Qt platform, so no display is needed)
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+os.chdir(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtWidgets import QApplication, QLabel
+from PyQt5.QtCore import Qt
+
+from jimbruz_sprites import RenderCache, FrameStats
+
+
+def main():
+    ticks = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    app = QApplication(sys.argv)
+    from jimbruz_phase3 import SPRITES, load_frames
+
+    frames = load_frames(SPRITES["idle_right"])
+    label = QLabel()
+    label.resize(128, 128)
+
+    # before: resample the 480x480 source on every tick
+    before = FrameStats(keep=ticks)
+    for i in range(ticks):
+        t = time.perf_counter()
+        label.setPixmap(frames[i % len(frames)].scaled(
+            128, 128, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        before.record(t)
+
+    # after: scale once, then only swap pixmaps
+    cache = RenderCache({"idle_right": frames})
+    after = FrameStats(keep=ticks)
+    for i in range(ticks):
+        t = time.perf_counter()
+        label.setPixmap(cache.get("idle_right", i % len(frames), 128, 128, 1.0))
+        after.record(t)
+
+    for name, stats in (("scaled every tick", before), ("render cache", after)):
+        s = stats.summary()
+        print(f"{name:18s} ticks={s['ticks']}  mean={s['mean_us']:8.1f} us  p99={s['p99_us']:8.1f} us")
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
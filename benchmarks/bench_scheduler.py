@@ -0,0 +1,87 @@
+# benchmarks/bench_scheduler.py
+"""
+Wakeups per second and CPU for the phase 3 pet: three QTimers vs PetScheduler.
+Run: python benchmarks/bench_scheduler.py [seconds-per-state]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+os.chdir(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtCore import QTimer, QEventLoop
+
+_app = None  # the QApplication, kept alive for the whole run
+
+
+def set_state(pet, state):
+    from jimbruz_motion import Mover, WALK_SPEED, RUN_SPEED
+    pet.move(0, 0)
+    pet.mover = Mover(0, 0)
+    pet.frame_index = 0
+    if state == "idle":
+        pet.current_anim = "idle_right"
+    else:
+        pet.current_anim = f"{state}_right"
+        # far enough not to arrive during the run
+        pet.mover.go(5000, 5000, WALK_SPEED if state == "walk" else RUN_SPEED)
+
+
+def run_for(seconds):
+    loop = QEventLoop()
+    QTimer.singleShot(int(seconds * 1000), loop.quit)
+    cpu0, wall0 = time.process_time(), time.perf_counter()
+    loop.exec_()
+    return time.process_time() - cpu0, time.perf_counter() - wall0
+
+
+def legacy(pet, state, seconds):
+    count = [0]
+    timers = []
+    for interval, fn in ((150, pet.next_frame), (30, pet.update_position), (4000, lambda: None)):
+        t = QTimer()
+        t.timeout.connect(lambda fn=fn: (count.__setitem__(0, count[0] + 1), fn()))
+        t.start(interval)
+        timers.append(t)
+    cpu, wall = run_for(seconds)
+    for t in timers:
+        t.stop()
+    return count[0] / wall, cpu / wall * 100
+
+
+def scheduled(pet, state, seconds):
+    sch = pet.scheduler
+    sch.set_enabled("anim", True)
+    pet.sync_movement()
+    before = sch.wakeups
+    cpu, wall = run_for(seconds)
+    sch.set_enabled("anim", False)
+    sch.set_enabled("move", False)
+    return (sch.wakeups - before) / wall, cpu / wall * 100
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 3.0
+    global _app
+    _app = QApplication(sys.argv)
+    from jimbruz_phase3 import Jimbruz
+    pet = Jimbruz()
+    pet.show()
+    for name in ("anim", "move", "behavior", "power"):
+        pet.scheduler.set_enabled(name, False)  # keep the state fixed while measuring
+
+    for state in ("idle", "walk", "run"):
+        set_state(pet, state)
+        w_old, c_old = legacy(pet, state, seconds)
+        set_state(pet, state)
+        w_new, c_new = scheduled(pet, state, seconds)
+        print(f"{state:5s} three timers: {w_old:6.1f} wakeups/s {c_old:5.1f}% CPU | "
+              f"scheduler: {w_new:6.1f} wakeups/s {c_new:5.1f}% CPU")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+# benchmarks/bench_sprite_load.py
+"""
+Sprite loading straight from the PNGs: serial vs the parallel decoders.
+Run: python benchmarks/bench_sprite_load.py [--workers 1 2 4 ...] [--cases qt pygame cache-build]
+ - qt:          QImage decode on the pool, QPixmap conversion on the GUI thread
+ - pygame:      pygame.image.load on the pool, convert_alpha() on the main thread
+ - cache-build: jimbruz_spritecache.build_cache() (decode + downscale every frame)
+ - first ms: the idle_right animation ready (what the pet needs to appear)
+ - total ms: every animation ready; speedup is against 1 worker
+Each run is a fresh interpreter, so no decoded frame is shared between runs.
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import subprocess
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.abspath(os.path.join(HERE, ".."))
+CASES = ["qt", "pygame", "cache-build"]
+FIRST = "Right - Idle"
+_app = None  # the QApplication, kept alive for the whole run
+
+
+def run_child(case, workers):
+    sys.path.insert(0, ROOT)
+    os.chdir(ROOT)
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    from jimbruz_spritecache import ASSETS_PATH, png_paths, decode_all, build_cache
+    folders = [FIRST] + sorted(f for f in os.listdir(ASSETS_PATH) if f != FIRST)
+    paths = {f: png_paths(os.path.join(ASSETS_PATH, f)) for f in folders}
+    frames = sum(len(p) for p in paths.values())
+
+    if case == "qt":
+        from PyQt5.QtWidgets import QApplication
+        from PyQt5.QtGui import QImage, QPixmap
+        global _app
+        _app = QApplication([])
+        load, finish = QImage, QPixmap.fromImage
+    elif case == "pygame":
+        import pygame
+        pygame.init()
+        pygame.display.set_mode((800, 600))
+        load, finish = pygame.image.load, lambda s: s.convert_alpha()
+    else:
+        with tempfile.TemporaryDirectory() as tmp:
+            t = time.perf_counter()
+            build_cache(out=os.path.join(tmp, "sprites.bin"), workers=workers)
+            total = time.perf_counter() - t
+        return {"first": None, "total": total * 1000, "frames": frames}
+
+    t = time.perf_counter()
+    first = None
+    for folder in folders:
+        out = [finish(img) for img in decode_all(load, paths[folder], workers)]
+        assert len(out) == len(paths[folder])
+        if first is None:
+            first = time.perf_counter() - t
+    total = time.perf_counter() - t
+    return {"first": first * 1000, "total": total * 1000, "frames": frames}
+
+
+def main():
+    cpus = os.cpu_count() or 1
+    default = sorted({1, 2, 4, 8, cpus} & set(range(1, cpus + 1))) or [1]
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--workers", type=int, nargs="+", default=default)
+    ap.add_argument("--cases", nargs="+", default=CASES, choices=CASES)
+    ap.add_argument("--runs", type=int, default=3, help="best of N per point")
+    args = ap.parse_args()
+    if 1 not in args.workers:
+        args.workers = [1] + args.workers
+
+    print(f"{cpus} CPU(s)")
+    print(f"{'case':>12} {'workers':>7} | {'first ms':>9} {'total ms':>9} {'frames/s':>9} {'speedup':>7}")
+    for case in args.cases:
+        serial = None
+        for workers in sorted(args.workers):
+            best = None
+            for _ in range(args.runs):
+                out = subprocess.run([sys.executable, os.path.abspath(__file__), "--child", case, str(workers)],
+                                     capture_output=True, text=True)
+                if out.returncode != 0:
+                    break
+                r = json.loads(out.stdout.strip().splitlines()[-1])
+                if best is None or r["total"] < best["total"]:
+                    best = r
+            if best is None:
+                print(f"{case:>12} {workers:7d} | skipped (missing dependency)")
+                break
+            serial = serial or best["total"]
+            first = f"{best['first']:9.1f}" if best["first"] is not None else f"{'-':>9}"
+            print(f"{case:>12} {workers:7d} | {first} {best['total']:9.1f} "
+                  f"{best['frames'] / best['total'] * 1000:9.0f} {serial / best['total']:6.2f}x")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 4 and sys.argv[1] == "--child":
+        print(json.dumps(run_child(sys.argv[2], int(sys.argv[3]))))
+    else:
+        main()
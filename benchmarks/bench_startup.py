@@ -0,0 +1,74 @@
+# benchmarks/bench_startup.py
+"""
+Cold-start time to the first frame: decoding PNGs vs the mmap'd sprite cache.
+Run: python benchmarks/bench_startup.py
+Each case runs in a fresh interpreter so nothing is shared between them.
+"""
+
+import os
+import sys
+import time
+import subprocess
+
+T0 = time.perf_counter()
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+CASES = ["qt-png", "qt-cache", "pygame-png", "pygame-cache"]
+_app = None  # the QApplication, kept alive for the whole run
+
+
+def run_case(case):
+    sys.path.insert(0, ROOT)
+    os.chdir(ROOT)
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    folders = ["Right - Idle", "Left - Idle", "Right - Walking", "Left - Walking",
+               "Right - Running", "Left - Running"]
+    paths = [os.path.join("assets/jimbruz", f) for f in folders]
+
+    if case.startswith("qt"):
+        from PyQt5.QtWidgets import QApplication
+        from PyQt5.QtGui import QPixmap
+        global _app
+        _app = QApplication([])
+        if case == "qt-png":
+            anims = [[QPixmap(os.path.join(p, f)) for f in sorted(os.listdir(p)) if f.endswith(".png")]
+                     for p in paths]
+        else:
+            from jimbruz_spritecache import cached_qt_frames
+            anims = [cached_qt_frames(p) for p in paths]
+        first = anims[0][0]
+    else:
+        import pygame
+        pygame.init()
+        pygame.display.set_mode((800, 600))
+        if case == "pygame-png":
+            anims = [[pygame.image.load(os.path.join(p, f)).convert_alpha()
+                      for f in sorted(os.listdir(p)) if f.endswith(".png")] for p in paths]
+        else:
+            from jimbruz_spritecache import cached_pygame_frames
+            anims = [cached_pygame_frames(p) for p in paths]
+        first = anims[0][0]
+    assert first is not None
+    print(f"{time.perf_counter() - T0:.4f}")
+
+
+def main():
+    sys.path.insert(0, ROOT)
+    os.chdir(ROOT)
+    from jimbruz_spritecache import ensure_cache
+    ensure_cache()  # build outside the timed runs
+    for case in CASES:
+        try:
+            out = subprocess.run([sys.executable, os.path.abspath(__file__), "--run", case],
+                                 capture_output=True, text=True, check=True).stdout.split()
+            print(f"{case:14s} time to first frame: {float(out[-1]) * 1000:7.1f} ms")
+        except Exception as e:
+            print(f"{case:14s} skipped ({e.__class__.__name__})")
+
+
+if __name__ == "__main__":
+    if "--run" in sys.argv:
+        run_case(sys.argv[sys.argv.index("--run") + 1])
+    else:
+        main()
@@ -0,0 +1,85 @@
+# jimbruz.py
+"""
+Jimbruz launcher - one entry point for every front end
+Run: python jimbruz.py <mode> [mode options]
+ - cli      text pet (jimbruz_core; --batch FILE for scripted runs)
+ - overlay  floating Tk window with voice (jimbruz_phase6)
+ - sprite   animated desktop pet (jimbruz_phase4; --pets N for a herd, --canvas
+            to paint them on one transparent window instead of moving windows)
+ - pygame   sprite viewer window (main.py; --fps for the frame-time overlay)
+Only the chosen front end is imported; heavy clients (openai, numpy, TTS)
+load on first use or warm up in the background once the window / prompt is up.
+ - python jimbruz.py --import-report [mode ...]   import time per package
+ - JIMBRUZ_STARTUP_TRACE=1 prints startup milestones (see jimbruz_startup.py)
+"""
+
+import os
+import sys
+import argparse
+
+import jimbruz_startup  # noqa: F401  (first, so startup milestones count from here)
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# mode -> modules imported before the first interaction
+MODES = {
+    "cli": ["jimbruz_core"],
+    "overlay": ["jimbruz_phase6"],
+    "sprite": ["jimbruz_phase4"],
+    "pygame": ["pygame", "jimbruz_spritecache"],
+}
+# loaded on first use or by the background warm-up, not at startup
+DEFERRED = {
+    "cli": ["dotenv", "openai", "jimbruz_recall"],
+    "overlay": ["openai", "jimbruz_recall", "pyttsx3"],
+}
+
+
+def run_cli(argv):
+    import jimbruz_core
+    return jimbruz_core.main(argv)
+
+def run_overlay(argv):
+    import jimbruz_phase6
+    return jimbruz_phase6.main()
+
+def run_sprite(argv):
+    import jimbruz_phase4
+    return jimbruz_phase4.main(argv)
+
+def run_pygame(argv):
+    import runpy
+    sys.argv = [os.path.join(HERE, "main.py")] + argv
+    runpy.run_path(sys.argv[0], run_name="__main__")
+
+RUNNERS = {"cli": run_cli, "overlay": run_overlay, "sprite": run_sprite, "pygame": run_pygame}
+
+
+def import_report(modes):
+    from jimbruz_startup import import_report as report
+    for mode in modes:
+        print(f"[{mode}] before first interaction")
+        report(MODES[mode])
+        if mode in DEFERRED:
+            print(f"[{mode}] deferred to first use / warm-up")
+            report(DEFERRED[mode], top=6)
+        print()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="jimbruz", description="Jimbruz, the introverted Snow Beast")
+    parser.add_argument("mode", nargs="?", choices=list(RUNNERS))
+    parser.add_argument("--import-report", nargs="*", choices=list(MODES), metavar="MODE",
+                        help="show import time per package for MODE(s) (all if none given)")
+    args, rest = parser.parse_known_args(argv)
+    if args.import_report is not None:
+        import_report(args.import_report or ([args.mode] if args.mode else list(MODES)))
+        return 0
+    if args.mode is None:
+        parser.print_help()
+        return 2
+    return RUNNERS[args.mode](rest)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,161 @@
+# jimbruz_ask.py
+"""
+Streaming ask pipeline shared by the core CLI and the phase 6 overlay
+ - Replies arrive token by token from a streaming generator
+ - Starting a new question cancels the one still in flight
+ - Sentence boundaries are reported so speech can start early
+ - Time-to-first-token and total latency are recorded per request
+"""
+
+import re
+import time
+import threading
+from collections import deque
+
+_SENTENCE_END = re.compile(r"[.!?…]+[\"')\]]*(\s+|$)")
+
+
+def split_sentence(text):
+    """(first complete sentence, rest) or (None, text) if no boundary yet."""
+    m = _SENTENCE_END.search(text)
+    if not m or m.end() == len(text) and not m.group(1):
+        return None, text
+    return text[:m.end()].strip(), text[m.end():]
+
+
+def openai_deltas(stream):
+    """Text deltas from a streamed chat completion (new client objects or legacy dicts)."""
+    try:
+        for chunk in stream:
+            choices = chunk["choices"] if isinstance(chunk, dict) else chunk.choices
+            if not choices:
+                continue
+            delta = choices[0]["delta"] if isinstance(choices[0], dict) else choices[0].delta
+            content = delta.get("content") if isinstance(delta, dict) else delta.content
+            if content:
+                yield content
+    finally:
+        close = getattr(stream, "close", None)
+        if close:
+            close()
+
+
+class AskRequest:
+    _ids = 0
+
+    def __init__(self, prompt):
+        AskRequest._ids += 1
+        self.id = AskRequest._ids
+        self.prompt = prompt
+        self.text = ""
+        self.source = None      # "openai" / "fallback", set by whoever produced it
+        self.started = time.perf_counter()
+        self.ttft = None        # seconds to the first token
+        self.total = None       # seconds to the last token
+        self.done = False
+        self._cancel = threading.Event()
+
+    def cancel(self):
+        self._cancel.set()
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    def add(self, delta):
+        if self.ttft is None:
+            self.ttft = time.perf_counter() - self.started
+        self.text += delta
+
+    def finish(self):
+        self.total = time.perf_counter() - self.started
+        self.done = True
+
+    def timing_fields(self):
+        """Latency fields for the session log (milliseconds)."""
+        return {
+            "ttft_ms": round(self.ttft * 1000) if self.ttft is not None else None,
+            "total_ms": round(self.total * 1000) if self.total is not None else None,
+        }
+
+def consume_stream(request, stream, on_token=None, on_sentence=None):
+    """
+    Drain `stream` (an iterator of text deltas) into `request`, stopping early
+    if it is cancelled. Calls on_token(delta) per delta and on_sentence(s)
+    for each completed sentence (the unterminated tail is flushed at the end).
+    """
+    pending = ""
+    try:
+        for delta in stream:
+            if request.cancelled:
+                break
+            if not delta:
+                continue
+            request.add(delta)
+            if on_token:
+                on_token(delta)
+            if on_sentence:
+                pending += delta
+                sentence, pending = split_sentence(pending)
+                while sentence:
+                    on_sentence(sentence)
+                    sentence, pending = split_sentence(pending)
+    finally:
+        close = getattr(stream, "close", None)
+        if close:
+            try:
+                close()  # drop the HTTP response if we stopped early
+            except Exception:
+                pass
+    if on_sentence and pending.strip() and not request.cancelled:
+        on_sentence(pending.strip())
+    request.finish()
+    return request
+
+
+class AskPipeline:
+    """Runs one ask at a time on a worker thread; a newer ask cancels the older."""
+
+    def __init__(self, keep=100):
+        self.current = None
+        self.history = deque(maxlen=keep)  # finished AskRequests, for latency stats
+        self._lock = threading.Lock()
+
+    def submit(self, prompt, run, on_done=None):
+        """
+        Start `run(request)` in the background. `run` fills the request (e.g.
+        via consume_stream) and returns the final reply; on_done(request, reply)
+        is called only if the request was not superseded.
+        """
+        request = AskRequest(prompt)
+        with self._lock:
+            if self.current is not None:
+                self.current.cancel()
+            self.current = request
+
+        def work():
+            reply = run(request)
+            if not request.done:
+                request.finish()
+            self.history.append(request)
+            if not request.cancelled and on_done:
+                on_done(request, reply)
+        threading.Thread(target=work, daemon=True).start()
+        return request
+
+    def cancel(self):
+        with self._lock:
+            if self.current is not None:
+                self.current.cancel()
+
+    def latency_summary(self):
+        done = [r for r in self.history if r.ttft is not None and not r.cancelled]
+        if not done:
+            return {"requests": 0}
+        ttft = sorted(r.ttft for r in done)
+        total = sorted(r.total for r in done)
+        return {
+            "requests": len(done),
+            "ttft_p50_ms": ttft[len(ttft) // 2] * 1000,
+            "total_p50_ms": total[len(total) // 2] * 1000,
+        }
@@ -1,74 +1,118 @@
 # jimbruz_core.py
 """
 Jimbruz Phase 1 - core logic (text-based)
-Run: python jimbruz_core.py
+Run: python jimbruz_core.py  (or: python jimbruz.py cli)
 Features:
  - Introverted Snow Beast persona
  - Energy / Happiness / Trust stats
- - Persisted memories (memories.json)
+ - Persisted memories (data/memories.db, SQLite; searchable and paged)
  - Optional OpenAI replies if OPENAI_API_KEY is set
  - Commands: feed, play, sleep, ask <question>, status, memories, help, quit
+ - Batch mode: python jimbruz_core.py --batch [file]  (stdin if no file)
 """
 
+import io
 import os
-import time
+import sys
 import json
+import time
 import random
+import argparse
+import threading
+import contextlib
 from pathlib import Path
 
-# optional libs
-try:
-    from dotenv import load_dotenv
-    load_dotenv()
-except Exception:
-    pass
+from jimbruz_memory import open_journal, memories_command
+from jimbruz_log import open_logger, LOW, NORMAL
+from jimbruz_ask import AskRequest, consume_stream, openai_deltas
+from jimbruz_replycache import open_reply_cache
+from jimbruz_prompt import build_prompt
+from jimbruz_state import open_state_store, restore
+from jimbruz_startup import LazyImport, warm_up as _warm_up, mark
+
+# optional libs, imported on first use so the prompt appears without waiting:
+# numpy (recall index) on the first question, dotenv + openai in openai_ready()
+_recall = LazyImport("jimbruz_recall", "index_for")
 
-OPENAI_KEY = os.getenv("OPENAI_API_KEY") or None
+OPENAI_KEY = None       # read by openai_ready(), after .env is loaded
+# e.g. http://127.0.0.1:8808/v1 for the local stand-in (jimbruz_fakeapi.py)
+OPENAI_BASE_URL = None
+MODEL = "gpt-4o-mini"
+SYSTEM_PROMPT = ("You are Jimbruz: a shy, wise, slightly scary-looking Snow Beast who is kind and gentle. "
+                 "Keep answers short, calm, and a little wry.")
 
+def _messages(prompt):
+    return [
+        {"role": "system", "content": SYSTEM_PROMPT},
+        {"role": "user", "content": prompt}
+    ]
+
+_PENDING = object()
+client = _PENDING       # new-style client, None if unavailable (benchmarks may preset it)
+_legacy_openai = None   # the openai module itself, for clients older than 1.0
 USE_OPENAI = False
-if OPENAI_KEY:
-    try:
-        # Try new-style client first, then fallback
-        try:
-            from openai import OpenAI as _OpenAIClient
-            client = _OpenAIClient(api_key=OPENAI_KEY)
-            def ask_openai(prompt: str) -> str:
-                try:
-                    resp = client.chat.completions.create(
-                        model="gpt-4o-mini",
-                        messages=[
-                            {"role": "system",
-                             "content": "You are Jimbruz: a shy, wise, slightly scary-looking Snow Beast who is kind and gentle. Keep answers short, calm, and a little wry."},
-                            {"role": "user", "content": prompt}
-                        ],
-                        temperature=0.85,
-                        max_tokens=200
-                    )
-                    return resp.choices[0].message.content.strip()
-                except Exception:
-                    return None
-            USE_OPENAI = True
-        except Exception:
-            import openai
-            openai.api_key = OPENAI_KEY
-            def ask_openai(prompt: str) -> str:
+_openai_lock = threading.Lock()
+
+def openai_ready():
+    """Load .env and set up the OpenAI client on the first call; True if asks can use it."""
+    global client, _legacy_openai, USE_OPENAI, OPENAI_KEY, OPENAI_BASE_URL
+    if client is _PENDING:
+        with _openai_lock:
+            if client is _PENDING:
                 try:
-                    resp = openai.ChatCompletion.create(
-                        model="gpt-4o-mini",
-                        messages=[
-                            {"role": "system",
-                             "content": "You are Jimbruz: a shy, wise, slightly scary-looking Snow Beast who is kind and gentle. Keep answers short, calm, and a little wry."},
-                            {"role": "user", "content": prompt}
-                        ],
-                        temperature=0.85,
-                        max_tokens=200
-                    )
-                    return resp['choices'][0]['message']['content'].strip()
+                    from dotenv import load_dotenv
+                    load_dotenv()
                 except Exception:
-                    return None
-            USE_OPENAI = True
+                    pass
+                OPENAI_KEY = os.getenv("OPENAI_API_KEY") or None
+                OPENAI_BASE_URL = os.getenv("OPENAI_BASE_URL") or os.getenv("OPENAI_API_BASE") or None
+                new_client = None
+                if OPENAI_KEY:
+                    # Try new-style client first, then fallback
+                    try:
+                        from openai import OpenAI as _OpenAIClient
+                        new_client = _OpenAIClient(api_key=OPENAI_KEY, base_url=OPENAI_BASE_URL)
+                    except Exception:
+                        try:
+                            import openai
+                            openai.api_key = OPENAI_KEY
+                            if OPENAI_BASE_URL:
+                                openai.api_base = OPENAI_BASE_URL
+                            _legacy_openai = openai
+                        except Exception:
+                            pass
+                client = new_client
+    USE_OPENAI = client is not None or _legacy_openai is not None
+    return USE_OPENAI
+
+def _create(prompt, **kwargs):
+    params = dict(model=MODEL, messages=_messages(prompt), temperature=0.85, max_tokens=200, **kwargs)
+    if client is not None:
+        return client.chat.completions.create(**params)
+    return _legacy_openai.ChatCompletion.create(**params)
+
+def ask_openai(prompt: str) -> str:
+    if not openai_ready():
+        return None
+    try:
+        resp = _create(prompt)
+        if client is not None:
+            return resp.choices[0].message.content.strip()
+        return resp['choices'][0]['message']['content'].strip()
     except Exception:
-        USE_OPENAI = False
+        return None
+
+def stream_openai(prompt: str):
+    # yields text deltas as they arrive; errors propagate to the caller
+    return openai_deltas(_create(prompt, stream=True))
+
+def warm_up():
+    """Set up the OpenAI client, reply cache and recall index in the background."""
+    def build_index():
+        index_for = _recall.get()
+        if index_for:
+            index_for(journal)
+    return _warm_up(openai_ready, open_reply_cache, build_index)
 
 
 # local fallback reply behavior
@@ -94,37 +138,69 @@ def fallback_reply(prompt: str) -> str:
 # persistence
 DATA_DIR = Path("data")
 DATA_DIR.mkdir(exist_ok=True)
-MEMORY_FILE = DATA_DIR / "memories.json"
+MEMORY_FILE = DATA_DIR / "memories.jsonl"
+LEGACY_MEMORY_FILE = DATA_DIR / "memories.json"  # migrated on first run
 LOG_FILE = DATA_DIR / "session.log"
+journal = open_journal(MEMORY_FILE, LEGACY_MEMORY_FILE)
+logger = open_logger(LOG_FILE)
 
 def load_memories():
-    if MEMORY_FILE.exists():
+    try:
+        return journal.load_all()
+    except Exception:
+        return []
+
+def recent_memories(n):
+    try:
+        return journal.tail(n)
+    except Exception:
+        return []
+
+def relevant_memories(prompt, n):
+    # the n memories most related to prompt (oldest first), else the latest n
+    found = []
+    index_for = _recall.get()
+    if index_for:
         try:
-            return json.loads(MEMORY_FILE.read_text(encoding="utf8"))
+            found = index_for(journal).query(prompt, n)
         except Exception:
-            return []
-    return []
+            found = []
+    if not found:
+        return recent_memories(n)
+    return sorted(found, key=lambda m: m["time"])
 
 def save_memory(mem):
-    memories = load_memories()
-    memories.append({"time": time.time(), "note": mem})
-    MEMORY_FILE.write_text(json.dumps(memories, indent=2), encoding="utf8")
+    journal.append(mem)
 
-def log(msg):
-    t = time.strftime("%Y-%m-%d %H:%M:%S")
-    with open(LOG_FILE, "a", encoding="utf8") as f:
-        f.write(f"[{t}] {msg}\n")
+def log(event, priority=NORMAL, **fields):
+    # only queues the line; a background thread writes session.log in batches
+    logger.log(event, priority, **fields)
 
 
+def log_compaction(report):
+    if report["compacted"]:
+        log("compact", LOW, entries=report["compacted"], written=report["written"],
+            bytes_reclaimed=report["bytes_reclaimed"])
+
 # Pet model
 class Jimbruz:
-    def __init__(self, name="Jimbruz", species="Snow Beast"):
+    def __init__(self, name="Jimbruz", species="Snow Beast", state=None):
         self.name = name
         self.species = species
         self.energy = 5     # 0..10
         self.happiness = 3  # 0..10
         self.trust = 1      # 0..10 (introvert -> starts low)
         self.last_interaction = time.time()
+        self.last_request = None  # AskRequest of the latest OpenAI reply (timings)
+        self.last_prompt = None   # BuiltPrompt of the latest ask (token counts)
+        self.state = state  # StateStore; stats persist across launches when set
+        if state is not None:
+            restore(self, state, journal)
+
+    def _log(self, event, **fields):
+        if self.state is not None:
+            self.state.update(self.energy, self.happiness, self.trust)
+        log(event, energy=self.energy, happiness=self.happiness, trust=self.trust, **fields)
 
     def _clamp_stats(self):
         self.energy = max(0, min(10, self.energy))
@@ -156,7 +232,7 @@ class Jimbruz:
             self.trust -= 0.2
             save_memory("Refused food (too shy).")
         self._clamp_stats()
-        log("feed")
+        self._log("feed")
 
     def play(self):
         print("You attempt to play with Jimbruz...")
@@ -174,7 +250,7 @@ class Jimbruz:
             self.trust += 0.7
             save_memory("Played together. Happiness increased.")
         self._clamp_stats()
-        log("play")
+        self._log("play")
 
     def sleep(self):
         print(f"{self.name} curls up in a drift and sleeps quietly...")
@@ -182,7 +258,7 @@ class Jimbruz:
         self.happiness += 0.5
         self._clamp_stats()
         save_memory("Slept; energy restored.")
-        log("sleep")
+        self._log("sleep")
 
     def pet_status(self):
         print(self.status_str())
@@ -190,32 +266,54 @@ class Jimbruz:
     def remember(self, note: str):
         save_memory(note)
         print("Jimbruz tilts its head and seems to store that memory.")
-        log(f"remember: {note}")
+        self._log("remember", note=note)
 
-    def ask(self, prompt: str) -> str:
+    def ask(self, prompt: str, on_token=None) -> str:
         # Use OpenAI if available, else fallback
         # We send small context about personality
         system_context = f"You are Jimbruz, a shy but kind Snow Beast. Short, calm, slightly wry replies."
+        if self.last_request is not None:
+            self.last_request.cancel()  # a newer question supersedes one still streaming
         # Include last few memories as context optionally
         try:
-            memories = load_memories()[-6:]
-            mem_summary = " Recent memories: " + " | ".join([m["note"] for m in memories]) if memories else ""
+            notes = [m["note"] for m in relevant_memories(prompt, 6)]
         except Exception:
-            mem_summary = ""
-        full_prompt = prompt + mem_summary
-        if USE_OPENAI:
+            notes = []
+        # deduped, ranked and cut to the input token budget
+        built = build_prompt(prompt, notes, SYSTEM_PROMPT)
+        self.last_prompt = built
+        full_prompt = built.text
+        if openai_ready():
+            # repeated questions are answered from the on-disk reply cache
+            cache = open_reply_cache()
+            key = cache.key(prompt, MODEL, SYSTEM_PROMPT, built.notes) if cache else None
+            out = cache.get(key) if cache else None
+            if out:
+                if on_token:
+                    on_token(out)
+                save_memory(f"Asked: {prompt} -> {out}")
+                self._log("ask", source="cache")
+                return out
+            # streamed, so on_token can show the reply while it is generated
+            request = AskRequest(prompt)
+            self.last_request = request
             try:
-                out = ask_openai(full_prompt)
-                if out:
-                    save_memory(f"Asked: {prompt} -> {out}")
-                    log("ask (openai)")
-                    return out
+                consume_stream(request, stream_openai(full_prompt), on_token)
             except Exception:
                 pass
+            out = request.text.strip()
+            if out:
+                if cache and request.total is not None and not request.cancelled:
+                    cache.put(key, out)  # never a reply cut short
+                save_memory(f"Asked: {prompt} -> {out}")
+                self._log("ask", source="openai", **request.timing_fields(), **built.fields())
+                return out
         # fallback
         out = fallback_reply(prompt)
+        if on_token:
+            on_token(out)
         save_memory(f"Asked: {prompt} -> {out} (fallback)")
-        log("ask (fallback)")
+        self._log("ask", source="fallback")
         return out
 
 
@@ -228,17 +326,144 @@ Commands:
   status        - Show Jimbruz's current stats
   ask <text>    - Ask Jimbruz something (e.g. ask tell me a joke)
   remember <t>  - Store a memory (Jimbruz notes it)
-  memories      - List recent memories
+  memories      - List recent memories (memories N, memories page N)
+  memories search <text>  - Memories mentioning <text>
+  memories since <date>   - Memories since YYYY-MM-DD [HH:MM], today, yesterday, 3d, 12h
   help          - Show this help
   quit          - Exit
 """)
 
 
+# ---------- commands ----------
+# verb -> handler(pet, arg); a handler returning False ends the session
+COMMANDS = {}
+
+def command(*names, needs_arg=False):
+    def register(fn):
+        fn.needs_arg = needs_arg
+        for name in names:
+            COMMANDS[name] = fn
+        return fn
+    return register
+
+@command("feed")
+def cmd_feed(pet, arg):
+    pet.feed()
+
+@command("play")
+def cmd_play(pet, arg):
+    pet.play()
+
+@command("sleep")
+def cmd_sleep(pet, arg):
+    pet.sleep()
+
+@command("status")
+def cmd_status(pet, arg):
+    pet.pet_status()
+
+@command("remember", needs_arg=True)
+def cmd_remember(pet, arg):
+    pet.remember(arg)
+
+@command("memories")
+def cmd_memories(pet, arg):
+    try:
+        for line in memories_command(journal, arg, page_size=20):
+            print(line)
+    except Exception as e:
+        print(f"Couldn't read memories: {e}")
+
+@command("ask", needs_arg=True)
+def cmd_ask(pet, arg):
+    print("Jimbruz thinks...")
+    print("Jimbruz: ", end="", flush=True)
+    pet.ask(arg, on_token=lambda delta: print(delta, end="", flush=True))
+    print()
+
+@command("help")
+def cmd_help(pet, arg):
+    print_help()
+
+@command("quit", "exit")
+def cmd_quit(pet, arg):
+    print("Jimbruz fades away into the snow. Goodbye.")
+    return False
+
+def run_command(pet, line):
+    """Dispatch one command line; returns (known verb, keep going)."""
+    parts = line.split(maxsplit=1)
+    verb = parts[0].lower()
+    arg = parts[1] if len(parts) > 1 else ""
+    handler = COMMANDS.get(verb)
+    if handler is None or (handler.needs_arg and not arg):
+        print("Unknown command. Type 'help' for available commands.")
+        return False, True
+    return True, handler(pet, arg) is not False
+
+
+# ---------- batch mode ----------
+def run_batch(pet, lines, out=None, report=None):
+    """
+    Run scripted commands: one JSON object per command on `out` (stdout)
+    ({"line", "command", "ok", "output", "ms"}) and a throughput summary on
+    `report` (stderr). Memory writes are group-committed once for the whole batch.
+    """
+    out = out or sys.stdout  # looked up per call, so a redirected stdout is honoured
+    report = report or sys.stderr
+    timings = {}
+    count = 0
+    started = time.perf_counter()
+    with journal.group():
+        for lineno, line in enumerate(lines, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            buf = io.StringIO()
+            t = time.perf_counter()
+            with contextlib.redirect_stdout(buf):
+                ok, keep_going = run_command(pet, line)
+            ms = (time.perf_counter() - t) * 1000
+            verb = line.split(maxsplit=1)[0].lower()
+            timings.setdefault(verb if ok else "?", []).append(ms)
+            count += 1
+            out.write(json.dumps({"line": lineno, "command": line, "ok": ok,
+                                  "output": buf.getvalue().rstrip("\n"), "ms": round(ms, 3)},
+                                 ensure_ascii=False) + "\n")
+            if not keep_going:
+                break
+    logger.flush()
+    elapsed = time.perf_counter() - started
+    print(f"{count} commands in {elapsed:.3f}s ({count / elapsed if elapsed else 0:.0f} commands/s)", file=report)
+    for verb, ms in sorted(timings.items()):
+        ms.sort()
+        print(f"  {verb:<10} n={len(ms):<6} mean={sum(ms) / len(ms):8.3f} ms  "
+              f"p50={ms[len(ms) // 2]:8.3f} ms  p99={ms[min(len(ms) - 1, int(len(ms) * .99))]:8.3f} ms",
+              file=report)
+    return count
+
+
 # ---------- main loop ----------
-def main():
-    pet = Jimbruz(name="Jimbruz", species="Snow Beast")
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Jimbruz, the introverted Snow Beast")
+    parser.add_argument("--batch", nargs="?", const="-", metavar="FILE",
+                        help="run commands from FILE (or stdin) and print JSON lines")
+    args = parser.parse_args(argv)
+
+    journal.compact_in_background(log_compaction)
+    pet = Jimbruz(name="Jimbruz", species="Snow Beast", state=open_state_store())
+    if args.batch:
+        if args.batch == "-":
+            run_batch(pet, sys.stdin)
+        else:
+            with open(args.batch, encoding="utf8") as f:
+                run_batch(pet, f)
+        return
+
     print("Welcome. You have summoned Jimbruz — the introverted Snow Beast.")
     print("Type 'help' to see commands.\n")
+    mark("ready")
+    warm_up()  # the first question shouldn't pay for the client / index
 
     while True:
         try:
@@ -250,39 +475,8 @@ def main():
         if not cmd:
             continue
 
-        parts = cmd.split(maxsplit=1)
-        verb = parts[0].lower()
-        arg = parts[1] if len(parts) > 1 else ""
-
-        if verb == "feed":
-            pet.feed()
-        elif verb == "play":
-            pet.play()
-        elif verb == "sleep":
-            pet.sleep()
-        elif verb == "status":
-            pet.pet_status()
-        elif verb == "remember" and arg:
-            pet.remember(arg)
-        elif verb == "memories":
-            mems = load_memories()
-            if not mems:
-                print("No memories yet.")
-            else:
-                for m in mems[-20:]:
-                    ts = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(m["time"]))
-                    print(f"- {ts}: {m['note']}")
-        elif verb == "ask" and arg:
-            print("Jimbruz thinks...")
-            answer = pet.ask(arg)
-            print(f"Jimbruz: {answer}")
-        elif verb == "help":
-            print_help()
-        elif verb in ("quit", "exit"):
-            print("Jimbruz fades away into the snow. Goodbye.")
+        if not run_command(pet, cmd)[1]:
             break
-        else:
-            print("Unknown command. Type 'help' for available commands.")
 
 if __name__ == "__main__":
 
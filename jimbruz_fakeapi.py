@@ -0,0 +1,250 @@
+# jimbruz_fakeapi.py
+"""
+Local OpenAI-compatible chat-completions stand-in (no key, no network)
+Run: python jimbruz_fakeapi.py [--port 8808] [--latency lognormal:300,0.5]
+                                [--token-delay 20] [--error-rate 0.02] [--rps 5]
+Then: OPENAI_API_KEY=local OPENAI_BASE_URL=http://127.0.0.1:8808/v1 python jimbruz_core.py
+      (jimbruz_phase6.py reads the same variables; the legacy openai<1.0
+      path in core reads the same URL as api_base)
+Features:
+ - POST /v1/chat/completions, plain JSON or server-sent-event streaming
+ - First-token latency drawn from a distribution (fixed / uniform / lognormal)
+ - Per-token delay for streamed replies
+ - Injected 500 errors at a configurable rate
+ - Token-bucket rate limit answering 429 + Retry-After beyond the allowed rps
+"""
+
+import json
+import math
+import time
+import random
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+DEFAULT_REPLY = ("Hm. The snow told me you'd ask that. "
+                 "I think quietly, but I do think of you. Sit a while.")
+
+
+def _tokens(text):
+    """Split into word-sized pieces that keep their leading space, like real deltas."""
+    out, cur = [], ""
+    for ch in text:
+        if ch == " " and cur:
+            out.append(cur)
+            cur = ""
+        cur += ch
+    if cur:
+        out.append(cur)
+    return out
+
+
+def parse_latency(spec):
+    """
+    'fixed:MS', 'uniform:LO,HI' or 'lognormal:MEDIAN,SIGMA' (milliseconds)
+    -> sampler(rng) returning seconds. A bare number means fixed.
+    """
+    kind, _, args = str(spec).partition(":")
+    if not args:
+        kind, args = "fixed", kind
+    vals = [float(v) for v in args.split(",")]
+    if kind == "fixed":
+        return lambda rng: vals[0] / 1000
+    if kind == "uniform":
+        return lambda rng: rng.uniform(vals[0], vals[1]) / 1000
+    if kind == "lognormal":
+        mu, sigma = math.log(vals[0]), vals[1] if len(vals) > 1 else 0.5
+        return lambda rng: rng.lognormvariate(mu, sigma) / 1000
+    raise ValueError(f"unknown latency distribution: {spec}")
+
+
+class FakeChatServer:
+    def __init__(self, reply=DEFAULT_REPLY, first_token_delay=0.2, token_delay=0.02,
+                 host="127.0.0.1", port=0, latency=None, error_rate=0.0, rps=None, seed=None):
+        self.reply = reply
+        self.first_token_delay = first_token_delay
+        self.token_delay = token_delay
+        self.latency = parse_latency(latency) if latency is not None else None
+        self.error_rate = error_rate
+        self.rps = rps            # None = no rate limit
+        self.requests = 0
+        self.errors = 0
+        self.rate_limited = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._tokens = float(rps or 0)
+        self._refilled = time.monotonic()
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    # ---- responses ----
+    def reply_for(self, body):
+        return self.reply
+
+    def reset_stats(self):
+        with self._lock:
+            self.requests = self.errors = self.rate_limited = 0
+            self.peak_in_flight = self.in_flight
+
+    def stats(self):
+        with self._lock:
+            return {"requests": self.requests, "errors": self.errors,
+                    "rate_limited": self.rate_limited, "peak_in_flight": self.peak_in_flight}
+
+    # ---- per-request decisions ----
+    def _admit(self):
+        """'ok', 'error' or 'limited' for a new request (token bucket + error dice)."""
+        with self._lock:
+            self.requests += 1
+            if self.rps:
+                now = time.monotonic()
+                self._tokens = min(self.rps, self._tokens + (now - self._refilled) * self.rps)
+                self._refilled = now
+                if self._tokens < 1:
+                    self.rate_limited += 1
+                    return "limited"
+                self._tokens -= 1
+            if self.error_rate and self._rng.random() < self.error_rate:
+                self.errors += 1
+                return "error"
+            return "ok"
+
+    def _first_token_delay(self):
+        if self.latency is None:
+            return self.first_token_delay
+        with self._lock:
+            return self.latency(self._rng)
+
+    def _enter(self, delta):
+        with self._lock:
+            self.in_flight += delta
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+    def _handler(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                if not self.path.rstrip("/").endswith("/chat/completions"):
+                    self._json(404, {"error": {"message": "not found", "type": "invalid_request_error"}})
+                    return
+                length = int(self.headers.get("Content-Length") or 0)
+                body = json.loads(self.rfile.read(length) or b"{}")
+                verdict = fake._admit()
+                if verdict == "limited":
+                    self._json(429, {"error": {"message": "Rate limit reached", "type": "requests",
+                                               "code": "rate_limit_exceeded"}},
+                               {"Retry-After": "1", "x-ratelimit-limit-requests": str(fake.rps)})
+                    return
+                fake._enter(1)
+                try:
+                    delay = fake._first_token_delay()
+                    if verdict == "error":
+                        time.sleep(delay)
+                        self._json(500, {"error": {"message": "The server had an error",
+                                                   "type": "server_error"}})
+                        return
+                    text = fake.reply_for(body)
+                    model = body.get("model", "gpt-4o-mini")
+                    if body.get("stream"):
+                        self._stream(model, text, delay)
+                    else:
+                        time.sleep(delay + fake.token_delay * len(_tokens(text)))
+                        self._json(200, _completion(model, text))
+                finally:
+                    fake._enter(-1)
+
+            def _json(self, code, payload, headers=None):
+                data = json.dumps(payload).encode("utf8")
+                self.send_response(code)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                for k, v in (headers or {}).items():
+                    self.send_header(k, v)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _stream(self, model, text, delay):
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Cache-Control", "no-cache")
+                self.send_header("Connection", "close")
+                self.end_headers()
+                self.close_connection = True
+                time.sleep(delay)
+                try:
+                    for i, tok in enumerate(_tokens(text)):
+                        if i:
+                            time.sleep(fake.token_delay)
+                        self._event(_chunk(model, {"content": tok}))
+                    self._event(_chunk(model, {}, "stop"))
+                    self.wfile.write(b"data: [DONE]\n\n")
+                    self.wfile.flush()
+                except (BrokenPipeError, ConnectionResetError):
+                    pass  # client cancelled mid-stream
+
+            def _event(self, payload):
+                self.wfile.write(b"data: " + json.dumps(payload).encode("utf8") + b"\n\n")
+                self.wfile.flush()
+
+        return Handler
+
+
+def _completion(model, text):
+    return {
+        "id": "chatcmpl-local", "object": "chat.completion", "created": int(time.time()),
+        "model": model,
+        "choices": [{"index": 0, "message": {"role": "assistant", "content": text},
+                     "finish_reason": "stop"}],
+        "usage": {"prompt_tokens": 0, "completion_tokens": len(_tokens(text)), "total_tokens": 0},
+    }
+
+def _chunk(model, delta, finish=None):
+    return {
+        "id": "chatcmpl-local", "object": "chat.completion.chunk", "created": int(time.time()),
+        "model": model,
+        "choices": [{"index": 0, "delta": delta, "finish_reason": finish}],
+    }
+
+
+# ---- MAIN ----
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--port", type=int, default=8808)
+    ap.add_argument("--latency", default="200", help="first-token latency: MS, uniform:LO,HI or lognormal:MEDIAN,SIGMA")
+    ap.add_argument("--token-delay", type=float, default=20.0, help="ms between streamed tokens")
+    ap.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered 500")
+    ap.add_argument("--rps", type=float, default=None, help="requests/s before answering 429")
+    ap.add_argument("--seed", type=int, default=None)
+    args = ap.parse_args()
+    server = FakeChatServer(port=args.port, latency=args.latency, token_delay=args.token_delay / 1000,
+                            error_rate=args.error_rate, rps=args.rps, seed=args.seed).start()
+    print(f"Fake chat API on {server.base_url} (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        print(server.stats())
+        server.stop()
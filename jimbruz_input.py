@@ -0,0 +1,105 @@
+# jimbruz_input.py
+"""
+Keyboard input for the manual override (phase 4)
+ - Key-down/key-up hooks from the `keyboard` package, no busy loop
+ - Falls back to polling at a bounded rate if hooks can't be installed
+ - Key names are mapped to actions through a configurable keymap
+ - Changes reach the Qt thread through a queued signal (set of held actions)
+"""
+
+import threading
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+try:
+    import keyboard  # pip install keyboard
+except Exception:
+    keyboard = None
+
+DEFAULT_KEYMAP = {
+    "a": "left", "left": "left",
+    "d": "right", "right": "right",
+    "shift": "run",
+    "space": "attack",
+    "h": "hurt",
+    "k": "die",
+}
+POLL_HZ = 30
+
+
+class KeyInput(QObject):
+    # emitted (queued onto the receiver's thread) whenever the held set changes
+    actions_changed = pyqtSignal(frozenset)
+
+    def __init__(self, keymap=None, poll_hz=POLL_HZ, parent=None):
+        super().__init__(parent)
+        self.keymap = dict(keymap or DEFAULT_KEYMAP)
+        self.poll_hz = poll_hz
+        self.mode = None  # "hook", "poll" or None if no keyboard access
+        self._held_keys = set()
+        self._actions = frozenset()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._hook = None
+
+    # ---- lifecycle ----
+    def start(self):
+        if keyboard is None:
+            return self
+        try:
+            self._hook = keyboard.hook(self._on_event)
+            self.mode = "hook"
+        except Exception:
+            threading.Thread(target=self._poll, daemon=True).start()
+            self.mode = "poll"
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._hook is not None:
+            try:
+                keyboard.unhook(self._hook)
+            except Exception:
+                pass
+            self._hook = None
+
+    # ---- sources ----
+    def _key_name(self, name):
+        name = (name or "").lower()
+        if name not in self.keymap:
+            for side in ("left ", "right "):  # "right shift" -> "shift"
+                if name.startswith(side) and name[len(side):] in self.keymap:
+                    return name[len(side):]
+        return name
+
+    def _on_event(self, event):
+        name = self._key_name(event.name)
+        if name not in self.keymap:
+            return
+        with self._lock:
+            if event.event_type == "down":
+                self._held_keys.add(name)
+            else:
+                self._held_keys.discard(name)
+            self._publish()
+
+    def _poll(self):
+        interval = 1.0 / self.poll_hz
+        while not self._stop.wait(interval):
+            try:
+                held = {k for k in self.keymap if keyboard.is_pressed(k)}
+            except Exception:
+                self.mode = None
+                return  # no access to the keyboard at all
+            with self._lock:
+                self._held_keys = held
+                self._publish()
+
+    def _publish(self):
+        actions = frozenset(self.keymap[k] for k in self._held_keys)
+        if actions != self._actions:
+            self._actions = actions
+            self.actions_changed.emit(actions)
+
+    def actions(self):
+        return self._actions
@@ -0,0 +1,163 @@
+# jimbruz_log.py
+"""
+Buffered session logger shared by core and phase 6
+ - log() only appends to a bounded in-memory queue; it never touches the disk
+ - A background writer flushes in batches (by count or after flush_interval)
+ - Lines stay human-readable, with structured key=value fields:
+     [2026-01-03 12:00:00] ask source=openai ttft_ms=212 energy=5 trust=1
+ - When the queue is full, low-priority events are dropped first
+ - The file is rotated by size (session.log -> session.log.1 ...)
+"""
+
+import os
+import time
+import atexit
+import threading
+from collections import deque
+from pathlib import Path
+
+LOW, NORMAL, HIGH = 0, 1, 2
+
+MAX_QUEUE = 1000
+BATCH_SIZE = 64
+FLUSH_INTERVAL = 1.0
+MAX_BYTES = 1024 * 1024
+BACKUPS = 3
+
+
+def format_fields(fields):
+    parts = []
+    for k, v in fields.items():
+        if v is None:
+            continue
+        if isinstance(v, float):
+            v = f"{v:.4g}"
+        v = str(v)
+        if not v or any(c in v for c in ' ="\n'):
+            v = '"' + v.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") + '"'
+        parts.append(f"{k}={v}")
+    return " ".join(parts)
+
+
+class SessionLogger:
+    def __init__(self, path, max_queue=MAX_QUEUE, batch_size=BATCH_SIZE,
+                 flush_interval=FLUSH_INTERVAL, max_bytes=MAX_BYTES, backups=BACKUPS):
+        self.path = Path(path)
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.dropped = 0
+        self._queue = deque()
+        self._lock = threading.Lock()
+        self._cond = threading.Condition(self._lock)      # wakes the writer
+        self._flushed = threading.Condition(self._lock)   # wakes flush() callers
+        self._flush_now = False
+        self._written = 0   # records handed to the file so far
+        self._enqueued = 0
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="jimbruz-log", daemon=True)
+        self._thread.start()
+
+    # ---- producer side (any thread, never blocks on I/O) ----
+    def log(self, event, priority=NORMAL, **fields):
+        record = (time.time(), priority, event, fields)
+        with self._cond:
+            if self._closed:
+                return
+            if len(self._queue) >= self.max_queue and not self._make_room(priority):
+                self.dropped += 1
+                return
+            self._queue.append(record)
+            self._enqueued += 1
+            if len(self._queue) >= self.batch_size:
+                self._cond.notify()
+
+    def _make_room(self, priority):
+        """Drop the oldest queued record of lower priority; False if there is none."""
+        for i, queued in enumerate(self._queue):
+            if queued[1] < priority:
+                del self._queue[i]
+                self.dropped += 1
+                self._enqueued -= 1
+                return True
+        return False
+
+    def flush(self, timeout=2.0):
+        """Wait until everything queued so far is on disk."""
+        with self._cond:
+            target = self._enqueued
+            self._flush_now = True
+            self._cond.notify()
+            self._flushed.wait_for(lambda: self._written >= target, timeout)
+
+    def close(self):
+        self.flush()
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+
+    # ---- writer thread ----
+    def _run(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: len(self._queue) >= self.batch_size
+                                    or self._flush_now or self._closed, self.flush_interval)
+                self._flush_now = False
+                batch = list(self._queue)
+                self._queue.clear()
+                dropped, self.dropped = self.dropped, 0
+                closed = self._closed
+            if batch or dropped:
+                self._write(batch, dropped)
+            with self._cond:
+                self._written += len(batch)
+                self._flushed.notify_all()
+            if closed:
+                return
+
+    def _write(self, batch, dropped):
+        lines = []
+        for t, _, event, fields in batch:
+            stamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(t))
+            extra = format_fields(fields)
+            lines.append(f"[{stamp}] {event}" + (f" {extra}" if extra else "") + "\n")
+        if dropped:
+            stamp = time.strftime("%Y-%m-%d %H:%M:%S")
+            lines.append(f"[{stamp}] log-dropped count={dropped}\n")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf8") as f:
+                f.write("".join(lines))
+                size = f.tell()
+            if size >= self.max_bytes:
+                self._rotate()
+        except OSError:
+            pass  # logging must never take the pet down
+
+    def _rotate(self):
+        for i in range(self.backups - 1, 0, -1):
+            src = Path(f"{self.path}.{i}")
+            if src.exists():
+                os.replace(src, f"{self.path}.{i + 1}")
+        os.replace(self.path, f"{self.path}.1")
+
+
+_loggers = {}
+_loggers_lock = threading.Lock()
+
+def open_logger(path):
+    key = os.path.abspath(path)
+    with _loggers_lock:
+        if key not in _loggers:
+            _loggers[key] = SessionLogger(path)
+        return _loggers[key]
+
+@atexit.register
+def _close_all():
+    for logger in list(_loggers.values()):
+        try:
+            logger.close()
+        except Exception:
+            pass
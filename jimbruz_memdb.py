@@ -0,0 +1,322 @@
+# jimbruz_memdb.py
+"""
+SQLite memory store - the default backend behind jimbruz_memory.open_journal()
+Features:
+ - Same interface as MemoryJournal (append / flush / group / tail / since /
+   load_all / compact), so core, phase 6, recall and state replay don't care
+   which backend is in use
+ - WAL mode: readers on their own connections never wait for a commit
+ - Index on time for tail / since / between; a trigram FTS5 index over note
+   for search(), so it matches substrings like the JSONL journal does (words
+   under 3 characters, and SQLite builds without trigram FTS5, use LIKE)
+ - Group commit: appends are buffered and inserted in one transaction
+ - search() / between() / recent() page through results with LIMIT/OFFSET
+   and yield rows as they are read
+ - An existing JSONL journal (and its compacted segment) is imported once
+"""
+
+import os
+import sys
+import json
+import time
+import sqlite3
+import threading
+from pathlib import Path
+
+from jimbruz_memory import (BATCH_SIZE, COMMIT_INTERVAL, COMPACT_AFTER_DAYS, MemoryJournal,
+                            rollup, _day_start, _size, _Group)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS memories (
+    id    INTEGER PRIMARY KEY,
+    time  REAL NOT NULL,
+    note  TEXT NOT NULL,
+    extra TEXT            -- JSON of any other fields (daily summaries' count / until)
+);
+CREATE INDEX IF NOT EXISTS memories_time ON memories(time);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+"""
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS memories_fts USING fts5(note, content='memories', content_rowid='id',
+                                                             tokenize='trigram');
+CREATE TRIGGER IF NOT EXISTS memories_ai AFTER INSERT ON memories BEGIN
+    INSERT INTO memories_fts(rowid, note) VALUES (new.id, new.note);
+END;
+CREATE TRIGGER IF NOT EXISTS memories_ad AFTER DELETE ON memories BEGIN
+    INSERT INTO memories_fts(memories_fts, rowid, note) VALUES ('delete', old.id, old.note);
+END;
+"""
+_FTS_DROP = """
+DROP TRIGGER IF EXISTS memories_ai;
+DROP TRIGGER IF EXISTS memories_ad;
+DROP TABLE IF EXISTS memories_fts;
+"""
+_COLUMNS = "time, note, extra"
+TRIGRAM = 3  # shortest word the trigram index can match; shorter ones use LIKE
+FETCH = 256  # rows pulled from the cursor at a time while streaming
+
+
+def _row(t, note, extra):
+    m = {"time": t, "note": note}
+    if extra:
+        m.update(json.loads(extra))
+    return m
+
+def _params(m):
+    extra = {k: v for k, v in m.items() if k not in ("time", "note")}
+    return m["time"], m["note"], json.dumps(extra, ensure_ascii=False) if extra else None
+
+
+class SQLiteMemoryStore:
+    def __init__(self, path, journal_path=None, legacy_path=None, batch_size=BATCH_SIZE,
+                 commit_interval=COMMIT_INTERVAL):
+        self.path = Path(path)
+        self.batch_size = batch_size
+        self.commit_interval = commit_interval
+        self._pending = []
+        self._lock = threading.RLock()
+        self._timer = None
+        self._group_depth = 0
+        self._listeners = []
+        self._local = threading.local()  # one read connection per thread
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = self._connect()
+        self._db.executescript(_SCHEMA)
+        self.fts = self._create_fts()
+        # the marker is committed with the imported rows, so a crash mid-import retries next open
+        imported = self._db.execute("SELECT 1 FROM meta WHERE key = 'imported_from'").fetchone()
+        if not imported and journal_path:
+            self._import(journal_path, legacy_path)
+
+    def _connect(self):
+        db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")  # WAL + NORMAL: durable across app crashes
+        return db
+
+    def _create_fts(self):
+        """Trigram FTS5 index over note (substring matches, like the JSONL journal's search)."""
+        row = self._db.execute("SELECT sql FROM sqlite_master WHERE name = 'memories_fts'").fetchone()
+        rebuild = row is None or "trigram" not in row[0]
+        try:
+            if rebuild:
+                self._db.executescript(_FTS_DROP)  # an index from an older word tokenizer
+            self._db.executescript(_FTS_SCHEMA)
+        except sqlite3.OperationalError:
+            # no FTS5 / trigram (SQLite < 3.34): search() scans with LIKE
+            self._db.executescript(_FTS_DROP)
+            return False
+        if rebuild:
+            self._db.execute("INSERT INTO memories_fts(memories_fts) VALUES ('rebuild')")
+        return True
+
+    def _reader(self):
+        db = getattr(self._local, "db", None)
+        if db is None:
+            db = self._local.db = self._connect()
+        return db
+
+    def _import(self, journal_path, legacy_path):
+        """Copy an existing JSONL journal (or memories.json list) in, once."""
+        journal = MemoryJournal(journal_path, legacy_path)
+        entries = journal.load_all()
+        with self._lock:
+            self._db.execute("BEGIN")
+            try:
+                self._db.executemany(f"INSERT INTO memories ({_COLUMNS}) VALUES (?, ?, ?)",
+                                     (_params(m) for m in entries))
+                self._db.execute("INSERT OR REPLACE INTO meta VALUES ('imported_from', ?)",
+                                 (str(journal_path),))
+                self._db.execute("COMMIT")
+            except Exception:
+                self._db.execute("ROLLBACK")
+                raise
+
+    # ---- writing ----
+    def append(self, note, t=None):
+        entry = {"time": time.time() if t is None else t, "note": note}
+        with self._lock:
+            self._pending.append(entry)
+            for listener in self._listeners:
+                listener(entry)
+            if self._group_depth:
+                return entry
+            if len(self._pending) >= self.batch_size or self.commit_interval <= 0:
+                self.flush()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.commit_interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+        return entry
+
+    def flush(self):
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._pending:
+                return
+            batch, self._pending = self._pending, []
+            self._db.execute("BEGIN")
+            try:
+                self._db.executemany(f"INSERT INTO memories ({_COLUMNS}) VALUES (?, ?, ?)",
+                                     [_params(m) for m in batch])
+                self._db.execute("COMMIT")
+            except Exception:
+                self._db.execute("ROLLBACK")
+                self._pending = batch + self._pending
+                raise
+
+    def subscribe(self, listener):
+        """Call listener(entry) for every entry appended from now on."""
+        with self._lock:
+            self._listeners.append(listener)
+
+    def group(self):
+        """Context manager: hold every append until the block exits, then commit once."""
+        return _Group(self)
+
+    # ---- reading ----
+    def _query(self, sql, args=()):
+        """Rows of `sql` as entries, streamed from the cursor FETCH at a time."""
+        cur = self._reader().execute(sql, args)
+        try:
+            while True:
+                rows = cur.fetchmany(FETCH)
+                if not rows:
+                    return
+                for row in rows:
+                    yield _row(*row)
+        finally:
+            cur.close()
+
+    def _snapshot(self):
+        """Pending entries and the last committed id, taken together: rows flushed
+        later get higher ids, so queries bounded by that id don't see them twice."""
+        with self._lock:
+            last = self._reader().execute("SELECT coalesce(max(id), 0) FROM memories").fetchone()[0]
+            return list(self._pending), last
+
+    def load_all(self):
+        pending, last = self._snapshot()  # appends aren't held up while the rows stream in
+        return list(self._query(f"SELECT {_COLUMNS} FROM memories WHERE id <= ? ORDER BY time, id",
+                                (last,))) + pending
+
+    def tail(self, n):
+        """The last n entries (oldest first)."""
+        if n <= 0:
+            return []
+        with self._lock:  # short: n rows at most
+            pending = list(self._pending)
+            if len(pending) >= n:
+                return pending[-n:]
+            rows = list(self._query(f"SELECT {_COLUMNS} FROM memories ORDER BY time DESC, id DESC LIMIT ?",
+                                    (n - len(pending),)))
+        rows.reverse()
+        return rows + pending
+
+    def since(self, t):
+        """Entries newer than t (oldest first)."""
+        pending, last = self._snapshot()
+        rows = list(self._query(f"SELECT {_COLUMNS} FROM memories WHERE time > ? AND id <= ? "
+                                f"ORDER BY time, id", (t, last)))
+        return rows + [m for m in pending if m["time"] > t]
+
+    def count(self):
+        with self._lock:
+            return self._reader().execute("SELECT count(*) FROM memories").fetchone()[0] + len(self._pending)
+
+    def recent(self, limit, offset=0):
+        """Newest first, skipping `offset`; commits pending appends first so pages line up."""
+        self.flush()
+        return self._query(f"SELECT {_COLUMNS} FROM memories ORDER BY time DESC, id DESC LIMIT ? OFFSET ?",
+                           (limit, offset))
+
+    def between(self, start, end=None, limit=-1, offset=0):
+        """Entries with start <= time < end (oldest first)."""
+        self.flush()
+        return self._query(f"SELECT {_COLUMNS} FROM memories WHERE time >= ? AND time < ? "
+                           f"ORDER BY time, id LIMIT ? OFFSET ?",
+                           (start, float("inf") if end is None else end, limit, offset))
+
+    def search(self, text, limit=-1, offset=0):
+        """Notes containing every word of `text` as a substring, ignoring case (newest first)."""
+        self.flush()
+        words = text.split()
+        if not words:
+            return iter(())
+        indexed = [w for w in words if self.fts and len(w) >= TRIGRAM]
+        short = [w for w in words if w not in indexed]
+        where = " AND ".join(["m.note LIKE ? ESCAPE '\\'"] * len(short)) or "1"
+        like = ["%" + w.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%" for w in short]
+        if indexed:
+            # each word quoted: matched literally, not as FTS syntax
+            match = " ".join('"' + w.replace('"', '""') + '"' for w in indexed)
+            # ids follow time (see compact), so FTS can walk its rowids backwards and stop at LIMIT
+            return self._query(f"SELECT m.time, m.note, m.extra FROM memories_fts f "
+                               f"JOIN memories m ON m.id = f.rowid WHERE memories_fts MATCH ? AND {where} "
+                               f"ORDER BY f.rowid DESC LIMIT ? OFFSET ?", (match, *like, limit, offset))
+        return self._query(f"SELECT m.time, m.note, m.extra FROM memories m WHERE {where} "
+                           f"ORDER BY m.id DESC LIMIT ? OFFSET ?", (*like, limit, offset))
+
+    # ---- compaction ----
+    def compact(self, older_than_days=COMPACT_AFTER_DAYS, now=None):
+        """
+        Roll whole days older than `older_than_days` up in place: each day's
+        stat events become one counted summary, user notes and Q/A pairs stay.
+        Resumes from the day recorded in meta. Returns a small report dict.
+        """
+        now = time.time() if now is None else now
+        cutoff = _day_start(now - older_than_days * 86400)
+        with self._lock:
+            self.flush()
+            row = self._db.execute("SELECT value FROM meta WHERE key = 'compacted_through'").fetchone()
+            through = float(row[0]) if row else 0.0
+            before = _size(self.path) + _size(str(self.path) + "-wal")
+            report = {"compacted": 0, "written": 0, "bytes_before": before}
+            if cutoff > through:
+                rows = self._db.execute(f"SELECT id, {_COLUMNS} FROM memories WHERE time >= ? AND time < ? "
+                                        f"ORDER BY time, id", (through, cutoff)).fetchall()
+                old = [_row(*r[1:]) for r in rows]
+                rolled = rollup(old)
+                self._db.execute("BEGIN")
+                try:
+                    self._db.execute("DELETE FROM memories WHERE time >= ? AND time < ?", (through, cutoff))
+                    # rolled entries take the day's first ids, so id order stays time order
+                    self._db.executemany(f"INSERT INTO memories (id, {_COLUMNS}) VALUES (?, ?, ?, ?)",
+                                         [(r[0], *_params(m)) for r, m in zip(rows, rolled)])
+                    self._db.execute("INSERT OR REPLACE INTO meta VALUES ('compacted_through', ?)", (str(cutoff),))
+                    self._db.execute("COMMIT")
+                except Exception:
+                    self._db.execute("ROLLBACK")
+                    raise
+                if len(rolled) < len(old):
+                    self._db.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                report.update(compacted=len(old), written=len(rolled))
+            # freed pages are reused by later inserts rather than returned to the OS
+            report["bytes_after"] = _size(self.path) + _size(str(self.path) + "-wal")
+            report["bytes_reclaimed"] = report["bytes_before"] - report["bytes_after"]
+            return report
+
+    def compact_in_background(self, on_done=None):
+        def run():
+            try:
+                report = self.compact()
+            except Exception:
+                return
+            if on_done:
+                on_done(report)
+        t = threading.Thread(target=run, daemon=True)
+        t.start()
+        return t
+
+    def close(self):
+        self.flush()
+        self._db.close()
+
+
+# ---- MAIN ----
+if __name__ == "__main__":
+    store = SQLiteMemoryStore(sys.argv[1] if len(sys.argv) > 1 else Path("data") / "memories.db")
+    print(f"{store.path}: {store.count()} memories, fts5={'yes' if store.fts else 'no'}, "
+          f"{os.path.getsize(store.path) / 1e6:.1f} MB")
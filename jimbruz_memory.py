@@ -0,0 +1,540 @@
+# jimbruz_memory.py
+"""
+Jimbruz memory journal - append-only JSONL storage shared by core and phase 6
+Features:
+ - open_journal() hands out the shared store: SQLite (jimbruz_memdb) by
+   default, this journal with JIMBRUZ_MEMORY_BACKEND=jsonl
+ - One JSON object per line ({"time": ..., "note": ...}), never rewritten
+ - Group commit: appends are buffered and flushed together (by count or time)
+ - tail(n) seeks backwards from the end of the file instead of parsing it all
+ - Old data/memories.json lists are migrated automatically on first open
+ - compact(): entries older than a few days move to a sealed segment, with
+   each day's stat events rolled up into one counted summary (user notes and
+   Q/A pairs are kept verbatim); resumes from a checkpoint. Appends and the
+   compaction rewrite share a lock file, so other processes' appends survive
+ - memories_command(): the paged `memories` / `memories search` / `memories
+   since` listing both front ends use
+Run: python jimbruz_memory.py compact [data/memories.jsonl]
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import atexit
+import threading
+import contextlib
+from pathlib import Path
+
+from jimbruz_startup import getenv
+
+try:
+    import fcntl
+except ImportError:  # Windows: the journal lock only covers threads of one process
+    fcntl = None
+
+BATCH_SIZE = 32          # flush once this many entries are pending
+COMMIT_INTERVAL = 0.5    # ...or this many seconds after the first pending one
+TAIL_BLOCK = 8192        # bytes read per step when scanning from the end
+COMPACT_AFTER_DAYS = 3   # whole days older than this are compacted
+
+
+class MemoryJournal:
+    def __init__(self, path, legacy_path=None, batch_size=BATCH_SIZE,
+                 commit_interval=COMMIT_INTERVAL):
+        self.path = Path(path)
+        self.legacy_path = Path(legacy_path) if legacy_path else None
+        self.batch_size = batch_size
+        self.commit_interval = commit_interval
+        self._pending = []
+        self._lock = threading.RLock()
+        self._timer = None
+        self._group_depth = 0
+        self._listeners = []
+        # compacted history lives next to the journal and is only ever appended to
+        self.segment_path = self.path.with_name(self.path.stem + ".compacted" + self.path.suffix)
+        self.checkpoint_path = self.path.with_name(self.path.stem + ".checkpoint.json")
+        # taken by every process for each append and for compaction's read + rewrite
+        self.lock_path = self.path.with_name(self.path.stem + ".lock")
+        self._checkpoint = self._read_checkpoint()
+        self._migrate()
+
+    # ---- migration ----
+    def _migrate(self):
+        """Convert an old pretty-printed JSON list into the journal (once)."""
+        legacy = self.legacy_path
+        if not legacy or not legacy.exists() or self.path.exists():
+            return
+        try:
+            entries = json.loads(legacy.read_text(encoding="utf8"))
+        except Exception:
+            entries = []
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        with open(tmp, "w", encoding="utf8") as f:
+            for m in entries:
+                if isinstance(m, dict) and "note" in m:
+                    f.write(_encode(m))
+        os.replace(tmp, self.path)
+        legacy.replace(legacy.with_suffix(legacy.suffix + ".migrated"))
+
+    # ---- writing ----
+    def append(self, note, t=None):
+        entry = {"time": time.time() if t is None else t, "note": note}
+        with self._lock:
+            self._pending.append(entry)
+            for listener in self._listeners:
+                listener(entry)
+            if self._group_depth:
+                return entry
+            if len(self._pending) >= self.batch_size or self.commit_interval <= 0:
+                self.flush()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.commit_interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+        return entry
+
+    def flush(self):
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._pending:
+                return
+            batch, self._pending = self._pending, []
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # opened under the lock: compaction may have replaced the file meanwhile
+            with _locked(self.lock_path), open(self.path, "a+b") as f:
+                data = "".join(_encode(m) for m in batch).encode("utf8")
+                if f.seek(0, os.SEEK_END) > 0:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b"\n":
+                        data = b"\n" + data  # torn last line (crash mid-write): don't glue onto it
+                f.write(data)
+
+    def subscribe(self, listener):
+        """Call listener(entry) for every entry appended from now on."""
+        with self._lock:
+            self._listeners.append(listener)
+
+    def group(self):
+        """Context manager: hold every append until the block exits, then commit once."""
+        return _Group(self)
+
+    # ---- reading ----
+    def load_all(self):
+        with self._lock:
+            pending = list(self._pending)
+            through = self._checkpoint["through"]
+            end = _size(self.path)  # a flush after this is already in `pending`
+        active = [m for m in _read_all(self.path, end) if m["time"] >= through]
+        return _read_all(self.segment_path) + active + pending
+
+    def tail(self, n):
+        """Return the last n entries without parsing the whole file."""
+        if n <= 0:
+            return []
+        with self._lock:
+            pending = list(self._pending)
+            through = self._checkpoint["through"]
+        if len(pending) >= n:
+            return pending[-n:]
+        out = [m for m in _read_tail(self.path, n - len(pending)) if m["time"] >= through] + pending
+        if len(out) < n:
+            out = _read_tail(self.segment_path, n - len(out)) + out
+        return out
+
+    def since(self, t):
+        """Entries newer than t (oldest first), reading back from the end only as far as needed."""
+        n = 16
+        while True:
+            entries = self.tail(n)
+            if len(entries) < n or entries[0]["time"] <= t:
+                return [m for m in entries if m["time"] > t]
+            n *= 4
+
+    # the paging queries below are what the SQLite store does with indexes;
+    # here they scan the files, so use them for listing, not on hot paths
+    def count(self):
+        return len(self.load_all())
+
+    def recent(self, limit, offset=0):
+        """Newest first, skipping `offset`."""
+        out = self.tail(offset + limit)
+        out.reverse()
+        return iter(out[offset:])
+
+    def between(self, start, end=None, limit=-1, offset=0):
+        """Entries with start <= time < end (oldest first)."""
+        hits = (m for m in self.load_all() if m["time"] >= start and (end is None or m["time"] < end))
+        return _page(hits, limit, offset)
+
+    def search(self, text, limit=-1, offset=0):
+        """Notes containing every word of `text` as a substring, ignoring case (newest first)."""
+        words = text.lower().split()
+        if not words:
+            return iter(())
+        hits = (m for m in reversed(self.load_all()) if all(w in m["note"].lower() for w in words))
+        return _page(hits, limit, offset)
+
+    # ---- compaction ----
+    def _read_checkpoint(self):
+        try:
+            return json.loads(self.checkpoint_path.read_text(encoding="utf8"))
+        except Exception:
+            return {"through": 0.0, "segment_bytes": 0}
+
+    def compact(self, older_than_days=COMPACT_AFTER_DAYS, now=None):
+        """
+        Move whole days older than `older_than_days` out of the journal into the
+        compacted segment. Each day's stat events become one counted summary;
+        user notes and Q/A pairs are copied verbatim. Already-compacted data is
+        never rewritten, so each run only touches entries since the checkpoint.
+        Returns a small report dict.
+        """
+        now = time.time() if now is None else now
+        cutoff = _day_start(now - older_than_days * 86400)
+        with self._lock:
+            self.flush()
+            return self._compact(cutoff)
+
+    def _compact(self, cutoff):
+        # no other process appends between reading the journal and replacing it
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with _locked(self.lock_path):
+            ckpt = self._checkpoint = self._read_checkpoint()  # another process may have compacted
+            seg_before = _size(self.segment_path)
+            active_before = _size(self.path)
+            # a crash between segment append and checkpoint leaves a torn tail
+            if seg_before > ckpt["segment_bytes"]:
+                with open(self.segment_path, "r+b") as f:
+                    f.truncate(ckpt["segment_bytes"])
+                seg_before = ckpt["segment_bytes"]
+            entries = _read_all(self.path)
+            old = [m for m in entries if ckpt["through"] <= m["time"] < cutoff]
+            keep = [m for m in entries if m["time"] >= cutoff]
+            report = {"compacted": len(old), "written": 0, "bytes_before": seg_before + active_before}
+            if cutoff <= ckpt["through"] or (not old and len(keep) == len(entries)):
+                report.update(written=0, bytes_after=report["bytes_before"], bytes_reclaimed=0)
+                return report
+
+            rolled = rollup(old)
+            self.segment_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.segment_path, "ab") as f:
+                f.write("".join(_encode(m) for m in rolled).encode("utf8"))
+                f.flush()
+                os.fsync(f.fileno())
+            new_ckpt = {"through": cutoff, "segment_bytes": _size(self.segment_path)}
+            _atomic_write(self.checkpoint_path, json.dumps(new_ckpt))
+            self._checkpoint = new_ckpt
+            _atomic_write(self.path, "".join(_encode(m) for m in keep))
+
+            report["written"] = len(rolled)
+            report["bytes_after"] = new_ckpt["segment_bytes"] + _size(self.path)
+            report["bytes_reclaimed"] = report["bytes_before"] - report["bytes_after"]
+            return report
+
+    def compact_in_background(self, on_done=None):
+        def run():
+            try:
+                report = self.compact()
+            except Exception:
+                return
+            if on_done:
+                on_done(report)
+        t = threading.Thread(target=run, daemon=True)
+        t.start()
+        return t
+
+
+def rollup(entries):
+    """
+    Per calendar day: stat events collapse into one summary entry (placed at
+    the day's first event) counting each kind; everything else is kept as is.
+    """
+    out = []
+    day = None
+    summary = None
+    for m in entries:
+        d = _day_start(m["time"])
+        if d != day:
+            day, summary = d, None
+        name = event_name(m["note"])
+        if name is None or m.get("count"):
+            out.append(m)  # user note, Q/A pair, or an existing rollup
+            continue
+        if summary is None:
+            summary = {"time": m["time"], "note": "", "count": 0, "events": {}}
+            out.append(summary)
+        summary["count"] += 1
+        summary["events"][name] = summary["events"].get(name, 0) + 1
+        summary["until"] = m["time"]
+    for m in out:
+        if "events" in m:
+            counts = m.pop("events")
+            label = time.strftime("%Y-%m-%d", time.localtime(m["time"]))
+            m["note"] = f"Daily summary {label}: " + ", ".join(f"{k} x{v}" for k, v in counts.items())
+    return out
+
+
+def _day_start(t):
+    lt = time.localtime(t)
+    return time.mktime((lt.tm_year, lt.tm_mon, lt.tm_mday, 0, 0, 0, 0, 0, -1))
+
+def _size(path):
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+@contextlib.contextmanager
+def _locked(path):
+    """Exclusive advisory lock on `path`, shared by every process using the journal."""
+    if fcntl is None:
+        yield
+        return
+    with open(path, "a") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+def _atomic_write(path, text):
+    tmp = Path(str(path) + ".tmp")
+    with open(tmp, "w", encoding="utf8") as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+def _page(entries, limit, offset):
+    it = iter(entries)
+    for _ in range(offset):
+        if next(it, None) is None:
+            return iter(())
+    return it if limit < 0 else (m for _, m in zip(range(limit), it))
+
+def _read_all(path, end=None):
+    """Every entry in the file, or in its first `end` bytes."""
+    if not os.path.exists(path):
+        return []
+    out = []
+    with open(path, "rb") as f:
+        for line in f:
+            if end is not None:
+                end -= len(line)
+                if end < 0:
+                    break  # written after the caller's snapshot
+            m = _decode(line)
+            if m is not None:
+                out.append(m)
+    return out
+
+def _read_tail(path, n):
+    if n <= 0 or not os.path.exists(path):
+        return []
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        buf = b""
+        # one extra newline so the first (possibly partial) line is complete
+        while pos > 0 and buf.count(b"\n") <= n:
+            step = min(TAIL_BLOCK, pos)
+            pos -= step
+            f.seek(pos)
+            buf = f.read(step) + buf
+    lines = buf.splitlines()
+    if pos > 0:
+        lines = lines[1:]
+    out = []
+    for line in reversed(lines):
+        m = _decode(line)
+        if m is not None:
+            out.append(m)
+            if len(out) == n:
+                break
+    out.reverse()
+    return out
+
+
+class _Group:
+    def __init__(self, journal):
+        self.journal = journal
+
+    def __enter__(self):
+        with self.journal._lock:
+            self.journal._group_depth += 1
+        return self.journal
+
+    def __exit__(self, *exc):
+        with self.journal._lock:
+            self.journal._group_depth -= 1
+            if not self.journal._group_depth:
+                self.journal.flush()
+        return False
+
+
+def _encode(m):
+    return json.dumps(m, ensure_ascii=False) + "\n"
+
+
+def _decode(line):
+    line = line.strip()
+    if not line:
+        return None
+    try:
+        m = json.loads(line)
+    except Exception:
+        return None  # torn write at the end of the file
+    return m if isinstance(m, dict) and "note" in m else None
+
+
+# ---- note kinds ----
+# Notes the pets write on their own (stat changes) vs. Q/A pairs vs. anything
+# the user asked Jimbruz to remember. Covers both core and phase 6 wording.
+_QA_NOTE = re.compile(r"^(Asked: |Q:)")
+_SUMMARY_NOTE = re.compile(r"^Daily summary \d{4}-\d{2}-\d{2}: ")
+_EVENT_NOTE = re.compile(
+    r"^(?:(Accepted food)(?:\. Energy->[\d.]+, Trust->[\d.]+)?"
+    r"|(Refused food)(?: \(too shy\)\.)?"
+    r"|(Tried to play but it hid)\.|(Play attempt failed)"
+    r"|(Played together)(?:\. Happiness increased\.)?"
+    r"|(Slept)(?:; energy restored\.)?)$"
+)
+
+def note_kind(note):
+    """'qa', 'event', 'summary' or 'note' (user-provided)."""
+    if _QA_NOTE.match(note):
+        return "qa"
+    if _EVENT_NOTE.match(note):
+        return "event"
+    if _SUMMARY_NOTE.match(note):
+        return "summary"
+    return "note"
+
+def event_name(note):
+    """'Accepted food. Energy->7, Trust->3' -> 'Accepted food'; None if not a stat event."""
+    m = _EVENT_NOTE.match(note)
+    return next(g for g in m.groups() if g) if m else None
+
+
+# ---- memories command ----
+# Shared by core and phase 6: `memories`, `memories N`, `memories page N`,
+# `memories search <text> [page N]`, `memories since <date> [page N]`.
+_AGO = re.compile(r"^(\d+)\s*([dh])$")
+
+def parse_when(text):
+    """'2024-05-01', '2024-05-01 18:30', 'today', 'yesterday', '3d', '12h' -> epoch seconds, or None."""
+    text = text.strip().lower()
+    if text in ("today", "yesterday"):
+        return _day_start(time.time()) - (86400 if text == "yesterday" else 0)
+    m = _AGO.match(text)
+    if m:
+        return time.time() - int(m.group(1)) * (86400 if m.group(2) == "d" else 3600)
+    for fmt in ("%Y-%m-%d %H:%M", "%Y-%m-%d"):
+        try:
+            return time.mktime(time.strptime(text, fmt))
+        except ValueError:
+            pass
+    return None
+
+def _split_page(words):
+    if len(words) >= 2 and words[-2] == "page" and words[-1].isdigit():
+        return words[:-2], max(1, int(words[-1]))
+    return words, 1
+
+def memories_command(journal, arg, page_size=20):
+    """Yield the output lines for `memories <arg>`; rows are streamed, one page at a time."""
+    words, page = _split_page(arg.split())
+    mode = words[0].lower() if words else ""
+    rest = " ".join(words[1:])
+    limit = page_size
+    if mode.isdigit() and len(words) == 1:
+        limit, mode = max(1, int(mode)), ""
+    offset = (page - 1) * limit
+    if mode == "search":
+        if not rest:
+            yield "Usage: memories search <text> [page N]"
+            return
+        rows, empty = journal.search(rest, limit + 1, offset), f"No memories matching '{rest}'."
+    elif mode == "since":
+        start = parse_when(rest)
+        if start is None:
+            yield "Usage: memories since <YYYY-MM-DD [HH:MM] | today | yesterday | Nd | Nh> [page N]"
+            return
+        rows, empty = journal.between(start, None, limit + 1, offset), f"No memories since {rest}."
+    elif mode:
+        yield "Usage: memories [N | page N | search <text> | since <date>]"
+        return
+    else:
+        rows, empty = journal.recent(limit + 1, offset), "No memories yet."
+
+    shown = 0
+    more = False
+    for m in rows:
+        if shown == limit:
+            more = True  # the extra row only tells us there is a next page
+            break
+        when = time.strftime("%Y-%m-%d %H:%M", time.localtime(m["time"]))
+        yield f"- [{when}] {m['note']}"
+        shown += 1
+    if not shown:
+        yield empty if page == 1 else f"No more memories (page {page})."
+    elif more:
+        yield f"(more: {' '.join(['memories', *words, 'page', str(page + 1)])})"
+
+
+# ---- shared instances ----
+# JIMBRUZ_MEMORY_BACKEND=jsonl keeps the plain journal; the default SQLite
+# store (jimbruz_memdb) imports an existing journal the first time it opens.
+# Read on open (environment or .env), not at import.
+MEMORY_BACKEND = "sqlite"
+
+_journals = {}
+_journals_lock = threading.Lock()
+
+def open_journal(path, legacy_path=None, backend=None):
+    """One store per file per process, so core and phase 6 share buffers."""
+    backend = backend or getenv("JIMBRUZ_MEMORY_BACKEND", MEMORY_BACKEND)
+    key = (backend, os.path.abspath(path))
+    with _journals_lock:
+        j = _journals.get(key)
+        if j is None:
+            j = _journals[key] = _open(path, legacy_path, backend)
+        return j
+
+def _open(path, legacy_path, backend):
+    if backend == "sqlite":
+        try:
+            from jimbruz_memdb import SQLiteMemoryStore
+            return SQLiteMemoryStore(Path(path).with_suffix(".db"), path, legacy_path)
+        except Exception as e:
+            print(f"[memory] SQLite store unavailable ({e}); using the JSONL journal", file=sys.stderr)
+    return MemoryJournal(path, legacy_path)
+
+@atexit.register
+def _flush_all():
+    for j in list(_journals.values()):
+        try:
+            j.flush()
+        except Exception:
+            pass
+
+
+# ---- MAIN ----
+if __name__ == "__main__":
+    if len(sys.argv) < 2 or sys.argv[1] != "compact":
+        print("usage: python jimbruz_memory.py compact [data/memories.jsonl]")
+        sys.exit(1)
+    journal = MemoryJournal(sys.argv[2] if len(sys.argv) > 2 else Path("data") / "memories.jsonl")
+    t = time.perf_counter(); n_before = len(journal.load_all()); load_before = time.perf_counter() - t
+    report = journal.compact()
+    t = time.perf_counter(); n_after = len(journal.load_all()); load_after = time.perf_counter() - t
+    print(f"compacted {report['compacted']} entries into {report['written']}; "
+          f"{report['bytes_reclaimed']} bytes reclaimed "
+          f"({report['bytes_before']} -> {report['bytes_after']})")
+    print(f"load_memories: {n_before} entries in {load_before * 1000:.1f} ms -> "
+          f"{n_after} in {load_after * 1000:.1f} ms ({load_before / max(load_after, 1e-9):.1f}x)")
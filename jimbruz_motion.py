@@ -0,0 +1,141 @@
+# jimbruz_motion.py
+"""
+Time-based movement for the Qt pets (phase 3 / phase 4)
+ - Mover: position as floats, advanced by elapsed monotonic time (px/s),
+   so speed doesn't depend on how regularly the move timer fires
+ - Each leg follows the straight line to its waypoint with ease-in/out;
+   waypoints queue up and are walked in order
+ - step() reports whether the whole-pixel position changed, so the caller
+   only issues a native window move when there is something to show
+ - MoveCounter: native moves per second, to compare against fixed-step ticks
+"""
+
+import math
+import time
+from collections import deque
+
+WALK_SPEED = 100.0   # px/s (the old 3 px per 30 ms tick)
+RUN_SPEED = 230.0    # px/s (the old 7 px per 30 ms tick)
+MAX_SLIDE_DT = 0.25  # s; a stalled timer doesn't turn into one long jump
+
+
+def ease_in_out(t):
+    """Smoothstep: starts and stops gently, full speed mid-leg."""
+    return t * t * (3 - 2 * t)
+
+
+class Mover:
+    __slots__ = ("x", "y", "_waypoints", "_leg", "_last", "clock", "shown")
+
+    def __init__(self, x, y, clock=time.monotonic):
+        self.x, self.y = float(x), float(y)
+        self.clock = clock
+        self.shown = (round(x), round(y))  # whole-pixel position last reported by step()
+        self._waypoints = deque()      # (x, y, speed) still to walk, in order
+        self._leg = None               # (x0, y0, x1, y1, t0, duration) being walked
+        self._last = clock()
+
+    @property
+    def moving(self):
+        return self._leg is not None or bool(self._waypoints)
+
+    @property
+    def target(self):
+        """Where the current leg ends, or None."""
+        if self._leg is not None:
+            return self._leg[2], self._leg[3]
+        return (self._waypoints[0][0], self._waypoints[0][1]) if self._waypoints else None
+
+    def heading(self):
+        """-1 / 0 / 1: horizontal direction of the current (or next) leg."""
+        target = self.target
+        if target is None:
+            return 0
+        dx = target[0] - self.x
+        return (dx > 0) - (dx < 0)
+
+    def go(self, x, y, speed):
+        """Drop any queued waypoints and head for (x, y)."""
+        self.stop()
+        self.queue(x, y, speed)
+
+    def queue(self, x, y, speed):
+        self._waypoints.append((float(x), float(y), float(speed)))
+
+    def stop(self):
+        self._waypoints.clear()
+        self._leg = None
+        self._last = self.clock()
+
+    def jump(self, x, y):
+        """Put the pet straight at (x, y), e.g. under the mouse; drops the route."""
+        self.stop()
+        self.x, self.y = float(x), float(y)
+        return self._report()
+
+    def slide(self, vx, vy, now=None):
+        """Manual control: move at (vx, vy) px/s for the time since the last call."""
+        now = self.clock() if now is None else now
+        dt = min(MAX_SLIDE_DT, max(0.0, now - self._last))
+        self._last = now
+        self._waypoints.clear()
+        self._leg = None
+        self.x += vx * dt
+        self.y += vy * dt
+        return self._report()
+
+    def step(self, now=None):
+        """Advance to `now`; True if the whole-pixel position changed."""
+        now = self.clock() if now is None else now
+        self._last = now
+        start = now  # a leg finished mid-tick hands its leftover time to the next
+        while True:
+            if self._leg is None:
+                if not self._waypoints:
+                    break
+                x1, y1, speed = self._waypoints.popleft()
+                dist = math.hypot(x1 - self.x, y1 - self.y)
+                if dist < 0.5 or speed <= 0:
+                    self.x, self.y = x1, y1
+                    continue
+                # `speed` is the leg's average; eased, the peak is 1.5x that
+                self._leg = (self.x, self.y, x1, y1, start, dist / speed)
+            x0, y0, x1, y1, t0, duration = self._leg
+            t = (now - t0) / duration
+            if t < 1.0:
+                e = ease_in_out(t)
+                self.x, self.y = x0 + (x1 - x0) * e, y0 + (y1 - y0) * e
+                break
+            self.x, self.y = x1, y1
+            self._leg = None
+            start = t0 + duration
+        return self._report()
+
+    def _report(self):
+        shown = (round(self.x), round(self.y))
+        if shown == self.shown:
+            return False
+        self.shown = shown
+        return True
+
+
+class MoveCounter:
+    """Native window moves: total and over the last second."""
+
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock
+        self.total = 0
+        self._recent = deque()
+
+    def record(self):
+        now = self.clock()
+        self.total += 1
+        self._recent.append(now)
+        while self._recent and self._recent[0] < now - 1.0:
+            self._recent.popleft()
+
+    def per_second(self):
+        now = self.clock()
+        while self._recent and self._recent[0] < now - 1.0:
+            self._recent.popleft()
+        return len(self._recent)
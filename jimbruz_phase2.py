@@ -1,7 +1,7 @@
 import sys, os, random
 from PyQt5.QtWidgets import QApplication, QLabel
 from PyQt5.QtCore import Qt, QTimer, QPoint
-from PyQt5.QtGui import QPixmap
+from jimbruz_sprites import FrameLoader, load_pixmaps
 
 # ---- CONFIG ----
 ASSETS_PATH = "assets/jimbruz"
@@ -13,11 +13,8 @@ SPRITES = {
 
 # ---- LOAD SPRITES ----
 def load_frames(folder):
-    frames = []
-    for file in sorted(os.listdir(folder)):
-        if file.endswith(".png"):
-            frames.append(QPixmap(os.path.join(folder, file)))
-    return frames
+    # pre-decoded, mmap'd frames if the cache is there, else the PNGs decoded in parallel
+    return load_pixmaps(folder)
 
 # ---- JIMBRUZ WIDGET ----
 class Jimbruz(QLabel):
@@ -34,12 +31,10 @@ class Jimbruz(QLabel):
         # lore
         self.personality = "❄️ I am Jimbruz, the Snow Beast. Scary outside, kind inside."
 
-        # load animations AFTER app is running
-        self.animations = {
-            "idle": load_frames(SPRITES["idle"]),
-            "walk": load_frames(SPRITES["walk"]),
-            "run": load_frames(SPRITES["run"]),
-        }
+        # load animations AFTER app is running: idle now, the rest stream in
+        self.animations = {}
+        self.frame_loader = FrameLoader(SPRITES, self.animations, parent=self)
+        self.frame_loader.load("idle")
 
         self.current_anim = "idle"
         self.frame_index = 0
@@ -58,10 +53,12 @@ class Jimbruz(QLabel):
         self.move_timer.start(3000)  # every 3s maybe move
 
         self.next_frame()
+        self.frame_loader.start()
 
     def next_frame(self):
-        frames = self.animations[self.current_anim]
-        if frames:  # prevent crash if folder empty
+        frames = self.animations.get(self.current_anim)
+        if frames:  # prevent crash if folder empty (or not streamed in yet)
+            self.frame_index %= len(frames)
             self.setPixmap(frames[self.frame_index].scaled(
                 128, 128, Qt.KeepAspectRatio, Qt.SmoothTransformation
             ))
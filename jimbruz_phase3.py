@@ -1,7 +1,9 @@
-import sys, os, random
+import sys, os, time, random
 from PyQt5.QtWidgets import QApplication, QLabel
-from PyQt5.QtCore import Qt, QTimer, QPoint
-from PyQt5.QtGui import QPixmap
+from PyQt5.QtCore import Qt, QPoint
+from jimbruz_scheduler import PetScheduler, on_battery, is_occluded
+from jimbruz_sprites import RenderCache, FrameStats, FrameLoader, load_pixmaps
+from jimbruz_motion import Mover, MoveCounter, WALK_SPEED, RUN_SPEED
 
 # ---- CONFIG ----
 ASSETS_PATH = "assets/jimbruz"
@@ -16,13 +18,8 @@ SPRITES = {
 
 # ---- LOAD SPRITES ----
 def load_frames(folder):
-    frames = []
-    if not os.path.exists(folder):
-        return frames
-    for file in sorted(os.listdir(folder)):
-        if file.endswith(".png"):
-            frames.append(QPixmap(os.path.join(folder, file)))
-    return frames
+    # pre-decoded, mmap'd frames if the cache is there, else the PNGs decoded in parallel
+    return load_pixmaps(folder)
 
 # ---- JIMBRUZ WIDGET ----
 class Jimbruz(QLabel):
@@ -39,8 +36,12 @@ class Jimbruz(QLabel):
         # lore
         self.personality = "❄️ I am Jimbruz, the Snow Beast. Scary outside, kind inside."
 
-        # load animations
-        self.animations = {key: load_frames(path) for key, path in SPRITES.items()}
+        # load animations: idle_right now (all cores), the rest stream in behind it
+        self.animations = {}
+        self.frame_loader = FrameLoader(SPRITES, self.animations, parent=self)
+        self.frame_loader.load("idle_right")
+        self.render_cache = RenderCache(self.animations)  # pre-scaled frames
+        self.frame_stats = FrameStats()
 
         self.current_anim = "idle_right"
         self.frame_index = 0
@@ -54,71 +55,78 @@ class Jimbruz(QLabel):
         start_y = (self.screen_rect.height() - self.height()) // 2
         self.move(start_x, start_y)
 
-        # movement state
-        self.target = None
-        self.speed = 2  # default walk speed
+        # movement: time-based, along queued waypoints; only whole-pixel
+        # changes become native window moves
+        self.mover = Mover(start_x, start_y)
+        self.native_moves = MoveCounter()
 
-        # timers
-        self.anim_timer = QTimer()
-        self.anim_timer.timeout.connect(self.next_frame)
-        self.anim_timer.start(150)  # frame speed
-
-        self.move_timer = QTimer()
-        self.move_timer.timeout.connect(self.update_position)
-        self.move_timer.start(30)  # smooth movement steps
-
-        self.behavior_timer = QTimer()
-        self.behavior_timer.timeout.connect(self.choose_behavior)
-        self.behavior_timer.start(4000)  # every 4s pick new action
+        # one scheduler owns all pet time; movement only ticks while moving
+        self.scheduler = PetScheduler(self)
+        self.scheduler.add("anim", 150, self.next_frame)  # frame speed
+        self.scheduler.add("move", 30, self.update_position, enabled=False)  # smooth movement
+        self.scheduler.add("behavior", 4000, self.choose_behavior)  # every 4s pick new action
+        self.scheduler.add("power", 15000, self.update_power_mode)
 
         self.next_frame()
+        self.frame_loader.start()
 
     def next_frame(self):
+        started = time.perf_counter()
         frames = self.animations.get(self.current_anim, [])
         if frames:
-            self.setPixmap(frames[self.frame_index].scaled(
-                128, 128, Qt.KeepAspectRatio, Qt.SmoothTransformation
+            self.frame_index %= len(frames)  # animations differ in length
+            self.setPixmap(self.render_cache.get(
+                self.current_anim, self.frame_index,
+                self.width(), self.height(), self.devicePixelRatioF()
             ))
             self.frame_index = (self.frame_index + 1) % len(frames)
+        self.frame_stats.record(started)
 
     def choose_behavior(self):
         action = random.choice(["idle", "walk", "run"])
         direction = random.choice(["left", "right"])
-        self.current_anim = f"{action}_{direction}"
 
-        if action == "walk":
-            self.speed = 3
-            self.pick_random_target()
-        elif action == "run":
-            self.speed = 7
-            self.pick_random_target()
+        if action in ("walk", "run"):
+            self.pick_route(WALK_SPEED if action == "walk" else RUN_SPEED)
+            direction = "left" if self.mover.heading() < 0 else "right"
         else:  # idle
-            self.speed = 0
-            self.target = None
+            self.mover.stop()
+        self.current_anim = f"{action}_{direction}"
+        self.sync_movement()
+
+    # --- scheduling ---
+    def sync_movement(self):
+        self.scheduler.set_enabled("move", self.mover.moving)
+
+    def update_power_mode(self):
+        self.scheduler.set_power_saving(on_battery() or is_occluded(self))
 
     def pick_random_target(self):
         x = random.randint(0, self.screen_rect.width() - self.width())
         y = random.randint(0, self.screen_rect.height() - self.height())
-        self.target = QPoint(x, y)
+        return QPoint(x, y)
+
+    def pick_route(self, speed, stops=None):
+        """Replace the route with 1-3 random waypoints walked at `speed` px/s."""
+        self.mover.stop()
+        for _ in range(stops or random.randint(1, 3)):
+            p = self.pick_random_target()
+            self.mover.queue(p.x(), p.y(), speed)
+
+    def add_waypoint(self, x, y, speed=WALK_SPEED):
+        self.mover.queue(x, y, speed)
+        self.sync_movement()
 
     def update_position(self):
-        if self.target and self.speed > 0:
-            current = self.pos()
-            dx = self.target.x() - current.x()
-            dy = self.target.y() - current.y()
-
-            # distance check
-            if abs(dx) < self.speed and abs(dy) < self.speed:
-                self.move(self.target)
-                self.current_anim = "idle_right" if "right" in self.current_anim else "idle_left"
-                self.target = None
-                return
-
-            # normalize step
-            step_x = self.speed if dx > 0 else -self.speed if dx < 0 else 0
-            step_y = self.speed if dy > 0 else -self.speed if dy < 0 else 0
-
-            self.move(current.x() + step_x, current.y() + step_y)
+        if self.mover.step():
+            self.move(*self.mover.shown)
+            self.native_moves.record()
+        side = {-1: "left", 1: "right"}.get(self.mover.heading())
+        if side and not self.current_anim.endswith(side):  # the route turned
+            self.current_anim = f"{self.current_anim.rsplit('_', 1)[0]}_{side}"
+        if not self.mover.moving:  # last waypoint reached
+            self.current_anim = "idle_right" if "right" in self.current_anim else "idle_left"
+            self.sync_movement()
 
 # ---- MAIN ----
 if __name__ == "__main__":
@@ -1,8 +1,12 @@
-import sys, os, random, threading
-from PyQt5.QtWidgets import QApplication, QLabel
-from PyQt5.QtCore import Qt, QTimer, QPoint
-from PyQt5.QtGui import QPixmap
-import keyboard  # pip install keyboard
+import sys, os, time, random, argparse
+from PyQt5.QtWidgets import QApplication, QLabel, QWidget
+from PyQt5.QtCore import Qt, QPoint, QRect, QObject, QTimer
+from PyQt5.QtGui import QPainter, QRegion
+from jimbruz_scheduler import PetScheduler, on_battery, is_occluded
+from jimbruz_sprites import RenderCache, FrameStats, FramePool, load_pixmaps
+from jimbruz_input import KeyInput, DEFAULT_KEYMAP
+from jimbruz_motion import Mover, MoveCounter, WALK_SPEED, RUN_SPEED
+from jimbruz_startup import mark
 
 # ---- CONFIG ----
 ASSETS_PATH = "assets/jimbruz"
@@ -20,21 +24,22 @@ SPRITES = {
     "hurt_left": os.path.join(ASSETS_PATH, "Left - Hurt"),
     "die": os.path.join(ASSETS_PATH, "Dying"),
 }
+FRAME_BUDGET_MB = 48  # decoded animations kept resident (LRU beyond this)
+KEYMAP = dict(DEFAULT_KEYMAP)  # key name -> action (left/right/run/attack/hurt/die)
+KEY_WALK_SPEED, KEY_RUN_SPEED = 133.0, 267.0  # px/s under keyboard control (was 4 / 8 px per tick)
+PET_SIZE = 128  # px, each pet's box (herd and canvas modes)
+CLICK_SLOP = 4  # px the mouse may move before a press becomes a drag
+MASK_GRID = 32  # canvas input mask snaps out to this grid, so it changes every few px, not every px
 
 # ---- LOAD SPRITES ----
 def load_frames(folder):
-    frames = []
-    if not os.path.exists(folder):
-        return frames
-    for file in sorted(os.listdir(folder)):
-        if file.endswith(".png"):
-            frames.append(QPixmap(os.path.join(folder, file)))
-    return frames
+    # pre-decoded, mmap'd frames if the cache is there, else the PNGs decoded in parallel
+    return load_pixmaps(folder)
 
 
 # ---- JIMBRUZ WIDGET ----
 class Jimbruz(QLabel):
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, frame_budget_mb=FRAME_BUDGET_MB, keymap=KEYMAP):
         super().__init__(parent)
         self.setWindowFlags(
             Qt.FramelessWindowHint
@@ -47,8 +52,11 @@ class Jimbruz(QLabel):
         # lore
         self.personality = "❄️ I am Jimbruz, the Snow Beast. Scary outside, kind inside."
 
-        # load animations
-        self.animations = {key: load_frames(path) for key, path in SPRITES.items()}
+        # animations are decoded on first use and evicted LRU over budget
+        self.animations = FramePool(SPRITES, frame_budget_mb,
+                                    on_evict=lambda name: self.render_cache.drop(name))
+        self.render_cache = RenderCache(self.animations)  # pre-scaled frames
+        self.frame_stats = FrameStats()
 
         self.current_anim = "idle_right"
         self.frame_index = 0
@@ -62,32 +70,29 @@ class Jimbruz(QLabel):
         start_y = (self.screen_rect.height() - self.height()) // 2
         self.move(start_x, start_y)
 
-        # movement state
-        self.target = None
-        self.speed = 0
+        # movement state: time-based, along queued waypoints; only
+        # whole-pixel changes become native window moves
+        self.mover = Mover(start_x, start_y)
+        self.native_moves = MoveCounter()
         self.direction = "right"
 
         # control state
         self.manual_override = False
-        self.keys_pressed = set()
+        self.keys_pressed = frozenset()  # held actions, only touched on the Qt thread
 
-        # timers
-        self.anim_timer = QTimer()
-        self.anim_timer.timeout.connect(self.next_frame)
-        self.anim_timer.start(150)  # frame speed
-
-        self.move_timer = QTimer()
-        self.move_timer.timeout.connect(self.update_position)
-        self.move_timer.start(30)  # smooth movement
-
-        self.behavior_timer = QTimer()
-        self.behavior_timer.timeout.connect(self.choose_behavior)
-        self.behavior_timer.start(4000)  # AI every 4s
+        # one scheduler owns all pet time; movement only ticks while moving
+        self.scheduler = PetScheduler(self)
+        self.scheduler.add("anim", 150, self.next_frame)  # frame speed
+        self.scheduler.add("move", 30, self.update_position, enabled=False)  # smooth movement
+        self.scheduler.add("behavior", 4000, self.choose_behavior)  # AI every 4s
+        self.scheduler.add("power", 15000, self.update_power_mode)
 
         self.next_frame()
 
-        # start global keyboard listener
-        threading.Thread(target=self.listen_keys, daemon=True).start()
+        # global keyboard hooks; changes arrive here as queued signals
+        self.key_input = KeyInput(keymap, parent=self)
+        self.key_input.actions_changed.connect(self.on_keys_changed)
+        self.key_input.start()
 
     # --- animation ---
     def play_animation(self, state):
@@ -98,12 +103,15 @@ class Jimbruz(QLabel):
             self.next_frame()
 
     def next_frame(self):
+        started = time.perf_counter()
         frames = self.animations.get(self.current_anim, [])
         if frames:
-            self.setPixmap(frames[self.frame_index].scaled(
-                128, 128, Qt.KeepAspectRatio, Qt.SmoothTransformation
+            self.setPixmap(self.render_cache.get(
+                self.current_anim, self.frame_index,
+                self.width(), self.height(), self.devicePixelRatioF()
             ))
             self.frame_index = (self.frame_index + 1) % len(frames)
+        self.frame_stats.record(started)
 
     # --- AI behavior ---
     def choose_behavior(self):
@@ -112,13 +120,11 @@ class Jimbruz(QLabel):
 
         action = random.choice(["idle", "idle_normal", "walk", "run", "attack", "hurt"])
         if action in ["idle", "idle_normal"]:
-            self.speed = 0
-            self.target = None
+            self.mover.stop()
             self.play_animation(action)
         elif action in ["walk", "run"]:
-            self.direction = random.choice(["left", "right"])
-            self.speed = 3 if action == "walk" else 7
-            self.pick_random_target()
+            self.pick_route(WALK_SPEED if action == "walk" else RUN_SPEED)
+            self.direction = "left" if self.mover.heading() < 0 else "right"
             self.play_animation(action)
         else:  # attack or hurt
             self.play_animation(action)
@@ -126,76 +132,464 @@ class Jimbruz(QLabel):
         if random.random() < 0.001:
             self.play_animation("die")
 
+        self.sync_movement()
+        self.animations.prefetch(self.likely_next(action))
+
+    def likely_next(self, action):
+        """Animations the pet will probably need after `action`."""
+        if action in ["walk", "run", "attack", "hurt"]:
+            return [f"idle_{self.direction}"]  # arrives / recovers into idle
+        return ["walk_left", "walk_right", "run_left", "run_right"]
+
+    def frame_memory_mb(self):
+        return self.animations.resident_mb()
+
+    # --- scheduling ---
+    def sync_movement(self):
+        self.scheduler.set_enabled("move", self.manual_override or self.mover.moving)
+
+    def update_power_mode(self):
+        self.scheduler.set_power_saving(on_battery() or is_occluded(self))
+
     def pick_random_target(self):
         x = random.randint(0, self.screen_rect.width() - self.width())
         y = random.randint(0, self.screen_rect.height() - self.height())
-        self.target = QPoint(x, y)
+        return QPoint(x, y)
+
+    def pick_route(self, speed, stops=None):
+        """Replace the route with 1-3 random waypoints walked at `speed` px/s."""
+        self.mover.stop()
+        for _ in range(stops or random.randint(1, 3)):
+            p = self.pick_random_target()
+            self.mover.queue(p.x(), p.y(), speed)
+
+    def add_waypoint(self, x, y, speed=WALK_SPEED):
+        self.mover.queue(x, y, speed)
+        self.sync_movement()
 
     def update_position(self):
         if self.manual_override:
             self.handle_keyboard_movement()
             return
 
-        if self.target and self.speed > 0:
-            current = self.pos()
-            dx = self.target.x() - current.x()
-            dy = self.target.y() - current.y()
-
-            if abs(dx) < self.speed and abs(dy) < self.speed:
-                self.move(self.target)
-                self.play_animation("idle")
-                self.target = None
-                return
-
-            step_x = self.speed if dx > 0 else -self.speed if dx < 0 else 0
-            step_y = self.speed if dy > 0 else -self.speed if dy < 0 else 0
-            self.move(current.x() + step_x, current.y() + step_y)
+        if self.mover.step():
+            self.move(*self.mover.shown)
+            self.native_moves.record()
+        side = {-1: "left", 1: "right"}.get(self.mover.heading())
+        if side and side != self.direction:  # the route turned
+            self.direction = side
+            self.play_animation(self.current_anim.rsplit("_", 1)[0])
+        if not self.mover.moving:  # last waypoint reached
+            self.play_animation("idle")
+            self.sync_movement()
 
     # --- keyboard override ---
     def handle_keyboard_movement(self):
-        step = 4
-        move_type = "walk"
-
-        if "shift" in self.keys_pressed:
-            step *= 2
-            move_type = "run"
-
-        if "a" in self.keys_pressed or "left" in self.keys_pressed:
-            self.direction = "left"
-            self.move(self.x() - step, self.y())
-            self.play_animation(move_type)
-        elif "d" in self.keys_pressed or "right" in self.keys_pressed:
-            self.direction = "right"
-            self.move(self.x() + step, self.y())
-            self.play_animation(move_type)
-        elif "space" in self.keys_pressed:
-            self.play_animation("attack")
-        elif "h" in self.keys_pressed:
-            self.play_animation("hurt")
-        elif "k" in self.keys_pressed:
-            self.play_animation("die")
+        speed, move_type = (KEY_RUN_SPEED, "run") if "run" in self.keys_pressed else (KEY_WALK_SPEED, "walk")
+
+        if "left" in self.keys_pressed or "right" in self.keys_pressed:
+            self.direction = "left" if "left" in self.keys_pressed else "right"
+            if self.mover.slide(-speed if self.direction == "left" else speed, 0):
+                self.move(*self.mover.shown)
+                self.native_moves.record()
+            state = move_type
         else:
+            state = next((a for a in ("attack", "hurt", "die") if a in self.keys_pressed), "idle")
+        key = f"{state}_{self.direction}"
+        if self.current_anim != (key if key in self.animations else state):
+            self.play_animation(state)  # only on a change, so the animation keeps running
+
+    def on_keys_changed(self, actions):
+        self.keys_pressed = actions
+        if actions:
+            if not self.manual_override:
+                self.mover.stop()  # the keyboard takes over from the route
+            self.manual_override = True
+        elif self.manual_override:
+            self.manual_override = False
             self.play_animation("idle")
+        self.sync_movement()
 
-    def listen_keys(self):
-        while True:
-            pressed = set()
-            for key in ["a", "d", "left", "right", "shift", "space", "h", "k"]:
-                if keyboard.is_pressed(key):
-                    pressed.add(key)
 
-            if pressed:
-                self.manual_override = True
-                self.keys_pressed = pressed
-            else:
-                if self.manual_override:
-                    self.manual_override = False
-                    self.play_animation("idle")
+# ---- MULTI-PET MODE ----
+class PetState:
+    """What one pet in a Herd is doing; frames, timers and input are shared."""
+    __slots__ = ("mover", "direction", "anim", "frame_index")
+
+    def __init__(self, x, y):
+        self.mover = Mover(x, y)  # position and queued waypoints
+        self.direction = "right"
+        self.anim = "idle_right"
+        self.frame_index = 0
+
+
+class PetView(QLabel):
+    """A bare sprite window; the Herd decides what it shows and where."""
+
+    def __init__(self, herd=None, index=0):
+        super().__init__()
+        self.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint | Qt.Tool | Qt.Window)
+        self.setAttribute(Qt.WA_TranslucentBackground, True)
+        self.resize(PET_SIZE, PET_SIZE)
+        self.herd, self.index = herd, index
+
+    def mousePressEvent(self, event):
+        if self.herd and event.button() == Qt.LeftButton:
+            self.herd.press(self.index, event.globalPos())
+
+    def mouseMoveEvent(self, event):
+        if self.herd:
+            self.herd.drag(event.globalPos())
+
+    def mouseReleaseEvent(self, event):
+        if self.herd and event.button() == Qt.LeftButton:
+            self.herd.release()
+
+
+class Herd(QObject):
+    """
+    N pets on one frame store and one scheduler: each tick advances every
+    pet in a single pass. Pet 0 follows the keyboard override. Each pet is
+    its own native window; CanvasHerd paints them all on one canvas instead.
+    """
+
+    def __init__(self, count, frame_budget_mb=FRAME_BUDGET_MB, keymap=KEYMAP):
+        super().__init__()
+        self.frames = FramePool(SPRITES, frame_budget_mb,
+                                on_evict=lambda name: self.render_cache.drop(name))
+        self.render_cache = RenderCache(self.frames)  # pets on the same frame share one pixmap
+        self.frame_stats = FrameStats()
+        self.move_stats = FrameStats()
+        self.screen_rect = QApplication.primaryScreen().geometry()
+        self.native_moves = MoveCounter()
+        self.pets = []
+        for _ in range(count):
+            x = random.randint(0, max(0, self.screen_rect.width() - PET_SIZE))
+            y = random.randint(0, max(0, self.screen_rect.height() - PET_SIZE))
+            self.pets.append(PetState(x, y))
+        self.views = self.make_views()
+
+        self.manual_override = False
+        self.keys_pressed = frozenset()
+        self.grabbed = None  # index of the pet held by the mouse
+        self._press_pos, self._grab_offset, self._dragging = None, (0, 0), False
+
+        self.scheduler = PetScheduler(self)
+        self.scheduler.add("anim", 150, self.next_frames)
+        self.scheduler.add("move", 30, self.update_positions, enabled=False)
+        self.scheduler.add("behavior", 4000, self.choose_behaviors)
+        self.scheduler.add("power", 15000, self.update_power_mode)
+        self.next_frames()
+
+        self.key_input = KeyInput(keymap, parent=self)
+        self.key_input.actions_changed.connect(self.on_keys_changed)
+        self.key_input.start()
+
+    # --- rendering: one native window per pet ---
+    def make_views(self):
+        views = []
+        for i, pet in enumerate(self.pets):
+            view = PetView(self, i)
+            view.move(*pet.mover.shown)
+            views.append(view)
+        return views
+
+    def windows(self):
+        return self.views
+
+    def show(self):
+        for window in self.windows():
+            window.show()
+
+    def show_frame(self, i, pixmap):
+        self.views[i].setPixmap(pixmap)
+
+    def place(self, i):
+        """Pet i's whole-pixel position changed."""
+        self.views[i].move(*self.pets[i].mover.shown)
+        self.native_moves.record()
+
+    def device_ratio(self, i):
+        return self.views[i].devicePixelRatioF()
+
+    # --- animation ---
+    def play_animation(self, pet, state):
+        key = f"{state}_{pet.direction}" if f"{state}_{pet.direction}" in self.frames else state
+        if key in self.frames and self.frames[key]:
+            pet.anim = key
+            pet.frame_index = 0
+
+    def next_frames(self):
+        started = time.perf_counter()
+        for i, pet in enumerate(self.pets):
+            frames = self.frames.get(pet.anim, [])
+            if not frames:
+                continue
+            pet.frame_index %= len(frames)
+            self.show_frame(i, self.render_cache.get(pet.anim, pet.frame_index, PET_SIZE,
+                                                     PET_SIZE, self.device_ratio(i)))
+            pet.frame_index += 1
+        self.frame_stats.record(started)
+
+    # --- AI behavior ---
+    def choose_behaviors(self):
+        wanted = set()
+        for i, pet in enumerate(self.pets):
+            if (i == 0 and self.manual_override) or i == self.grabbed:
+                continue
+            action = random.choice(["idle", "idle_normal", "walk", "run", "attack", "hurt"])
+            if action in ["idle", "idle_normal"]:
+                pet.mover.stop()
+            elif action in ["walk", "run"]:
+                pet.mover.stop()
+                for _ in range(random.randint(1, 3)):
+                    pet.mover.queue(random.randint(0, self.screen_rect.width() - PET_SIZE),
+                                    random.randint(0, self.screen_rect.height() - PET_SIZE),
+                                    WALK_SPEED if action == "walk" else RUN_SPEED)
+                pet.direction = "left" if pet.mover.heading() < 0 else "right"
+            self.play_animation(pet, action)
+            if random.random() < 0.001:
+                self.play_animation(pet, "die")
+            wanted.update(f"{a}_{pet.direction}" for a in ("idle", "walk", "run"))
+        self.sync_movement()
+        self.frames.prefetch(sorted(wanted))
+
+    # --- scheduling ---
+    def sync_movement(self):
+        moving = any(p.mover.moving for p in self.pets)
+        self.scheduler.set_enabled("move", self.manual_override or moving)
+
+    def update_power_mode(self):
+        self.scheduler.set_power_saving(on_battery() or all(is_occluded(w) for w in self.windows()))
+
+    def update_positions(self):
+        started = time.perf_counter()
+        now = time.monotonic()  # one clock read for the whole herd
+        arrived = False
+        for i, pet in enumerate(self.pets):
+            if i == 0 and self.manual_override:
+                self.handle_keyboard_movement(pet, i, now)
+                continue
+            if not pet.mover.moving:
+                continue
+            if pet.mover.step(now):
+                self.place(i)
+            side = {-1: "left", 1: "right"}.get(pet.mover.heading())
+            if side and side != pet.direction:  # the route turned
+                pet.direction = side
+                self.play_animation(pet, pet.anim.rsplit("_", 1)[0])
+            if not pet.mover.moving:
+                self.play_animation(pet, "idle")
+                arrived = True
+        if arrived:
+            self.sync_movement()
+        self.move_stats.record(started)
+
+    # --- keyboard override (pet 0) ---
+    def handle_keyboard_movement(self, pet, i=0, now=None):
+        speed, move_type = (KEY_RUN_SPEED, "run") if "run" in self.keys_pressed else (KEY_WALK_SPEED, "walk")
+        if "left" in self.keys_pressed or "right" in self.keys_pressed:
+            pet.direction = "left" if "left" in self.keys_pressed else "right"
+            if pet.mover.slide(-speed if pet.direction == "left" else speed, 0, now):
+                self.place(i)
+            state = move_type
+        else:
+            state = next((a for a in ("attack", "hurt", "die") if a in self.keys_pressed), "idle")
+        key = f"{state}_{pet.direction}"
+        if pet.anim != (key if key in self.frames else state):
+            self.play_animation(pet, state)
+
+    def on_keys_changed(self, actions):
+        self.keys_pressed = actions
+        if actions:
+            if not self.manual_override:
+                self.pets[0].mover.stop()  # the keyboard takes over from the route
+            self.manual_override = True
+        elif self.manual_override:
+            self.manual_override = False
+            self.play_animation(self.pets[0], "idle")
+        self.sync_movement()
+
+    # --- mouse: drag a pet around, a click pokes it ---
+    def press(self, i, pos):
+        """Left button down on pet i at global `pos`."""
+        pet = self.pets[i]
+        x, y = pet.mover.shown
+        self.grabbed, self._press_pos, self._grab_offset = i, pos, (pos.x() - x, pos.y() - y)
+        self._dragging = False
+        pet.mover.stop()
+        self.sync_movement()
+
+    def drag(self, pos):
+        if self.grabbed is None:
+            return
+        if not self._dragging and (pos - self._press_pos).manhattanLength() < CLICK_SLOP:
+            return  # still a click
+        self._dragging = True
+        if self.pets[self.grabbed].mover.jump(pos.x() - self._grab_offset[0], pos.y() - self._grab_offset[1]):
+            self.place(self.grabbed)
+
+    def release(self):
+        if self.grabbed is None:
+            return
+        self.play_animation(self.pets[self.grabbed], "idle" if self._dragging else "hurt")
+        self.grabbed = None
+
+    def frame_memory_mb(self):
+        return self.frames.resident_mb()
+
+
+# ---- CANVAS MODE ----
+class PetCanvas(QWidget):
+    """
+    One transparent, full-screen window every pet is painted into. A new
+    frame or a move only schedules a repaint of the boxes that changed; the
+    window mask is the pets' boxes (rounded out to MASK_GRID), so input
+    anywhere else passes through to the desktop.
+    """
+
+    def __init__(self, herd):
+        super().__init__()
+        self.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint | Qt.Tool | Qt.Window)
+        self.setAttribute(Qt.WA_TranslucentBackground, True)
+        self.herd = herd
+        self.setGeometry(herd.screen_rect)
+        self.origin = herd.screen_rect.topLeft()
+        self.sprites = [None] * len(herd.pets)  # pixmap each pet shows
+        self.boxes = [self.box(pet) for pet in herd.pets]  # where, in canvas coordinates
+        self.paint_stats = FrameStats()
+        self.mask_updates = 0
+        self._mask = QRegion()
+        self._mask_stale = True
+        self.sync_mask()
+
+    def box(self, pet):
+        x, y = pet.mover.shown
+        return QRect(x - self.origin.x(), y - self.origin.y(), PET_SIZE, PET_SIZE)
+
+    def set_frame(self, i, pixmap):
+        if self.sprites[i] is not pixmap:  # RenderCache hands out the same pixmap per frame
+            self.sprites[i] = pixmap
+            self.update(self.boxes[i])
+
+    def place(self, i):
+        box = self.box(self.herd.pets[i])
+        if box != self.boxes[i]:
+            self.update(self.boxes[i])  # uncover where it was
+            self.update(box)
+            self.boxes[i] = box
+            self._mask_stale = True
+
+    def sync_mask(self):
+        """Fit the input region to the pets; called once per tick, after every pet moved."""
+        if not self._mask_stale:
+            return
+        self._mask_stale = False
+        g = MASK_GRID
+        mask = QRegion()
+        for box in self.boxes:
+            left, top = box.x() // g * g, box.y() // g * g
+            right, bottom = -(-(box.right() + 1) // g) * g, -(-(box.bottom() + 1) // g) * g
+            mask += QRect(left, top, right - left, bottom - top)
+        if mask != self._mask:
+            self.update(mask - self._mask)  # newly shown area may hold stale pixels
+            self._mask = mask
+            self.setMask(mask)
+            self.mask_updates += 1
+
+    def paintEvent(self, event):
+        started = time.perf_counter()
+        painter = QPainter(self)
+        painter.setCompositionMode(QPainter.CompositionMode_Source)
+        painter.fillRect(event.rect(), Qt.transparent)  # clipped to the dirty region
+        painter.setCompositionMode(QPainter.CompositionMode_SourceOver)
+        dirty = event.region()  # the changed boxes, not their bounding rect
+        for box, sprite in zip(self.boxes, self.sprites):
+            if sprite is not None and dirty.intersects(box):
+                painter.drawPixmap(self.sprite_pos(box, sprite), sprite)
+        painter.end()
+        self.paint_stats.record(started)
+
+    def sprite_pos(self, box, sprite):
+        # where a QLabel puts it: left edge, centred vertically
+        h = sprite.height() / sprite.devicePixelRatio()
+        return QPoint(box.x(), box.y() + round((box.height() - h) / 2))
+
+    def pet_at(self, pos):
+        """Topmost pet with an opaque pixel under `pos` (canvas coordinates), or None."""
+        for i in reversed(range(len(self.boxes))):
+            box, sprite = self.boxes[i], self.sprites[i]
+            if sprite is None or not box.contains(pos):
+                continue
+            p = pos - self.sprite_pos(box, sprite)
+            dpr = sprite.devicePixelRatio()
+            image = sprite.toImage()
+            x, y = int(p.x() * dpr), int(p.y() * dpr)
+            if image.valid(x, y) and image.pixelColor(x, y).alpha() > 0:
+                return i
+        return None
+
+    def mousePressEvent(self, event):
+        i = self.pet_at(event.pos()) if event.button() == Qt.LeftButton else None
+        if i is None:
+            event.ignore()  # inside the mask's slack around a pet, but not on it
+            return
+        self.herd.press(i, event.globalPos())
+
+    def mouseMoveEvent(self, event):
+        self.herd.drag(event.globalPos())
+
+    def mouseReleaseEvent(self, event):
+        if event.button() == Qt.LeftButton:
+            self.herd.release()
+
+
+class CanvasHerd(Herd):
+    """
+    A Herd drawn on one PetCanvas: no window per pet, so animating or moving
+    a pet repaints its box in a window that never moves or resizes.
+    """
+
+    def make_views(self):
+        self.canvas = PetCanvas(self)
+        return []
+
+    def windows(self):
+        return [self.canvas]
+
+    def show_frame(self, i, pixmap):
+        self.canvas.set_frame(i, pixmap)
+
+    def place(self, i):
+        self.canvas.place(i)
+
+    def device_ratio(self, i):
+        return self.canvas.devicePixelRatioF()
+
+    def update_positions(self):
+        super().update_positions()
+        self.canvas.sync_mask()
+
+    def drag(self, pos):
+        super().drag(pos)
+        self.canvas.sync_mask()
 
 
 # ---- MAIN ----
-if __name__ == "__main__":
-    app = QApplication(sys.argv)
-    jimbruz = Jimbruz()
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pets", type=int, default=1, help="number of pets (shared frames and timers)")
+    parser.add_argument("--canvas", action="store_true",
+                        help="paint the pets on one full-screen transparent window instead of moving windows")
+    args, qt_args = parser.parse_known_args(argv)
+    app = QApplication(sys.argv[:1] + qt_args)
+    if args.canvas:
+        jimbruz = CanvasHerd(max(1, args.pets))
+    else:
+        jimbruz = Jimbruz() if args.pets <= 1 else Herd(args.pets)
     jimbruz.show()
-    sys.exit(app.exec_())
+    QTimer.singleShot(0, lambda: mark("ready"))  # first event-loop turn: the pet is on screen
+    return app.exec_()
+
+if __name__ == "__main__":
+    sys.exit(main())
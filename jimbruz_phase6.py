@@ -1,53 +1,128 @@
 import os
 import time
-import json
 import random
 import threading
 import tkinter as tk
-import pyttsx3
 from pathlib import Path
 
+from jimbruz_memory import open_journal, memories_command
+from jimbruz_log import open_logger, LOW, NORMAL
+from jimbruz_ask import AskPipeline, AskRequest, consume_stream, openai_deltas
+from jimbruz_replycache import open_reply_cache
+from jimbruz_prompt import build_prompt
+from jimbruz_state import open_state_store, restore
+from jimbruz_tts import TTSWorker, LOW as SPEAK_LOW, NORMAL as SPEAK_NORMAL, HIGH as SPEAK_HIGH
+from jimbruz_startup import LazyImport, warm_up as _warm_up, mark
+
+_recall = LazyImport("jimbruz_recall", "index_for")  # needs numpy; loaded on first use
+
 # ----------- Optional OpenAI ----------
-try:
-    from openai import OpenAI
-    OPENAI_KEY = os.getenv("OPENAI_API_KEY_REMOVED-LJMmh1ayqu4oVBQFt9pioi-bLfzjZHDx6BwF0ZrNT1Sqv_HNJlNhWwOPypwgOX9tqMiRdChF_KT3BlbkFJcqJGNUk2gZQyCQnTzYtKR0Qth6anrFldo6Gr3SmeXtC0tP38zANL498S6cOxY6tKhDJw5K6EkA") or None
-    client = OpenAI(api_key=OPENAI_KEY) if OPENAI_KEY else None
-except Exception:
-    client = None
+# openai takes longer to import than the window takes to appear, so the
+# client is created by get_client() on the first ask (or by warm_up())
+OPENAI_KEY = None       # read by get_client(), after .env is loaded
+# e.g. http://127.0.0.1:8808/v1 for the local stand-in (jimbruz_fakeapi.py)
+OPENAI_BASE_URL = None
+_PENDING = object()
+client = _PENDING  # None if unavailable; benchmarks may preset it
+_client_lock = threading.Lock()
+
+def get_client():
+    global client, OPENAI_KEY, OPENAI_BASE_URL
+    if client is _PENDING:
+        with _client_lock:
+            if client is _PENDING:
+                try:
+                    from dotenv import load_dotenv
+                    load_dotenv()
+                except Exception:
+                    pass
+                # same variables as jimbruz_core, so both can point at the stand-in
+                OPENAI_KEY = os.getenv("OPENAI_API_KEY") or None
+                OPENAI_BASE_URL = os.getenv("OPENAI_BASE_URL") or os.getenv("OPENAI_API_BASE") or None
+                new_client = None
+                if OPENAI_KEY:
+                    try:
+                        from openai import OpenAI
+                        new_client = OpenAI(api_key=OPENAI_KEY, base_url=OPENAI_BASE_URL)
+                    except Exception:
+                        pass
+                client = new_client
+    return client
+
+MODEL = "gpt-4o-mini"
+SYSTEM_PROMPT = "You are Jimbruz: a shy, wise, introverted Snow Beast. Short, calm, wry answers."
 
 # ----------- Persistence ---------------
 DATA_DIR = Path("data")
 DATA_DIR.mkdir(exist_ok=True)
-MEMORY_FILE = DATA_DIR / "memories.json"
+MEMORY_FILE = DATA_DIR / "memories.jsonl"
+LEGACY_MEMORY_FILE = DATA_DIR / "memories.json"  # migrated on first run
 LOG_FILE = DATA_DIR / "session.log"
+journal = open_journal(MEMORY_FILE, LEGACY_MEMORY_FILE)
+logger = open_logger(LOG_FILE)
 
 def load_memories():
-    if MEMORY_FILE.exists():
+    try:
+        return journal.load_all()
+    except Exception:
+        return []
+
+def recent_memories(n):
+    try:
+        return journal.tail(n)
+    except Exception:
+        return []
+
+def relevant_memories(prompt, n):
+    # the n memories most related to prompt (oldest first), else the latest n
+    found = []
+    index_for = _recall.get()
+    if index_for:
         try:
-            return json.loads(MEMORY_FILE.read_text(encoding="utf8"))
+            found = index_for(journal).query(prompt, n)
         except Exception:
-            return []
-    return []
+            found = []
+    if not found:
+        return recent_memories(n)
+    return sorted(found, key=lambda m: m["time"])
 
 def save_memory(mem):
-    memories = load_memories()
-    memories.append({"time": time.time(), "note": mem})
-    MEMORY_FILE.write_text(json.dumps(memories, indent=2), encoding="utf8")
+    journal.append(mem)
 
-def log(msg):
-    t = time.strftime("%Y-%m-%d %H:%M:%S")
-    with open(LOG_FILE, "a", encoding="utf8") as f:
-        f.write(f"[{t}] {msg}\n")
+def log(event, priority=NORMAL, **fields):
+    # only queues the line; a background thread writes session.log in batches
+    logger.log(event, priority, **fields)
+
+def log_compaction(report):
+    if report["compacted"]:
+        log("compact", LOW, entries=report["compacted"], written=report["written"],
+            bytes_reclaimed=report["bytes_reclaimed"])
+
+def warm_up():
+    """Set up the OpenAI client, reply cache and recall index in the background."""
+    def build_index():
+        index_for = _recall.get()
+        if index_for:
+            index_for(journal)
+    return _warm_up(get_client, open_reply_cache, build_index)
 
 # ----------- Pet Core ------------------
 class Jimbruz:
-    def __init__(self, name="Jimbruz", species="Snow Beast"):
+    def __init__(self, name="Jimbruz", species="Snow Beast", state=None):
         self.name = name
         self.species = species
         self.energy = 5
         self.happiness = 3
         self.trust = 1
         self._clamp_stats()
+        self.state = state  # StateStore; stats persist across launches when set
+        if state is not None:
+            restore(self, state, journal)
+
+    def _log(self, event, **fields):
+        if self.state is not None:
+            self.state.update(self.energy, self.happiness, self.trust)
+        log(event, energy=self.energy, happiness=self.happiness, trust=self.trust, **fields)
 
     def _clamp_stats(self):
         self.energy = max(0, min(10, self.energy))
@@ -64,51 +139,66 @@ class Jimbruz:
 
     def feed(self):
         if random.random() < 0.75 or self.trust >= 4:
-            self.energy += 2; self.happiness += 1; self.trust += 1
+            self.energy += 2; self.happiness += 1; self.trust += 1; self._clamp_stats()
             msg = f"{self.name} eats slowly and nods. Energy {self.energy}, Trust {self.trust}"
-            save_memory("Accepted food"); log("feed")
+            save_memory("Accepted food"); self._log("feed")
         else:
-            self.trust -= 0.2
+            self.trust -= 0.2; self._clamp_stats()
             msg = f"{self.name} sniffs and steps away — not ready yet."
-            save_memory("Refused food"); log("feed-refuse")
-        self._clamp_stats(); return msg
+            save_memory("Refused food"); self._log("feed-refuse")
+        return msg
 
     def play(self):
         if self.trust < 3:
             msg = f"{self.name} retreats into the snowbank. Too shy to play."
-            save_memory("Play attempt failed"); log("play-fail")
+            save_memory("Play attempt failed"); self._log("play-fail")
         elif self.energy <= 1:
             msg = f"{self.name} yawns. Too tired for games."
         else:
-            self.happiness += 2; self.energy -= 1; self.trust += 0.7
+            self.happiness += 2; self.energy -= 1; self.trust += 0.7; self._clamp_stats()
             msg = f"{self.name} allows a gentle romp — it snorts happily."
-            save_memory("Played together"); log("play")
-        self._clamp_stats(); return msg
+            save_memory("Played together"); self._log("play")
+        return msg
 
     def sleep(self):
         self.energy = 8; self.happiness += 0.5
-        self._clamp_stats(); save_memory("Slept"); log("sleep")
+        self._clamp_stats(); save_memory("Slept"); self._log("sleep")
         return f"{self.name} curls up and rests quietly..."
 
-    def ask(self, prompt: str) -> str:
-        memories = load_memories()[-5:]
-        mem_summary = " | ".join([m["note"] for m in memories]) if memories else ""
+    def ask(self, prompt: str, request=None, on_token=None, on_sentence=None) -> str:
+        # streams the reply; returns None if `request` was cancelled meanwhile
+        request = request or AskRequest(prompt)
+        notes = [m["note"] for m in relevant_memories(prompt, 5)]
+        built = build_prompt(prompt, notes, SYSTEM_PROMPT, label=" ")  # within the token budget
+        client = get_client()
         if client:
+            cache = open_reply_cache()
+            key = cache.key(prompt, MODEL, SYSTEM_PROMPT, built.notes) if cache else None
+            out = cache.get(key) if cache else None
+            if out:
+                request.add(out); request.finish(); request.source = "cache"
+                if on_token: on_token(out)
+                if on_sentence: on_sentence(out)
+                save_memory(f"Q:{prompt} -> {out}"); self._log("ask", source="cache")
+                return out
             try:
-                resp = client.chat.completions.create(
-                    model="gpt-4o-mini",
+                stream = client.chat.completions.create(
+                    model=MODEL,
                     messages=[
-                        {"role": "system",
-                         "content": "You are Jimbruz: a shy, wise, introverted Snow Beast. "
-                                    "Short, calm, wry answers."},
-                        {"role": "user", "content": prompt + " " + mem_summary}
+                        {"role": "system", "content": SYSTEM_PROMPT},
+                        {"role": "user", "content": built.text}
                     ],
-                    temperature=0.8, max_tokens=100
+                    temperature=0.8, max_tokens=100, stream=True
                 )
-                out = resp.choices[0].message.content.strip()
-                save_memory(f"Q:{prompt} -> {out}"); log("ask-ai")
-                return out
+                consume_stream(request, openai_deltas(stream), on_token, on_sentence)
             except Exception: pass
+            if request.cancelled: return None
+            out = request.text.strip()
+            if out:
+                request.source = "openai"
+                if cache and request.done: cache.put(key, out)
+                save_memory(f"Q:{prompt} -> {out}"); self._log("ask", source="openai", **request.timing_fields(), **built.fields())
+                return out
         # fallback
         replies = [
             "I don’t always answer quickly.",
@@ -116,10 +206,15 @@ class Jimbruz:
             "Hmm. That deserves a patient nod."
         ]
         out = random.choice(replies)
-        save_memory(f"Q:{prompt} -> {out} (fallback)"); log("ask-fallback")
+        request.add(out); request.finish(); request.source = "fallback"
+        if on_token: on_token(out)
+        if on_sentence: on_sentence(out)
+        save_memory(f"Q:{prompt} -> {out} (fallback)"); self._log("ask", source="fallback")
         return out
 
 # ----------- Floating Overlay UI --------
+LABEL_REFRESH_MS = 33  # streamed text is pushed to the label at most ~30x/s
+
 class FloatingJimbruzUI:
     def __init__(self, root, pet: Jimbruz):
         self.root = root; self.pet = pet
@@ -141,10 +236,12 @@ class FloatingJimbruzUI:
         self.label.bind("<ButtonPress-1>", self.start_move)
         self.label.bind("<B1-Motion>", self.do_move)
 
-        # Voice
-        self.engine = pyttsx3.init()
-        self.engine.setProperty("rate", 165)
-        self.engine.setProperty("volume", 0.9)
+        # Voice (the engine warms up on the TTS thread; the window doesn't wait)
+        self.tts = TTSWorker(rate=165, volume=0.9)
+
+        # Streaming asks (a new question cancels the one in flight)
+        self.asks = AskPipeline()
+        self.streaming = None
 
         # Idle chatter
         self.last_interaction = time.time()
@@ -155,19 +252,48 @@ class FloatingJimbruzUI:
         ]
         self.check_idle()
 
-        self.say("…Hello. I'm Jimbruz. Quiet, but present.")
+        self.say("…Hello. I'm Jimbruz. Quiet, but present.", cache=True)
 
-    def say(self, text):
+    def say(self, text, priority=SPEAK_NORMAL, cache=False):
         self.label.config(text=text)
-        threading.Thread(target=lambda: self.engine.say(text) or self.engine.runAndWait(), daemon=True).start()
+        self.tts.say(text, priority, cache=cache)
+
+    def speak(self, text, request=None):
+        # only the fixed fallback lines keep their audio; model replies (cached or
+        # not) are arbitrary text and would grow data/tts_cache/ without bound
+        fixed = request is not None and request.source == "fallback"
+        self.tts.say(text, SPEAK_HIGH, request=request, cache=fixed)
 
     def on_enter(self, event=None):
         cmd = self.entry.get().strip(); self.entry.delete(0, tk.END)
         if not cmd: return
         self.last_interaction = time.time()
-        self.say("…thinking…")
+        self.tts.interrupt()  # whatever Jimbruz was saying is stale now
+        parts = cmd.split(maxsplit=1)
+        if parts[0].lower() == "ask" and len(parts) > 1:
+            self.start_ask(parts[1]); return
+        self.say("…thinking…", cache=True)
         threading.Thread(target=self.process_command, args=(cmd,), daemon=True).start()
 
+    # Streaming replies: tokens land in request.text on the worker thread,
+    # the label picks them up at display rate on the Tk thread
+    def start_ask(self, question):
+        self.label.config(text="…thinking…")
+        request = self.asks.submit(question, lambda r: self.pet.ask(
+            question, request=r, on_sentence=lambda s: self.speak(s, r)))
+        self.streaming = request
+        self.refresh_stream()
+
+    def refresh_stream(self):
+        request = self.streaming
+        if request is None or request.cancelled:
+            return
+        done = request.done  # read before the text so the last tokens aren't missed
+        if request.text:
+            self.label.config(text=request.text)
+        if not done:
+            self.root.after(LABEL_REFRESH_MS, self.refresh_stream)
+
     def process_command(self, cmd: str):
         parts = cmd.split(maxsplit=1)
         verb = parts[0].lower(); arg = parts[1] if len(parts) > 1 else ""
@@ -175,11 +301,11 @@ class FloatingJimbruzUI:
         elif verb == "play": out = self.pet.play()
         elif verb == "sleep": out = self.pet.sleep()
         elif verb == "status": out = self.pet.status_str()
-        elif verb == "ask" and arg: out = self.pet.ask(arg)
         elif verb == "remember" and arg:
             save_memory(arg); out = "Jimbruz tilts its head and stores that memory."
         elif verb == "memories":
-            mems = load_memories(); out = "\n".join([m["note"] for m in mems[-5:]]) or "No memories yet."
+            try: out = "\n".join(memories_command(journal, arg, page_size=5))
+            except Exception as e: out = f"Couldn't read memories: {e}"
         elif verb in ("quit","exit"): self.quit(); return
         else: out = "Unknown command. Try: feed, play, sleep, ask <q>, status, quit"
         self.say(out)
@@ -187,11 +313,11 @@ class FloatingJimbruzUI:
     def check_idle(self):
         if time.time() - self.last_interaction > 40:
             phrase = random.choice(self.idle_phrases)
-            self.say(phrase); self.last_interaction = time.time()
+            self.say(phrase, SPEAK_LOW, cache=True); self.last_interaction = time.time()
         self.root.after(5000, self.check_idle)
 
     def quit(self):
-        self.say("…Goodbye.")
+        self.say("…Goodbye.", cache=True)
         self.root.after(1500, self.root.destroy)
 
     # Dragging
@@ -203,8 +329,14 @@ class FloatingJimbruzUI:
         self.root.geometry(f"+{x}+{y}")
 
 # ----------- Main ----------------------
-if __name__ == "__main__":
-    pet = Jimbruz()
+def main():
+    journal.compact_in_background(log_compaction)
+    pet = Jimbruz(state=open_state_store())
     root = tk.Tk()
     app = FloatingJimbruzUI(root, pet)
+    # once the window is up: first interaction possible, clients warm up behind it
+    root.after(0, lambda: (mark("ready"), warm_up()))
     root.mainloop()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+# jimbruz_prompt.py
+"""
+Token-budgeted prompt assembly for ask() (core and phase 6)
+ - Tokens are counted locally: tiktoken when installed, else a close
+   word-piece estimate; counts are memoized, so a memory that shows up in
+   every request is only tokenized once
+ - Context notes are deduplicated, ranked (things the user asked Jimbruz to
+   remember > earlier Q/A > daily summaries > stat events, newer first) and
+   added until the input budget is spent; long Q/A notes are shortened first
+ - build() reports the token counts so each request can log them
+"""
+
+import re
+import math
+from functools import lru_cache
+
+from jimbruz_memory import note_kind
+
+INPUT_BUDGET = 400      # tokens for system prompt + question + memories
+MAX_NOTE_TOKENS = 48    # a single memory is shortened beyond this
+PRIORITY = {"note": 0, "qa": 1, "summary": 2, "event": 3}
+_PIECE = re.compile(r"\w+|[^\w\s]")
+_SPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=None)
+def _encoding():
+    # loaded on the first count, not at import: building the BPE tables is slow
+    try:
+        import tiktoken  # pip install tiktoken (optional; exact counts)
+        try:
+            return tiktoken.encoding_for_model("gpt-4o-mini")
+        except Exception:
+            return tiktoken.get_encoding("o200k_base")
+    except Exception:
+        return None
+
+
+@lru_cache(maxsize=8192)
+def count_tokens(text):
+    encoding = _encoding()
+    if encoding is not None:
+        return len(encoding.encode(text))
+    # ~4 characters per token inside long words, punctuation is its own token
+    return sum(math.ceil(len(p) / 4) for p in _PIECE.findall(text))
+
+def truncate_tokens(text, limit):
+    """text cut to at most `limit` tokens (with an ellipsis if anything was cut)."""
+    if count_tokens(text) <= limit:
+        return text
+    encoding = _encoding()
+    if encoding is not None:
+        return encoding.decode(encoding.encode(text)[:max(0, limit - 1)]).rstrip() + "…"
+    used = 0
+    for m in _PIECE.finditer(text):
+        used += math.ceil(len(m.group()) / 4)
+        if used > limit - 1:
+            return text[:m.start()].rstrip() + "…"
+    return text
+
+
+class BuiltPrompt:
+    __slots__ = ("text", "notes", "tokens", "context_tokens", "dropped", "shortened")
+
+    def __init__(self, text, notes, tokens, context_tokens, dropped, shortened):
+        self.text = text                      # what goes in the user message
+        self.notes = notes                    # context notes that made it in (oldest first)
+        self.tokens = tokens                  # system + user message tokens
+        self.context_tokens = context_tokens
+        self.dropped = dropped                # notes left out (duplicates or over budget)
+        self.shortened = shortened            # notes cut down to MAX_NOTE_TOKENS
+
+    def fields(self):
+        """Token fields for the session log."""
+        return {"prompt_tokens": self.tokens, "context_tokens": self.context_tokens,
+                "notes_dropped": self.dropped or None, "notes_shortened": self.shortened or None}
+
+
+def build_prompt(prompt, notes, system_prompt="", label=" Related memories: ", sep=" | ",
+                 budget=INPUT_BUDGET, max_note_tokens=MAX_NOTE_TOKENS):
+    """
+    prompt + label + notes joined by sep, keeping the total (with the system
+    prompt) within `budget` tokens. `notes` are oldest first, as
+    relevant_memories() returns them; the kept ones stay in that order.
+    """
+    base = count_tokens(system_prompt) + count_tokens(prompt)
+    room = budget - base - count_tokens(label)
+
+    seen, ranked = set(), []
+    for age, note in enumerate(reversed(notes)):
+        key = _SPACE.sub(" ", note.strip().casefold())
+        if not key or key in seen:
+            continue
+        seen.add(key)
+        ranked.append((PRIORITY.get(note_kind(note), 3), age, note))
+    ranked.sort()
+
+    kept, used, shortened = [], 0, 0
+    sep_cost = count_tokens(sep)
+    for _, age, note in ranked:
+        text = truncate_tokens(note, max_note_tokens)
+        cost = count_tokens(text) + (sep_cost if kept else 0)
+        if used + cost > room:
+            continue  # a shorter, lower-priority note may still fit
+        shortened += text is not note
+        kept.append((age, text))
+        used += cost
+    kept.sort(reverse=True)  # back to oldest first
+    kept = [text for _, text in kept]
+
+    if kept:
+        text = prompt + label + sep.join(kept)
+        context = used + count_tokens(label)
+    else:
+        text, context = prompt, 0
+    return BuiltPrompt(text, kept, base + context, context, len(notes) - len(kept), shortened)
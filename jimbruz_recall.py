@@ -0,0 +1,163 @@
+# jimbruz_recall.py
+"""
+Relevance-ranked memory retrieval for ask() context
+ - BM25 over the memory journal, kept in NumPy-backed posting lists
+ - Built once from the journal, then updated on every save_memory()
+ - query(prompt, k) returns the k most relevant entries, no network needed
+"""
+
+import re
+import math
+import threading
+from array import array
+from collections import Counter
+
+import numpy as np
+
+_WORD = re.compile(r"[a-z0-9']+")
+STOPWORDS = frozenset("""
+a an and are as at be but by do does did for from have has had how i i'm in is it
+it's me my of on or so that the this to was we what when where who why will with
+you your asked q
+""".split())
+
+
+def tokenize(text):
+    return [w for w in _WORD.findall((text or "").lower()) if w not in STOPWORDS and len(w) > 1]
+
+
+class _Postings:
+    """Doc ids and term counts for one term; appended to as notes arrive."""
+    __slots__ = ("docs", "tfs", "_np_docs", "_np_tfs")
+
+    def __init__(self):
+        self.docs = array("i")
+        self.tfs = array("f")
+        self._np_docs = np.empty(0, dtype=np.int32)
+        self._np_tfs = np.empty(0, dtype=np.float32)
+
+    def arrays(self):
+        n = len(self._np_docs)
+        if n != len(self.docs):
+            # only the tail added since the last query is converted
+            self._np_docs = np.concatenate([self._np_docs, np.array(self.docs[n:], dtype=np.int32)])
+            self._np_tfs = np.concatenate([self._np_tfs, np.array(self.tfs[n:], dtype=np.float32)])
+        return self._np_docs, self._np_tfs
+
+
+class MemoryIndex:
+    def __init__(self, k1=1.2, b=0.75):
+        self.k1 = k1
+        self.b = b
+        self.entries = []
+        self._postings = {}
+        self._lengths = array("f")
+        self._np_lengths = np.empty(0, dtype=np.float32)
+        self._total_len = 0.0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def add(self, entry):
+        words = tokenize(entry["note"])
+        counts = {}
+        for w in words:
+            counts[w] = counts.get(w, 0) + 1
+        with self._lock:
+            doc = len(self.entries)
+            self.entries.append(entry)
+            self._lengths.append(len(words))
+            self._total_len += len(words)
+            for w, c in counts.items():
+                p = self._postings.get(w)
+                if p is None:
+                    p = self._postings[w] = _Postings()
+                p.docs.append(doc)
+                p.tfs.append(c)
+
+    def add_many(self, entries):
+        for entry in entries:
+            self.add(entry)
+
+    def query(self, prompt, k=5):
+        """Top-k entries by BM25 score (best first); [] if nothing matches."""
+        terms = set(tokenize(prompt))
+        with self._lock:
+            n = len(self.entries)
+            if not n or not terms:
+                return []
+            if len(self._np_lengths) != n:
+                m = len(self._np_lengths)
+                self._np_lengths = np.concatenate(
+                    [self._np_lengths, np.array(self._lengths[m:], dtype=np.float32)])
+            avg = self._total_len / n or 1.0
+            norm = self.k1 * (1 - self.b + self.b * self._np_lengths / avg)
+            scores = np.zeros(n, dtype=np.float32)
+            for term in terms:
+                p = self._postings.get(term)
+                if p is None:
+                    continue
+                docs, tfs = p.arrays()
+                df = len(docs)
+                idf = math.log(1 + (n - df + 0.5) / (df + 0.5))
+                scores[docs] += idf * tfs * (self.k1 + 1) / (tfs + norm[docs])
+            entries = self.entries
+        hits = np.flatnonzero(scores)
+        if not len(hits):
+            return []
+        ranked = scores[hits]
+        if len(hits) > k:
+            # everything scoring at least the k-th best, ties at the boundary included
+            kth = np.partition(ranked, len(ranked) - k)[len(ranked) - k]
+            cand = np.flatnonzero(ranked >= kth)
+        else:
+            cand = np.arange(len(hits))
+        # best score first; newer memories win ties
+        top = cand[np.lexsort((-hits[cand], -ranked[cand]))[:k]]
+        return [entries[i] for i in hits[top]]
+
+
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+def index_for(journal):
+    """The index for a journal: built from its history once, then kept current."""
+    with _indexes_lock:
+        index = _indexes.get(id(journal))
+        if index is None:
+            index = _indexes[id(journal)] = _build(journal)
+        return index
+
+def _build(journal):
+    # Appends keep going while the history is indexed: they queue in `backlog`
+    # and are caught up afterwards. journal._lock is only held for the swaps.
+    index = MemoryIndex()
+    backlog = []
+    live = []
+
+    def on_append(entry):  # called under journal._lock
+        (index.add if live else backlog.append)(entry)
+
+    journal.subscribe(on_append)
+    history = journal.load_all()
+    with journal._lock:
+        queued = list(backlog)
+    # appends flushed while load_all() ran are in both; keep the queued copy
+    fresh = Counter((m["time"], m["note"]) for m in queued)
+    for m in history:
+        key = (m["time"], m["note"])
+        if fresh[key]:
+            fresh[key] -= 1
+            continue
+        index.add(m)
+    done = 0
+    while True:
+        with journal._lock:
+            more = backlog[done:]
+            if not more:
+                live.append(True)  # from here on appends go straight to the index
+                backlog.clear()
+                return index
+        index.add_many(more)
+        done += len(more)
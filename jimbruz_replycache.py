@@ -0,0 +1,151 @@
+# jimbruz_replycache.py
+"""
+Persistent reply cache for the OpenAI ask path (core and phase 6)
+ - Keyed by normalized prompt + model + system prompt + memory-context fingerprint
+ - Entries expire after a TTL; least-recently-used ones are evicted beyond
+   max_entries or max_bytes
+ - Optional variety: keep up to K replies per key and serve one at random,
+   so Jimbruz doesn't repeat itself word for word
+ - Hit / miss counters
+"""
+
+import re
+import time
+import random
+import sqlite3
+import hashlib
+import threading
+from pathlib import Path
+
+from jimbruz_memory import note_kind
+
+CACHE_FILE = Path("data") / "reply_cache.sqlite3"
+TTL = 7 * 24 * 3600      # seconds a cached reply stays valid
+MAX_ENTRIES = 2000       # replies kept (all variants count)
+MAX_BYTES = 2 * 1024 * 1024
+VARIETY = 1              # replies collected per key before serving from cache (>1 adds variety)
+
+_PUNCT = re.compile(r"[^\w\s']+")
+_SPACE = re.compile(r"\s+")
+
+
+def normalize_prompt(prompt):
+    """'  Tell me a JOKE!! ' -> 'tell me a joke'"""
+    return _SPACE.sub(" ", _PUNCT.sub(" ", (prompt or "").lower())).strip()
+
+def context_fingerprint(notes):
+    """
+    Hash of the memory notes that can change an answer. Stat events and
+    earlier Q/A pairs churn on every interaction, so only user-provided
+    notes are part of the fingerprint.
+    """
+    h = hashlib.sha1()
+    for note in notes:
+        if note_kind(note) == "note":
+            h.update(note.encode("utf8") + b"\0")
+    return h.hexdigest()[:16]
+
+
+class ReplyCache:
+    def __init__(self, path=CACHE_FILE, ttl=TTL, max_entries=MAX_ENTRIES,
+                 max_bytes=MAX_BYTES, variety=VARIETY):
+        self.path = Path(path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.variety = max(1, variety)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS replies (
+                key TEXT NOT NULL,
+                reply TEXT NOT NULL,
+                created REAL NOT NULL,
+                last_used REAL NOT NULL,
+                size INTEGER NOT NULL,
+                seen INTEGER NOT NULL DEFAULT 1,
+                PRIMARY KEY (key, reply)
+            )""")
+        self._db.execute("CREATE INDEX IF NOT EXISTS replies_lru ON replies (last_used)")
+
+    @staticmethod
+    def key(prompt, model, system_prompt, context_notes=()):
+        raw = "\x1f".join([normalize_prompt(prompt), model, system_prompt,
+                           context_fingerprint(context_notes)])
+        return hashlib.sha1(raw.encode("utf8")).hexdigest()
+
+    def get(self, key):
+        """A cached reply, or None (miss) if expired or still collecting variants."""
+        now = time.time()
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT rowid, reply, seen FROM replies WHERE key = ? AND created > ?",
+                (key, now - self.ttl)).fetchall()
+            # a model that keeps giving the same answer counts towards variety too
+            if sum(r[2] for r in rows) < self.variety:
+                self.misses += 1
+                return None
+            rowid, reply, _ = random.choice(rows)
+            self._db.execute("UPDATE replies SET last_used = ? WHERE rowid = ?", (now, rowid))
+            self.hits += 1
+            return reply
+
+    def put(self, key, reply):
+        if not reply:
+            return
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT INTO replies (key, reply, created, last_used, size) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (key, reply) DO UPDATE SET seen = seen + 1, last_used = excluded.last_used",
+                (key, reply, now, now, len(reply.encode("utf8"))))
+            self._evict(now)
+
+    def _evict(self, now):
+        db = self._db
+        db.execute("DELETE FROM replies WHERE created <= ?", (now - self.ttl,))
+        count, size = db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM replies").fetchone()
+        if count <= self.max_entries and size <= self.max_bytes:
+            return
+        drop_rows = max(0, count - self.max_entries)
+        drop_bytes = max(0, size - self.max_bytes)
+        victims = []
+        for rowid, sz in db.execute("SELECT rowid, size FROM replies ORDER BY last_used"):
+            if drop_rows <= 0 and drop_bytes <= 0:
+                break
+            victims.append((rowid,))
+            drop_rows -= 1
+            drop_bytes -= sz
+        db.executemany("DELETE FROM replies WHERE rowid = ?", victims)
+
+    def clear(self):
+        with self._lock:
+            self._db.execute("DELETE FROM replies")
+
+    def stats(self):
+        with self._lock:
+            count, size = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM replies").fetchone()
+        total = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "entries": count, "bytes": size}
+
+
+_caches = {}
+_caches_lock = threading.Lock()  # the first ask and a background warm-up may race
+
+def open_reply_cache(path=CACHE_FILE):
+    """Shared per-file instance; None if the cache can't be opened."""
+    key = str(Path(path).resolve())
+    with _caches_lock:
+        if key not in _caches:
+            try:
+                _caches[key] = ReplyCache(path)
+            except Exception:
+                _caches[key] = None
+        return _caches[key]
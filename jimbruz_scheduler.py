@@ -0,0 +1,117 @@
+# jimbruz_scheduler.py
+"""
+One scheduler for all pet time (animation, movement, behavior)
+ - A single-shot QTimer armed for the next deadline that matters
+ - Tasks due within `slack_ms` of each other run in the same wakeup
+ - Disabled tasks (e.g. movement while idle) cost nothing
+ - Power-saving mode stretches every interval (battery / occluded window)
+"""
+
+import time
+import glob
+
+from PyQt5.QtCore import QObject, QTimer
+
+POWER_SAVING_FACTOR = 3
+SLACK_MS = 12
+
+
+class _Task:
+    __slots__ = ("name", "interval", "callback", "enabled", "due")
+
+    def __init__(self, name, interval, callback, enabled):
+        self.name = name
+        self.interval = interval
+        self.callback = callback
+        self.enabled = enabled
+        self.due = 0.0
+
+
+class PetScheduler(QObject):
+    def __init__(self, parent=None, slack_ms=SLACK_MS):
+        super().__init__(parent)
+        self.slack_ms = slack_ms
+        self.power_saving = False
+        self.power_factor = POWER_SAVING_FACTOR
+        self.wakeups = 0
+        self._tasks = {}
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._tick)
+
+    # ---- tasks ----
+    def add(self, name, interval_ms, callback, enabled=True):
+        task = _Task(name, interval_ms, callback, enabled)
+        task.due = self._now() + self._interval(task)
+        self._tasks[name] = task
+        self._arm()
+
+    def set_enabled(self, name, enabled):
+        task = self._tasks[name]
+        if task.enabled == enabled:
+            return
+        task.enabled = enabled
+        if enabled:
+            task.due = self._now() + self._interval(task)
+        self._arm()
+
+    def set_interval(self, name, interval_ms):
+        task = self._tasks[name]
+        task.interval = interval_ms
+        task.due = min(task.due, self._now() + self._interval(task))
+        self._arm()
+
+    def set_power_saving(self, on):
+        if on != self.power_saving:
+            self.power_saving = on
+            self._arm()
+
+    def is_enabled(self, name):
+        return self._tasks[name].enabled
+
+    # ---- timing ----
+    def _now(self):
+        return time.monotonic() * 1000.0
+
+    def _interval(self, task):
+        return task.interval * (self.power_factor if self.power_saving else 1)
+
+    def _arm(self):
+        active = [t.due for t in self._tasks.values() if t.enabled]
+        if not active:
+            self._timer.stop()  # nothing to do until a task is re-enabled
+            return
+        self._timer.start(max(0, int(min(active) - self._now())))
+
+    def _tick(self):
+        self.wakeups += 1
+        now = self._now()
+        for task in list(self._tasks.values()):
+            if task.enabled and task.due <= now + self.slack_ms:
+                task.due = now + self._interval(task)
+                task.callback()
+        self._arm()
+
+
+# ---- POWER STATE ----
+def on_battery():
+    """True when running from a discharging battery (psutil, else Linux sysfs)."""
+    try:
+        import psutil
+        battery = psutil.sensors_battery()
+        return bool(battery) and not battery.power_plugged
+    except Exception:
+        pass
+    for status in glob.glob("/sys/class/power_supply/*/status"):
+        try:
+            with open(status) as f:
+                if f.read().strip() == "Discharging":
+                    return True
+        except OSError:
+            continue
+    return False
+
+def is_occluded(widget):
+    """True when the window system reports the widget as not exposed."""
+    handle = widget.windowHandle()
+    return bool(handle) and widget.isVisible() and not handle.isExposed()
@@ -0,0 +1,232 @@
+# jimbruz_sim.py
+"""
+Headless stat simulator for tuning Jimbruz's feed / play / sleep dynamics
+Run: python jimbruz_sim.py [--pets 1000000] [--ticks 100] [--policy random] [--seed 1]
+     python jimbruz_sim.py --parity      (check against the scalar Jimbruz class)
+Features:
+ - N pets x M ticks in NumPy: energy, happiness and trust are the rows of one
+   (3, N) array, and every rule from jimbruz_core.Jimbruz is applied to all
+   pets at once
+ - Pluggable, seedable user-action policy (one action per pet per tick)
+ - Distribution stats: time-to-friendly, refusal / hide rates, final moods
+ - jimbruz_core.Jimbruz stays the reference; parity_check() replays the same
+   random draws through it and compares every tick
+"""
+
+import sys
+import time
+import argparse
+
+import numpy as np
+
+FEED, PLAY, SLEEP, IDLE = 0, 1, 2, 3
+ACTIONS = ["feed", "play", "sleep", "idle"]
+MOODS = ["distant", "friendly", "content", "tired"]
+ENERGY, HAPPINESS, TRUST = 0, 1, 2
+
+# mirrors jimbruz_core.Jimbruz (the reference implementation)
+START = (5.0, 3.0, 1.0)
+FEED_ACCEPT = 0.75        # chance a feed is accepted...
+FEED_SURE_TRUST = 4       # ...unless trust is already at least this
+PLAY_SHY_TRUST = 3        # below this trust, play makes it hide
+PLAY_TIRED_ENERGY = 1     # at or below this energy, too tired to play
+FRIENDLY_TRUST = 6
+CONTENT_HAPPINESS = 7
+TIRED_ENERGY = 2
+
+
+# ---- policies: policy(tick, state, rng) -> action per pet ----
+def random_policy(weights=(0.4, 0.3, 0.1, 0.2)):
+    """Each tick every user picks feed/play/sleep/idle with fixed odds."""
+    p = np.asarray(weights, dtype=np.float64)
+    cuts = np.cumsum(p / p.sum())[:-1]
+
+    def policy(tick, state, rng):
+        u = rng.random(state.shape[1])
+        action = (u >= cuts[0]).view(np.int8).copy()
+        for c in cuts[1:]:
+            action += u >= c
+        return action
+    return policy
+
+def caring_policy(tick, state, rng):
+    """Sleep when tired, play once it's trusting enough, otherwise feed."""
+    energy, _, trust = state
+    return np.where(energy <= TIRED_ENERGY, SLEEP,
+                    np.where(trust >= PLAY_SHY_TRUST, PLAY, FEED)).astype(np.int8)
+
+POLICIES = {"random": random_policy(), "caring": caring_policy}
+
+
+# ---- rules ----
+# Each action ends in exactly one outcome per pet; the tables hold what that
+# outcome adds to each stat (sleep sets energy instead, see step()).
+OUTCOMES = ["fed", "refused", "hid", "too-tired", "romp", "slept", "idle"]
+_FIRST_OUTCOME = np.array([0, 2, 5, 6], dtype=np.int8)  # by action
+_D_ENERGY = np.array([2.0, 0.0, 0.0, -0.5, -1.0, 0.0, 0.0])
+_D_HAPPINESS = np.array([1.0, 0.0, -0.5, 0.0, 2.0, 0.5, 0.0])
+_D_TRUST = np.array([1.0, -0.2, 0.0, 0.0, 0.7, 0.0, 0.0])
+
+
+def moods(state):
+    """Mood index per pet, same precedence as status_str()."""
+    energy, happiness, trust = state
+    return np.select([trust >= FRIENDLY_TRUST, happiness >= CONTENT_HAPPINESS, energy <= TIRED_ENERGY],
+                     [1, 2, 3], 0).astype(np.int8)
+
+def step(state, action, draw):
+    """
+    Apply one action per pet in place and return each pet's outcome index
+    (see OUTCOMES). `draw` holds one uniform number per pet, used by feed the
+    way Jimbruz.feed() uses random.random().
+    """
+    energy, happiness, trust = state
+    outcome = _FIRST_OUTCOME.take(action)
+    outcome += (action == FEED) & (draw >= FEED_ACCEPT) & (trust < FEED_SURE_TRUST)
+    bold = (action == PLAY) & (trust >= PLAY_SHY_TRUST)
+    outcome += bold
+    outcome += bold & (energy > PLAY_TIRED_ENERGY)
+
+    # one table entry per pet: the same single number the scalar code adds
+    energy += _D_ENERGY.take(outcome)
+    np.copyto(energy, 8.0, where=action == SLEEP)
+    happiness += _D_HAPPINESS.take(outcome)
+    trust += _D_TRUST.take(outcome)
+    np.clip(state, 0, 10, out=state)
+    return outcome
+
+
+# ---- simulation ----
+CHUNK = 65536  # pets advanced together; small enough that the columns stay in cache
+
+
+def simulate(pets, ticks, policy=None, seed=None, record=False, chunk=CHUNK):
+    """Run `pets` pets for `ticks` ticks; same seed, same chunk size -> same result."""
+    policy = policy or POLICIES["random"]
+    rngs = np.random.default_rng(seed).spawn((pets + chunk - 1) // chunk)
+    state = np.empty((3, pets), dtype=np.float64)
+    state[:] = np.array(START)[:, None]
+    first_friendly = np.full(pets, -1, dtype=np.int32)
+    outcomes = np.zeros(len(OUTCOMES), dtype=np.int64)
+    history = []
+    for n, lo in enumerate(range(0, pets, chunk)):
+        hi = min(pets, lo + chunk)
+        _run(state[:, lo:hi], first_friendly[lo:hi], outcomes, ticks, policy, rngs[n],
+             history if record and n == 0 else None)
+    return {"state": state, "first_friendly": first_friendly,
+            "outcomes": dict(zip(OUTCOMES, outcomes.tolist())),
+            "history": history, "pets": pets, "ticks": ticks}
+
+
+def _run(state, first_friendly, outcomes, ticks, policy, rng, history):
+    for tick in range(ticks):
+        action = policy(tick, state, rng)
+        draw = rng.random(state.shape[1])
+        outcome = step(state, action, draw)
+        outcomes += np.bincount(outcome, minlength=len(OUTCOMES))
+        newly = (first_friendly < 0) & (state[TRUST] >= FRIENDLY_TRUST)
+        first_friendly[newly] = tick + 1
+        if history is not None:
+            history.append((action, draw, state.copy(), moods(state)))
+
+
+def summarize(result):
+    ff = result["first_friendly"]
+    c = result["outcomes"]
+    reached = ff[ff >= 0]
+    final = np.bincount(moods(result["state"]), minlength=len(MOODS)) / result["pets"]
+    feeds = c["fed"] + c["refused"]
+    plays = c["hid"] + c["too-tired"] + c["romp"]
+    out = {
+        "pets": result["pets"],
+        "ticks": result["ticks"],
+        "friendly_rate": len(reached) / result["pets"],
+        "refusal_rate": c["refused"] / feeds if feeds else 0.0,
+        "hide_rate": c["hid"] / plays if plays else 0.0,
+        "final_moods": {m: float(f) for m, f in zip(MOODS, final)},
+        "mean": {k: float(result["state"][i].mean()) for i, k in enumerate(("energy", "happiness", "trust"))},
+    }
+    if len(reached):
+        p = np.percentile(reached, [10, 50, 90])
+        out["time_to_friendly"] = {"p10": float(p[0]), "p50": float(p[1]), "p90": float(p[2])}
+    return out
+
+
+# ---- parity with the scalar reference ----
+def parity_check(pets=200, ticks=60, policy=None, seed=1):
+    """
+    Replay the simulator's actions and random draws through jimbruz_core.Jimbruz
+    and compare stats and mood after every tick. Returns a list of mismatches.
+    """
+    import io
+    import contextlib
+    import jimbruz_core as core
+
+    result = simulate(pets, ticks, policy, seed, record=True, chunk=pets)
+    mismatches = []
+    saved = core.random, core.save_memory, core.log
+    draws = iter(())
+
+    class _Draws:  # stands in for the random module inside feed()
+        @staticmethod
+        def random():
+            return next(draws)
+
+    core.random = _Draws
+    core.save_memory = lambda *a, **k: None
+    core.log = lambda *a, **k: None
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            for i in range(pets):
+                pet = core.Jimbruz()
+                for tick, (action, draw, state, mood) in enumerate(result["history"]):
+                    draws = iter([draw[i]])
+                    getattr(pet, ACTIONS[action[i]], lambda: None)()
+                    got = (pet.energy, pet.happiness, pet.trust)
+                    want = tuple(state[:, i].tolist())
+                    got_mood = pet.status_str().rsplit("(", 1)[1].rstrip(")")
+                    if got != want or got_mood != MOODS[mood[i]]:
+                        mismatches.append((i, tick, ACTIONS[action[i]], got, want, got_mood))
+                        break
+    finally:
+        core.random, core.save_memory, core.log = saved
+    return mismatches
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--pets", type=int, default=1000000)
+    ap.add_argument("--ticks", type=int, default=100)
+    ap.add_argument("--policy", choices=sorted(POLICIES), default="random")
+    ap.add_argument("--weights", type=float, nargs=4, metavar=("FEED", "PLAY", "SLEEP", "IDLE"),
+                    help="action odds for the random policy")
+    ap.add_argument("--seed", type=int, default=None)
+    ap.add_argument("--parity", action="store_true", help="compare against jimbruz_core.Jimbruz")
+    args = ap.parse_args()
+
+    policy = random_policy(args.weights) if args.weights else POLICIES[args.policy]
+    if args.parity:
+        bad = parity_check(policy=policy, seed=args.seed if args.seed is not None else 1)
+        for m in bad[:10]:
+            print("mismatch pet=%d tick=%d action=%s scalar=%s sim=%s mood=%s" % m)
+        print("parity OK" if not bad else f"{len(bad)} pets diverged")
+        return 1 if bad else 0
+
+    t = time.perf_counter()
+    stats = summarize(simulate(args.pets, args.ticks, policy, args.seed))
+    elapsed = time.perf_counter() - t
+    print(f"{stats['pets']} pets x {stats['ticks']} ticks in {elapsed:.2f}s "
+          f"({stats['pets'] * stats['ticks'] / elapsed / 1e6:.1f}M pet-ticks/s)")
+    print(f"friendly: {stats['friendly_rate']:.1%}", end="")
+    if "time_to_friendly" in stats:
+        ttf = stats["time_to_friendly"]
+        print(f"  time-to-friendly p10/p50/p90: {ttf['p10']:.0f}/{ttf['p50']:.0f}/{ttf['p90']:.0f} ticks", end="")
+    print()
+    print(f"refused feeds: {stats['refusal_rate']:.1%}  hid from play: {stats['hide_rate']:.1%}")
+    print("final moods: " + ", ".join(f"{m} {f:.1%}" for m, f in stats["final_moods"].items()))
+    print("mean: " + ", ".join(f"{k} {v:.2f}" for k, v in stats["mean"].items()))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,309 @@
+# jimbruz_spritecache.py
+"""
+Pre-decoded sprite cache - one binary file of ready-to-use RGBA frames
+Build: python jimbruz_spritecache.py [--force]
+Features:
+ - Every PNG under assets/jimbruz/* decoded and downscaled once, to the
+   largest size actually shown: the pets' box times the highest screen DPR
+   (DISPLAY_SIZE x 1 or 2, never above the source size); FRAME_SIZE overrides.
+   A cache built for a 2x screen is kept on a 1x one, not rebuilt
+ - Index of animation folder -> frame count + byte offset, stored in the file
+ - Front ends mmap the file and wrap frames as QImage / pygame surfaces
+   directly on the mapped bytes (no per-frame read or decode)
+ - Rebuilt automatically when a source PNG's mtime/size changes and its
+   content hash no longer matches
+ - PNGs are decoded on a shared thread pool (decode_all), for the build and
+   for front ends that load straight from the PNGs
+"""
+
+import os
+import sys
+import json
+import mmap
+import time
+import ctypes
+import struct
+import hashlib
+import threading
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+ASSETS_PATH = "assets/jimbruz"
+DISPLAY_SIZE = 128  # px, the pets' box in the Qt front ends
+MAX_DPR = 2         # highest screen scale frames are stored for (the 2x variant)
+FRAME_SIZE = None   # px; None = DISPLAY_SIZE x the screens' DPR (capped at the source size)
+CACHE_FILE = Path("data") / "sprites.bin"
+
+MAGIC = b"JBZSPR1\0"
+ALIGN = 64
+_HEADER = struct.Struct("<8sI")  # magic, index length
+DECODE_WORKERS = os.cpu_count() or 1
+
+
+# ---- SOURCE SCAN ----
+def _source_files(assets):
+    """folder name -> sorted list of PNG paths (same order load_frames uses)."""
+    out = {}
+    if not os.path.isdir(assets):
+        return out
+    for folder in sorted(os.listdir(assets)):
+        path = os.path.join(assets, folder)
+        if os.path.isdir(path):
+            out[folder] = png_paths(path)
+    return out
+
+def png_paths(folder):
+    if not os.path.isdir(folder):
+        return []
+    return [os.path.join(folder, f) for f in sorted(os.listdir(folder)) if f.endswith(".png")]
+
+def _png_size(path):
+    """(width, height) from the PNG header, without decoding."""
+    with open(path, "rb") as f:
+        head = f.read(24)
+    return struct.unpack(">II", head[16:24]) if head[12:16] == b"IHDR" else (0, 0)
+
+def screen_dpr():
+    """Highest device pixel ratio of the screens (1 or MAX_DPR); 1 without a Qt app."""
+    try:
+        from PyQt5.QtGui import QGuiApplication
+        app = QGuiApplication.instance()
+        dpr = max((s.devicePixelRatio() for s in app.screens()), default=1.0) if app else 1.0
+    except Exception:
+        dpr = 1.0
+    return MAX_DPR if dpr > 1 else 1
+
+def _frame_size(sources, dpr=1):
+    source = max((max(_png_size(p)) for paths in sources.values() for p in paths), default=1)
+    return max(1, min(source, round(DISPLAY_SIZE * dpr)))
+
+def _file_hash(path):
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+def _stat(path):
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+
+# ---- PARALLEL DECODE ----
+# Qt and pygame both release the GIL while inflating a PNG, so threads scale
+# with cores without pickling pixels between processes
+_pool = None
+_pool_lock = threading.Lock()
+
+def decode_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(max_workers=DECODE_WORKERS, thread_name_prefix="jimbruz-decode")
+    return _pool
+
+def decode_all(decode, paths, workers=None):
+    """[decode(p) for p in paths], run concurrently; order is kept."""
+    paths = list(paths)
+    if (workers or DECODE_WORKERS) <= 1 or len(paths) <= 1:
+        return [decode(p) for p in paths]
+    if workers is None:
+        return list(decode_pool().map(decode, paths))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="jimbruz-decode") as pool:
+        return list(pool.map(decode, paths))
+
+
+# ---- DECODING (build time only) ----
+def _decode_qt(path, size):
+    from PyQt5.QtCore import Qt
+    from PyQt5.QtGui import QImage, QPainter
+    src = QImage(path)
+    canvas = QImage(size, size, QImage.Format_RGBA8888)
+    canvas.fill(Qt.transparent)
+    if not src.isNull():
+        scaled = src.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        p = QPainter(canvas)
+        p.drawImage((size - scaled.width()) // 2, (size - scaled.height()) // 2, scaled)
+        p.end()
+    ptr = canvas.constBits()
+    ptr.setsize(canvas.sizeInBytes())
+    return bytes(ptr)
+
+def _decode_pygame(path, size):
+    import pygame
+    src = pygame.image.load(path)
+    w, h = src.get_size()
+    scale = min(size / w, size / h)
+    scaled = pygame.transform.smoothscale(src, (max(1, round(w * scale)), max(1, round(h * scale))))
+    canvas = pygame.Surface((size, size), pygame.SRCALPHA, 32)
+    canvas.blit(scaled, ((size - scaled.get_width()) // 2, (size - scaled.get_height()) // 2))
+    return pygame.image.tostring(canvas, "RGBA")
+
+def _decoder():
+    try:
+        import PyQt5.QtGui  # noqa: F401
+        return _decode_qt
+    except Exception:
+        return _decode_pygame
+
+
+# ---- BUILD / VALIDATE ----
+def build_cache(assets=ASSETS_PATH, out=CACHE_FILE, size=FRAME_SIZE, workers=None):
+    decode = _decoder()
+    sources = _source_files(assets)
+    size = size or _frame_size(sources, screen_dpr())
+    frame_bytes = size * size * 4
+    index = {"size": size, "frame_bytes": frame_bytes, "animations": {}, "files": {}}
+    offset = 0
+    for folder, paths in sources.items():
+        index["animations"][folder] = {"frames": len(paths), "offset": offset}
+        for p in paths:
+            mtime, fsize = _stat(p)
+            index["files"][p] = [mtime, fsize, _file_hash(p)]
+            offset += frame_bytes
+    blobs = decode_all(lambda p: decode(p, size), [p for paths in sources.values() for p in paths], workers)
+
+    head = json.dumps(index).encode("utf8")
+    data_start = _HEADER.size + len(head)
+    data_start += -data_start % ALIGN
+    index["data_start"] = data_start
+    head = json.dumps(index).encode("utf8")
+    # the offset may have grown by a digit; re-pad until it is stable
+    while _HEADER.size + len(head) > data_start:
+        data_start += ALIGN
+        index["data_start"] = data_start
+        head = json.dumps(index).encode("utf8")
+
+    out = Path(out)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    tmp = out.with_suffix(out.suffix + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, len(head)))
+        f.write(head)
+        f.write(b"\0" * (data_start - _HEADER.size - len(head)))
+        for b in blobs:
+            f.write(b)
+    os.replace(tmp, out)
+    return out
+
+def read_index(path=CACHE_FILE):
+    try:
+        with open(path, "rb") as f:
+            magic, n = _HEADER.unpack(f.read(_HEADER.size))
+            if magic != MAGIC:
+                return None
+            return json.loads(f.read(n).decode("utf8"))
+    except Exception:
+        return None
+
+def is_fresh(index, assets=ASSETS_PATH, size=FRAME_SIZE):
+    """Cheap mtime/size check first; only hash the files whose stat changed."""
+    if not index:
+        return False
+    sources = _source_files(assets)
+    if size:
+        if index.get("size") != size:
+            return False
+    elif not _frame_size(sources, screen_dpr()) <= index.get("size", 0) <= _frame_size(sources, MAX_DPR):
+        return False  # too small for this screen, or an old full-resolution cache
+    files = index.get("files", {})
+    current = [p for paths in sources.values() for p in paths]
+    if set(current) != set(files):
+        return False
+    for p in current:
+        mtime, fsize, digest = files[p]
+        if _stat(p) == (mtime, fsize):
+            continue
+        if _file_hash(p) != digest:
+            return False
+    return True
+
+def ensure_cache(assets=ASSETS_PATH, out=CACHE_FILE, size=FRAME_SIZE, force=False):
+    if force or not is_fresh(read_index(out), assets, size):
+        build_cache(assets, out, size)
+    return out
+
+
+# ---- MAPPED CACHE ----
+class SpriteCache:
+    def __init__(self, path=CACHE_FILE):
+        self.path = Path(path)
+        self.index = read_index(self.path)
+        self._file = open(self.path, "rb")
+        # ACCESS_COPY: pages stay shared with the page cache, but the buffer
+        # is writable so ctypes can hand its address to QImage
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_COPY)
+        self.size = self.index["size"]
+        self.frame_bytes = self.index["frame_bytes"]
+        self.data_start = self.index["data_start"]
+
+    def folders(self):
+        return list(self.index["animations"])
+
+    def _offset(self, folder, i):
+        anim = self.index["animations"][folder]
+        return self.data_start + anim["offset"] + i * self.frame_bytes
+
+    def frame_count(self, folder):
+        anim = self.index["animations"].get(folder)
+        return anim["frames"] if anim else 0
+
+    def frame_view(self, folder, i):
+        off = self._offset(folder, i)
+        return memoryview(self._map)[off:off + self.frame_bytes]
+
+    def qimages(self, folder):
+        from PyQt5 import sip
+        from PyQt5.QtGui import QImage
+        out = []
+        for i in range(self.frame_count(folder)):
+            addr = ctypes.addressof(ctypes.c_char.from_buffer(self._map, self._offset(folder, i)))
+            # QImage does not own the bytes; the mmap lives as long as this cache
+            out.append(QImage(sip.voidptr(addr), self.size, self.size,
+                              self.size * 4, QImage.Format_RGBA8888))
+        return out
+
+    def qt_frames(self, folder):
+        from PyQt5.QtGui import QPixmap
+        return [QPixmap.fromImage(img) for img in self.qimages(folder)]
+
+    def pygame_frames(self, folder):
+        import pygame
+        return [pygame.image.frombuffer(self.frame_view(folder, i), (self.size, self.size), "RGBA")
+                for i in range(self.frame_count(folder))]
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+def get_cache():
+    """Open (building or refreshing if needed) the shared sprite cache; None if unavailable."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            try:
+                _cache = SpriteCache(ensure_cache())
+            except Exception:
+                _cache = False
+    return _cache or None
+
+def cached_qt_frames(folder):
+    cache = get_cache()
+    name = os.path.basename(os.path.normpath(folder))
+    if cache is None or not cache.frame_count(name):
+        return None
+    return cache.qt_frames(name)
+
+def cached_pygame_frames(folder):
+    cache = get_cache()
+    name = os.path.basename(os.path.normpath(folder))
+    if cache is None or not cache.frame_count(name):
+        return None
+    return cache.pygame_frames(name)
+
+
+# ---- MAIN ----
+if __name__ == "__main__":
+    t = time.perf_counter()
+    path = ensure_cache(force="--force" in sys.argv)
+    idx = read_index(path)
+    total = sum(a["frames"] for a in idx["animations"].values())
+    print(f"{path}: {len(idx['animations'])} animations, {total} frames "
+          f"at {idx['size']}px ({os.path.getsize(path) / 1e6:.1f} MB) in {time.perf_counter() - t:.2f}s")
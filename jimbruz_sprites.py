@@ -0,0 +1,252 @@
+# jimbruz_sprites.py
+"""
+Shared sprite helpers for the Qt front ends (phases 2 - 4)
+ - RenderCache: frames pre-scaled once per (animation, frame, size, DPR)
+ - FrameStats: per-tick CPU cost of next_frame(), for before/after comparisons
+ - FramePool: animations decoded on first use, kept in an LRU within a MB budget
+ - FrameLoader: decodes animations off the GUI thread, one named first, and
+   hands each to the GUI thread as soon as it is done (pixmaps are made there)
+"""
+
+import os
+import time
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from PyQt5.QtCore import Qt, QObject, pyqtSignal
+from PyQt5.QtGui import QImage, QPixmap
+
+from jimbruz_spritecache import get_cache, png_paths, decode_all
+
+
+# ---- RENDER CACHE ----
+class RenderCache:
+    """Scaled copies of source frames, so a tick only has to swap a pixmap in."""
+
+    def __init__(self, animations):
+        self.animations = animations  # name -> [QPixmap] as loaded (PNG or sprite-cache size)
+        self._scaled = {}
+        self._key_size = None  # (w, h, dpr) the cached entries were built for
+
+    def get(self, anim, index, width, height, dpr=1.0):
+        size = (width, height, dpr)
+        if size != self._key_size:
+            # widget resized or moved to a screen with another DPR
+            self.invalidate()
+            self._key_size = size
+        key = (anim, index, width, height, dpr)
+        pixmap = self._scaled.get(key)
+        if pixmap is None:
+            src = self.animations[anim][index]
+            w, h = round(width * dpr), round(height * dpr)
+            if src.width() == w and src.height() == h:
+                pixmap = QPixmap(src)  # the sprite cache already holds this size
+            else:
+                pixmap = src.scaled(w, h, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            pixmap.setDevicePixelRatio(dpr)
+            self._scaled[key] = pixmap
+        return pixmap
+
+    def warm(self, anim, width, height, dpr=1.0):
+        for i in range(len(self.animations.get(anim, []))):
+            self.get(anim, i, width, height, dpr)
+
+    def invalidate(self):
+        self._scaled.clear()
+
+    def drop(self, anim):
+        for key in [k for k in self._scaled if k[0] == anim]:
+            del self._scaled[key]
+
+    def __len__(self):
+        return len(self._scaled)
+
+
+# ---- FRAME TIMING ----
+class FrameStats:
+    """Rolling record of how long each animation tick took (seconds)."""
+
+    def __init__(self, keep=600):
+        self.keep = keep
+        self.samples = []
+
+    def record(self, started):
+        self.samples.append(time.perf_counter() - started)
+        if len(self.samples) > self.keep:
+            del self.samples[:len(self.samples) - self.keep]
+
+    def summary(self):
+        if not self.samples:
+            return {"ticks": 0, "mean_us": 0.0, "p99_us": 0.0}
+        s = sorted(self.samples)
+        return {
+            "ticks": len(s),
+            "mean_us": sum(s) / len(s) * 1e6,
+            "p99_us": s[min(len(s) - 1, int(len(s) * 0.99))] * 1e6,
+        }
+
+
+# ---- LAZY FRAME POOL ----
+def load_images(folder, workers=None):
+    """Decode one animation to QImages (safe off the GUI thread; frames decode in parallel)."""
+    cache = get_cache()
+    name = os.path.basename(os.path.normpath(folder))
+    if cache is not None and cache.frame_count(name):
+        return cache.qimages(name)
+    return decode_all(QImage, png_paths(folder), workers)
+
+def load_pixmaps(folder, workers=None):
+    """load_images() converted to QPixmaps; GUI thread only."""
+    return [QPixmap.fromImage(img) for img in load_images(folder, workers)]
+
+def _pixmap_bytes(pixmap):
+    return pixmap.width() * pixmap.height() * pixmap.depth() // 8
+
+def _images_bytes(images):
+    return sum(img.sizeInBytes() for img in images)
+
+
+class FramePool:
+    """
+    Dict-like view of SPRITES (name -> [QPixmap]) that decodes an animation on
+    first access and evicts least-recently-used ones once over budget_mb.
+    prefetch() decodes in a background thread; pixmaps are still only created
+    on the GUI thread, when the animation is first asked for.
+    """
+
+    def __init__(self, sources, budget_mb=48, on_evict=None):
+        self.sources = sources  # name -> folder
+        self.budget = int(budget_mb * 1024 * 1024)
+        self.on_evict = on_evict
+        self._frames = OrderedDict()  # name -> [QPixmap], oldest first; GUI thread only
+        self._frame_bytes = 0         # size of _frames; GUI thread only, read anywhere
+        self._images = {}             # name -> [QImage] prefetched, not yet pixmaps
+        self._image_bytes = 0         # size of _images; under _lock
+        self._pending = set()
+        self._lock = threading.Lock()
+        self._worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="jimbruz-prefetch")
+
+    def __contains__(self, name):
+        return name in self.sources
+
+    def __getitem__(self, name):
+        frames = self.get(name)
+        if frames is None:
+            raise KeyError(name)
+        return frames
+
+    def get(self, name, default=None):
+        if name not in self.sources:
+            return default
+        frames = self._frames.get(name)
+        if frames is not None:
+            self._frames.move_to_end(name)
+            return frames
+        with self._lock:
+            images = self._images.pop(name, None)
+            if images is not None:
+                self._image_bytes -= _images_bytes(images)
+        if images is None:
+            images = load_images(self.sources[name])
+        frames = [QPixmap.fromImage(img) for img in images]
+        self._frames[name] = frames
+        self._frame_bytes += sum(_pixmap_bytes(p) for p in frames)
+        self._evict(keep=name)
+        return frames
+
+    def prefetch(self, names):
+        for name in names:
+            with self._lock:
+                if (name not in self.sources or name in self._frames
+                        or name in self._images or name in self._pending):
+                    continue
+                self._pending.add(name)
+            self._worker.submit(self._decode, name)
+
+    def _decode(self, name):
+        # worker thread: only QImages and the byte counters; pixmaps and
+        # eviction stay on the GUI thread
+        try:
+            images = load_images(self.sources[name])
+            size = _images_bytes(images)
+            with self._lock:
+                # a membership test is a single dict lookup; _frames is never iterated here
+                if name not in self._frames and self._frame_bytes + self._image_bytes + size <= self.budget:
+                    self._images[name] = images
+                    self._image_bytes += size
+        finally:
+            with self._lock:
+                self._pending.discard(name)
+
+    def _evict(self, keep=None):
+        while self.resident_bytes() > self.budget:
+            with self._lock:
+                if self._images:
+                    self._image_bytes -= _images_bytes(self._images.pop(next(iter(self._images))))
+                    continue
+            victim = next((n for n in self._frames if n != keep), None)
+            if victim is None:
+                break  # only the animation on screen is left
+            self._frame_bytes -= sum(_pixmap_bytes(p) for p in self._frames.pop(victim))
+            if self.on_evict:
+                self.on_evict(victim)
+
+    def loaded(self):
+        return list(self._frames)
+
+    def resident_bytes(self):
+        with self._lock:
+            return self._frame_bytes + self._image_bytes
+
+    def resident_mb(self):
+        return self.resident_bytes() / (1024 * 1024)
+
+
+# ---- STREAMING LOADER ----
+class FrameLoader(QObject):
+    """
+    Fills `frames` (name -> [QPixmap]) from `sources` (name -> folder).
+    load(name) decodes one animation right away; start() decodes the rest on
+    a background thread, one animation at a time with its frames in parallel,
+    and each arrives on the GUI thread (queued signal) to become pixmaps.
+    """
+    ready = pyqtSignal(str)          # frames[name] is filled in
+    finished = pyqtSignal()
+    _decoded = pyqtSignal(str, list)  # worker -> GUI thread: name, [QImage]
+
+    def __init__(self, sources, frames=None, workers=None, parent=None):
+        super().__init__(parent)
+        self.sources = sources
+        self.frames = {} if frames is None else frames
+        self.workers = workers
+        self._thread = None
+        self._decoded.connect(self._store)
+
+    def load(self, name):
+        """Decode `name` now (blocking, all cores) and return its pixmaps."""
+        if name not in self.frames:
+            self.frames[name] = load_pixmaps(self.sources[name], self.workers)
+            self.ready.emit(name)
+        return self.frames[name]
+
+    def start(self, first=()):
+        """Stream every animation not loaded yet; names in `first` go ahead of the rest."""
+        order = [n for n in first if n in self.sources]
+        order += [n for n in self.sources if n not in order]
+        order = [n for n in order if n not in self.frames]
+        self._thread = threading.Thread(target=self._run, args=(order,), name="jimbruz-frames", daemon=True)
+        self._thread.start()
+
+    def _run(self, order):
+        for name in order:
+            self._decoded.emit(name, load_images(self.sources[name], self.workers))
+        self._decoded.emit("", [])
+
+    def _store(self, name, images):
+        if not name:
+            self.finished.emit()
+            return
+        if name not in self.frames:  # load() may have got there first
+            self.frames[name] = [QPixmap.fromImage(img) for img in images]
+            self.ready.emit(name)
@@ -0,0 +1,143 @@
+# jimbruz_startup.py
+"""
+Startup helpers shared by the entry points (see jimbruz.py)
+ - LazyImport: an optional import resolved on first use instead of at module
+   import, so the window / prompt doesn't wait for numpy, openai, ...
+ - warm_up(): runs the expensive first uses on a background thread once the
+   first interaction is possible
+ - mark(): startup milestones ("ready", "warm"); printed to stderr when
+   JIMBRUZ_STARTUP_TRACE is set, and JIMBRUZ_STARTUP_EXIT=<milestone> exits
+   there (used by benchmarks/bench_launch.py)
+ - getenv(): an environment variable, or its line in .env, for settings read
+   at import time, before the first ask has loaded dotenv
+ - import_report(): `python -X importtime` for a module, summed per package
+"""
+
+import os
+import re
+import sys
+import time
+import threading
+import importlib
+
+TRACE = bool(os.getenv("JIMBRUZ_STARTUP_TRACE") or os.getenv("JIMBRUZ_STARTUP_EXIT"))
+EXIT_AT = os.getenv("JIMBRUZ_STARTUP_EXIT") or None
+_T0 = time.perf_counter()
+_HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+class LazyImport:
+    """`module` (or module.attr) imported on first get(); None if the import fails."""
+
+    def __init__(self, module, attr=None):
+        self.module = module
+        self.attr = attr
+        self._lock = threading.Lock()
+        self._done = False
+        self._value = None
+
+    @property
+    def loaded(self):
+        return self._done
+
+    def get(self):
+        if self._done:
+            return self._value
+        with self._lock:
+            if not self._done:
+                try:
+                    value = importlib.import_module(self.module)
+                    if self.attr:
+                        value = getattr(value, self.attr)
+                except Exception:
+                    value = None
+                self._value, self._done = value, True
+        return self._value
+
+
+def warm_up(*steps, name="jimbruz-warmup"):
+    """Run each step (a LazyImport or a callable) in order on a daemon thread, then mark("warm")."""
+    def run():
+        for step in steps:
+            try:
+                step.get() if isinstance(step, LazyImport) else step()
+            except Exception:
+                pass
+        mark("warm")
+    thread = threading.Thread(target=run, name=name, daemon=True)
+    thread.start()
+    return thread
+
+
+def mark(milestone):
+    if not TRACE:
+        return
+    # ms since this module was imported (the launcher imports it first) and the
+    # wall clock, so a parent process can add in interpreter start-up
+    print(f"jimbruz-startup {milestone} {(time.perf_counter() - _T0) * 1000:.1f} {time.time():.6f}",
+          file=sys.stderr, flush=True)
+    if milestone == EXIT_AT:
+        os._exit(0)  # measuring only; skip Qt / Tk teardown and atexit flushes
+
+
+# ---- settings before dotenv ----
+_ENV_LINE = re.compile(r"^\s*(?:export\s+)?([A-Za-z_]\w*)\s*=\s*(.*?)\s*$")
+
+def getenv(name, default=None):
+    """
+    os.getenv(name), else the value .env gives it, without importing dotenv
+    (that waits for the first ask). Looks for .env where load_dotenv() will:
+    next to these modules, then in each parent directory.
+    """
+    value = os.environ.get(name)
+    if value is not None:
+        return value
+    folder = _HERE
+    while True:
+        try:
+            with open(os.path.join(folder, ".env"), encoding="utf8") as f:
+                lines = f.read().splitlines()
+        except OSError:
+            parent = os.path.dirname(folder)
+            if parent == folder:
+                return default
+            folder = parent
+            continue
+        for line in lines:
+            m = _ENV_LINE.match(line)
+            if m and m[1] == name:
+                value = m[2]
+                if value[:1] in ("'", '"') and value[-1:] == value[:1] and len(value) > 1:
+                    return value[1:-1]
+                return value.split(" #", 1)[0].rstrip()
+        return default  # only the first .env found is used, as with dotenv
+
+
+# ---- import report ----
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+def import_report(modules, top=12, out=sys.stdout):
+    """
+    Import `modules` in a fresh interpreter under -X importtime and print the
+    total plus the slowest packages (self time summed per top-level package).
+    Returns the total in ms.
+    """
+    import subprocess
+    code = "; ".join(f"import {m}" for m in modules)
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                          capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+    per_package, total = {}, 0
+    for line in proc.stderr.splitlines():
+        m = _LINE.match(line)
+        if not m:
+            continue
+        self_us, cumulative_us, indent, name = int(m[1]), int(m[2]), len(m[3]), m[4]
+        package = name.split(".")[0]
+        per_package[package] = per_package.get(package, 0) + self_us
+        if indent == 1 and name in modules:
+            total += cumulative_us
+    print(f"import {', '.join(modules)}: {total / 1000:.1f} ms"
+          + ("" if proc.returncode == 0 else f"  (failed: {proc.stderr.strip().splitlines()[-1]})"), file=out)
+    for package, us in sorted(per_package.items(), key=lambda kv: -kv[1])[:top]:
+        print(f"  {package:<28} {us / 1000:8.1f} ms", file=out)
+    return total / 1000
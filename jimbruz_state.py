@@ -0,0 +1,179 @@
+# jimbruz_state.py
+"""
+Persisted pet stats (energy / happiness / trust) for core and phase 6
+ - One fixed-size 48-byte snapshot (data/pet_state.bin), read in O(1) at startup
+ - Written to a temp file, fsynced and renamed over the old one, so a crash
+   leaves either the old or the new snapshot, never a torn one
+ - Writes are coalesced: a burst of stat changes within checkpoint_interval
+   seconds becomes one write
+ - Changes made after the last checkpoint are recovered by replaying only the
+   journal entries newer than the snapshot
+"""
+
+import os
+import re
+import time
+import zlib
+import struct
+import atexit
+import threading
+from pathlib import Path
+
+STATE_FILE = Path("data") / "pet_state.bin"
+CHECKPOINT_INTERVAL = 2.0  # seconds; at most one write per interval while stats change
+MAGIC = b"JBZSTAT1"
+_RECORD = struct.Struct("<8sIdddd")  # magic, seq, energy, happiness, trust, as_of
+_CRC = struct.Struct("<I")
+SIZE = _RECORD.size + _CRC.size
+
+
+class Snapshot:
+    __slots__ = ("seq", "energy", "happiness", "trust", "as_of")
+
+    def __init__(self, seq, energy, happiness, trust, as_of):
+        self.seq = seq
+        self.energy = energy
+        self.happiness = happiness
+        self.trust = trust
+        self.as_of = as_of  # wall-clock time of the last change it includes
+
+
+def _num(x):
+    return int(x) if float(x).is_integer() else x
+
+
+class StateStore:
+    def __init__(self, path=STATE_FILE, checkpoint_interval=CHECKPOINT_INTERVAL):
+        self.path = Path(path)
+        self.checkpoint_interval = checkpoint_interval
+        self.writes = 0
+        self._lock = threading.Lock()
+        self._pending = None   # (energy, happiness, trust, as_of) not yet on disk
+        self._saved = None     # stats of the last snapshot written or loaded
+        self._timer = None
+        self._seq = 0
+
+    def load(self):
+        """The snapshot on disk, or None if missing / unreadable."""
+        try:
+            with open(self.path, "rb") as f:
+                data = f.read(SIZE)
+        except OSError:
+            return None
+        if len(data) != SIZE or zlib.crc32(data[:_RECORD.size]) != _CRC.unpack(data[_RECORD.size:])[0]:
+            return None
+        magic, seq, energy, happiness, trust, as_of = _RECORD.unpack(data[:_RECORD.size])
+        if magic != MAGIC:
+            return None
+        with self._lock:
+            self._seq = seq
+            self._saved = (energy, happiness, trust)
+        return Snapshot(seq, _num(energy), _num(happiness), _num(trust), as_of)
+
+    def update(self, energy, happiness, trust):
+        """Record new stats; the write happens at the next checkpoint."""
+        with self._lock:
+            if (energy, happiness, trust) == self._saved and self._pending is None:
+                return
+            self._pending = (energy, happiness, trust, time.time())
+            if self._timer is None:
+                self._timer = threading.Timer(self.checkpoint_interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self):
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            pending, self._pending = self._pending, None
+            if pending is None:
+                return
+            self._seq += 1
+            record = _RECORD.pack(MAGIC, self._seq, *[float(v) for v in pending])
+            data = record + _CRC.pack(zlib.crc32(record))
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+            try:
+                with open(tmp, "wb") as f:
+                    f.write(data)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp, self.path)
+            except OSError:
+                self._pending = pending  # try again at the next checkpoint
+                return
+            self._saved = pending[:3]
+            self.writes += 1
+
+
+# ---- replay ----
+# Memory notes that record a stat change, in core and phase 6 wording.
+# Core's feed note carries the resulting energy / trust, so those are set outright.
+_FED = re.compile(r"^Accepted food(?:\. Energy->(-?[\d.]+), Trust->(-?[\d.]+))?$")
+
+def apply_note(pet, note):
+    """Re-apply the stat change a memory note records; False if it records none."""
+    fed = _FED.match(note)
+    if fed:
+        if fed[1] is not None:
+            pet.energy, pet.trust = _num(float(fed[1])), _num(float(fed[2]))
+        else:
+            pet.energy += 2
+            pet.trust += 1
+        pet.happiness += 1
+    elif note in ("Refused food (too shy).", "Refused food"):
+        pet.trust -= 0.2
+    elif note == "Tried to play but it hid.":
+        pet.happiness -= 0.5  # core only; phase 6's "Play attempt failed" changes nothing
+    elif note in ("Played together. Happiness increased.", "Played together"):
+        pet.happiness += 2
+        pet.energy -= 1
+        pet.trust += 0.7
+    elif note in ("Slept; energy restored.", "Slept"):
+        pet.energy = 8
+        pet.happiness += 0.5
+    else:
+        return False
+    pet._clamp_stats()
+    return True
+
+
+def restore(pet, store, journal):
+    """
+    Load the snapshot into pet, then replay journal entries written after it
+    through apply_note(). Returns the number of entries replayed; a pet
+    with no snapshot keeps its starting stats.
+    """
+    snap = store.load()
+    if snap is None:
+        return 0
+    pet.energy, pet.happiness, pet.trust = snap.energy, snap.happiness, snap.trust
+    replayed = 0
+    for m in journal.since(snap.as_of):
+        if apply_note(pet, m["note"]):
+            replayed += 1
+    pet._clamp_stats()
+    if replayed:
+        store.update(pet.energy, pet.happiness, pet.trust)
+    return replayed
+
+
+# ---- shared instances ----
+_stores = {}
+_stores_lock = threading.Lock()
+
+def open_state_store(path=STATE_FILE):
+    key = os.path.abspath(path)
+    with _stores_lock:
+        if key not in _stores:
+            _stores[key] = StateStore(path)
+        return _stores[key]
+
+@atexit.register
+def _flush_all():
+    for store in list(_stores.values()):
+        try:
+            store.flush()
+        except Exception:
+            pass
@@ -0,0 +1,162 @@
+# jimbruz_tts.py
+"""
+Text-to-speech worker for the phase 6 overlay
+ - One thread owns the pyttsx3 engine (initialised in the background, so the
+   window doesn't wait for it) and speaks queued phrases by priority
+ - interrupt() stops whatever is playing and drops everything queued before it;
+   the engine is only ever touched from its own thread, which notices the
+   interrupt at the next word and stops itself
+ - Fixed phrases (greeting, goodbye, idle and fallback lines; the caller
+   passes cache=True) are rendered once to data/tts_cache/ (keyed by text,
+   voice and rate) and played back from the file afterwards
+"""
+
+import os
+import sys
+import time
+import wave
+import queue
+import shutil
+import hashlib
+import itertools
+import threading
+import subprocess
+from pathlib import Path
+
+LOW, NORMAL, HIGH = 0, 1, 2
+CACHE_DIR = Path("data") / "tts_cache"
+PLAYERS = ["afplay", "paplay", "aplay"]  # first one found on PATH is used
+
+
+class TTSWorker:
+    def __init__(self, rate=165, volume=0.9, cache_dir=CACHE_DIR):
+        self.rate = rate
+        self.volume = volume
+        self.cache_dir = Path(cache_dir)
+        self.ready = threading.Event()   # set once the engine is initialised (or failed)
+        self.engine = None
+        self.voice = "default"
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._queue = queue.PriorityQueue()
+        self._seq = itertools.count()
+        self._generation = 0
+        self._player = None              # subprocess playing a cached file
+        self._speaking = None            # generation of the utterance in runAndWait(), if any
+        self._lock = threading.Lock()
+        self._player_cmd = None if sys.platform == "win32" else next(
+            (p for p in PLAYERS if shutil.which(p)), None)
+        threading.Thread(target=self._run, name="jimbruz-tts", daemon=True).start()
+
+    # ---- public ----
+    def say(self, text, priority=NORMAL, request=None, cache=False):
+        """
+        Queue text; `request` (an AskRequest) makes it skippable once cancelled.
+        cache=True only for a fixed set of phrases: cached files are never evicted.
+        """
+        with self._lock:
+            gen = self._generation
+        self._queue.put((-priority, next(self._seq), gen, text, request, cache))
+
+    def interrupt(self):
+        """Stop the current utterance and drop everything queued so far."""
+        with self._lock:
+            self._generation += 1
+            player = self._player
+        if player is not None:
+            try:
+                player.terminate()
+            except Exception:
+                pass
+        if sys.platform == "win32":
+            try:
+                import winsound
+                winsound.PlaySound(None, 0)
+            except Exception:
+                pass
+
+    # ---- worker ----
+    def _init_engine(self):
+        try:
+            import pyttsx3
+            self.engine = pyttsx3.init()
+            self.engine.setProperty("rate", self.rate)
+            self.engine.setProperty("volume", self.volume)
+            self.voice = self.engine.getProperty("voice") or "default"
+            self.engine.connect("started-word", self._on_word)
+        except Exception:
+            self.engine = None  # no speech available; queued text is discarded
+        self.ready.set()
+
+    def _run(self):
+        self._init_engine()
+        while True:
+            _, _, gen, text, request, cache = self._queue.get()
+            if gen != self._generation or (request is not None and request.cancelled):
+                continue  # stale: interrupted or replaced by a newer question
+            if self.engine is None:
+                continue
+            try:
+                if cache and (self._player_cmd is not None or sys.platform == "win32"):
+                    self._play(self._render(text), gen)
+                else:
+                    self.engine.say(text)
+                    self._speaking = gen
+                    try:
+                        self.engine.runAndWait()
+                    finally:
+                        self._speaking = None
+            except Exception:
+                pass
+
+    def _on_word(self, name, location, length):
+        # pyttsx3 calls this from runAndWait(), i.e. on the worker thread
+        if self._speaking is not None and self._speaking != self._generation:
+            self.engine.stop()
+
+    # ---- audio cache ----
+    def cache_path(self, text):
+        key = hashlib.sha1(f"{text}\x1f{self.voice}\x1f{self.rate}".encode("utf8")).hexdigest()
+        return self.cache_dir / f"{key}.wav"
+
+    def _render(self, text):
+        path = self.cache_path(text)
+        if path.exists() and path.stat().st_size > 0:
+            self.cache_hits += 1
+            return path
+        self.cache_misses += 1
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp.wav")
+        self.engine.save_to_file(text, str(tmp))
+        self.engine.runAndWait()
+        os.replace(tmp, path)
+        return path
+
+    def _play(self, path, gen):
+        if gen != self._generation:
+            return  # interrupted while the clip was being rendered
+        if sys.platform == "win32":
+            import winsound
+            winsound.PlaySound(str(path), winsound.SND_FILENAME | winsound.SND_ASYNC)
+            # SND_ASYNC returns at once; wait out the clip unless interrupted
+            end = time.monotonic() + _duration(path)
+            while time.monotonic() < end and gen == self._generation:
+                time.sleep(0.05)
+            return
+        proc = subprocess.Popen([self._player_cmd, str(path)],
+                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        with self._lock:
+            self._player = proc
+        try:
+            proc.wait()
+        finally:
+            with self._lock:
+                self._player = None
+
+
+def _duration(path):
+    try:
+        with wave.open(str(path)) as w:
+            return w.getnframes() / float(w.getframerate())
+    except Exception:
+        return 3.0
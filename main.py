@@ -1,52 +1,128 @@
 import pygame
-import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from jimbruz_spritecache import cached_pygame_frames, png_paths, decode_all
+from jimbruz_startup import mark
 
 # --- Setup ---
 pygame.init()
 screen = pygame.display.set_mode((800, 600))
-clock = pygame.time.Clock()
+BACKGROUND = (30, 30, 30)
+SHOW_FPS = "--fps" in sys.argv  # frame-time overlay (toggle with F)
 
 # --- Function to load animation frames ---
+def decode_animation(folder_path):
+    """(frames, from_png); safe off the main thread."""
+    cached = cached_pygame_frames(folder_path)  # pre-decoded, mmap'd frames
+    if cached is not None:
+        return cached, False
+    return decode_all(pygame.image.load, png_paths(folder_path)), True  # PNGs decoded in parallel
+
+def finish_animation(decoded):
+    frames, from_png = decoded
+    # convert_alpha() needs the display, so it runs on the main thread
+    return [img.convert_alpha() for img in frames] if from_png else frames
+
 def load_animation(folder_path):
-    frames = []
-    for filename in sorted(os.listdir(folder_path)):
-        if filename.endswith(".png"):
-            img = pygame.image.load(os.path.join(folder_path, filename)).convert_alpha()
-            frames.append(img)
-    return frames
+    return finish_animation(decode_animation(folder_path))
 
 # --- Load Animations ---
-animations = {
-    "run_left": load_animation("assets/jimbruz/Left - Running"),
-    "walk_left": load_animation("assets/jimbruz/Left - Walking"),
-    "idle_right": load_animation("assets/jimbruz/Right - Idle"),
+# the one on screen first; the others decode in the background and are
+# picked up by the loop when ready
+ANIMATION_FOLDERS = {
+    "idle_right": "assets/jimbruz/Right - Idle",
+    "run_left": "assets/jimbruz/Left - Running",
+    "walk_left": "assets/jimbruz/Left - Walking",
 }
+animations = {"idle_right": load_animation(ANIMATION_FOLDERS["idle_right"])}
+loader = ThreadPoolExecutor(max_workers=1, thread_name_prefix="jimbruz-frames")
+pending = {name: loader.submit(decode_animation, folder)
+           for name, folder in ANIMATION_FOLDERS.items() if name not in animations}
 
 # --- Animation Settings ---
 current_animation = "idle_right"
-frame_index = 0
-animation_speed = 0.2  # lower = slower
+position = (400, 300)
+animation_speed = 0.2  # lower = slower (frames advanced per 1/60 s)
+frame_duration = 1.0 / (60 * animation_speed)  # seconds each frame stays on screen
+
+# --- Renderer ---
+# Only redraws when the frame or position changes, and only the rectangles
+# that changed; between changes the loop sleeps.
+font = None
+overlay_rect = pygame.Rect(8, 8, 220, 20)
+drawn = []        # timestamps of recent redraws, for the overlay
+frame_ms = 0.0    # time the last redraw took
+overlay_next = 0.0
+
+def draw_overlay(now):
+    global font
+    if font is None:
+        font = pygame.font.SysFont(None, 20)
+    while drawn and drawn[0] < now - 1.0:
+        drawn.pop(0)
+    screen.fill(BACKGROUND, overlay_rect)
+    text = font.render(f"{len(drawn)} redraws/s  {frame_ms:.2f} ms/frame", True, (200, 200, 200))
+    screen.blit(text, overlay_rect.topleft)
+    return overlay_rect
+
+screen.fill(BACKGROUND)
+pygame.display.flip()
+start = time.monotonic()
+shown = None       # (animation, frame, position) currently on screen
+shown_rect = None
+full_redraw = True
+first_frame = True
 
 # --- Game Loop ---
 running = True
 while running:
+    for name in [n for n, f in pending.items() if f.done()]:
+        animations[name] = finish_animation(pending.pop(name).result())
+    now = time.monotonic()
+    frames = animations[current_animation]
+    index = int((now - start) / frame_duration) % len(frames)
+    state = (current_animation, index, position)
+
+    dirty = []
+    if state != shown or full_redraw:
+        t = time.perf_counter()
+        frame = frames[index]
+        rect = frame.get_rect(topleft=position)
+        if full_redraw:
+            screen.fill(BACKGROUND)
+            dirty.append(screen.get_rect())
+        elif shown_rect:
+            screen.fill(BACKGROUND, shown_rect)  # erase only where the old frame was
+            dirty.append(shown_rect)
+        screen.blit(frame, rect)
+        dirty.append(rect)
+        shown, shown_rect, full_redraw = state, rect, False
+        frame_ms = (time.perf_counter() - t) * 1000
+        drawn.append(now)
+    if SHOW_FPS and (dirty or now >= overlay_next):
+        dirty.append(draw_overlay(now))
+        overlay_next = now + 1.0
+    if dirty:
+        pygame.display.update(dirty)
+        if first_frame:
+            mark("ready")  # the pet is on screen
+            first_frame = False
+
+    # sleep until the next frame is due; events are picked up on wakeup
+    # (event.wait(timeout) busy-polls every 1 ms on SDL drivers without wakeups)
+    next_change = start + (int((now - start) / frame_duration) + 1) * frame_duration
+    if SHOW_FPS:
+        next_change = min(next_change, overlay_next)
+    time.sleep(max(0.001, next_change - time.monotonic()))
     for event in pygame.event.get():
         if event.type == pygame.QUIT:
             running = False
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_f:
+            SHOW_FPS = not SHOW_FPS
+            full_redraw = True
+        elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.VIDEORESIZE):
+            full_redraw = True
 
-    # Update frame
-    frame_index += animation_speed
-    if frame_index >= len(animations[current_animation]):
-        frame_index = 0
-
-    # Draw background
-    screen.fill((30, 30, 30))
-
-    # Draw current frame of animation
-    frame = animations[current_animation][int(frame_index)]
-    screen.blit(frame, (400, 300))
-
-    pygame.display.flip()
-    clock.tick(60)
-
+loader.shutdown(wait=False, cancel_futures=True)
 pygame.quit()
@@ -0,0 +1,23 @@
+# tests/conftest.py
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+
+@pytest.fixture(scope="session")
+def workdir(tmp_path_factory):
+    """A scratch working directory for modules that keep data/ relative to it.
+    Not restored afterwards: their background writers may still flush at exit."""
+    path = tmp_path_factory.mktemp("work")
+    os.chdir(path)
+    return path
+
+
+@pytest.fixture(scope="session")
+def core(workdir):
+    """jimbruz_core, imported in the scratch directory (it opens data/ at import)."""
+    import jimbruz_core
+    return jimbruz_core
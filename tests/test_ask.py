@@ -0,0 +1,121 @@
+# tests/test_ask.py
+import threading
+
+import pytest
+
+from jimbruz_ask import AskPipeline, AskRequest, consume_stream, split_sentence
+from jimbruz_fakeapi import DEFAULT_REPLY, FakeChatServer
+
+
+@pytest.fixture(scope="module")
+def server():
+    fake = FakeChatServer(first_token_delay=0, token_delay=0).start()
+    yield fake
+    fake.stop()
+
+
+@pytest.fixture
+def pet(core, server, monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "local")
+    monkeypatch.setenv("OPENAI_BASE_URL", server.base_url)
+    monkeypatch.setattr(core, "client", core._PENDING)  # re-read the env on the next ask
+    cache = core.open_reply_cache()
+    cache.clear()
+    yield core.Jimbruz()
+    core.client = core._PENDING
+
+
+def test_split_sentence():
+    assert split_sentence("Hello there. How") == ("Hello there.", "How")
+    assert split_sentence('He said "hi!" then') == ('He said "hi!"', "then")
+    assert split_sentence("Wait") == (None, "Wait")
+    assert split_sentence("Wait.") == (None, "Wait.")  # may still be "Wait..."
+    assert split_sentence("Wait. ") == ("Wait.", "")
+    assert split_sentence("Really?! Yes") == ("Really?!", "Yes")
+
+
+def test_consume_stream_reports_sentences_and_timing():
+    sentences = []
+    request = consume_stream(AskRequest("q"), iter(["Hi", " there.", " Sit", " a while"]),
+                             on_sentence=sentences.append)
+    assert request.text == "Hi there. Sit a while"
+    assert sentences == ["Hi there.", "Sit a while"]
+    assert request.done and 0 <= request.ttft <= request.total
+
+
+def test_cancelled_stream_stops_and_drops_the_tail():
+    request = AskRequest("q")
+    sentences = []
+
+    def stream():
+        yield "One."
+        request.cancel()
+        yield " Two."
+        yield " Three"
+    consume_stream(request, stream(), on_sentence=sentences.append)
+    assert request.text == "One."
+    assert sentences == []
+
+
+def test_pipeline_cancels_the_older_ask():
+    pipeline = AskPipeline()
+    started, release, done = threading.Event(), threading.Event(), []
+
+    def slow(request):
+        started.set()
+        release.wait(5)
+        return "old"
+    first = pipeline.submit("a", slow, on_done=lambda r, reply: done.append(reply))
+    started.wait(5)
+    second = pipeline.submit("b", lambda r: "new", on_done=lambda r, reply: done.append(reply))
+    release.set()
+    for _ in range(100):
+        if len(pipeline.history) == 2:
+            break
+        threading.Event().wait(0.02)
+    assert first.cancelled and not second.cancelled
+    assert done == ["new"]
+
+
+def test_ask_streams_from_the_stand_in(pet, server):
+    tokens = []
+    out = pet.ask("tell me about snow", on_token=tokens.append)
+    assert out == DEFAULT_REPLY
+    assert len(tokens) > 1 and "".join(tokens) == DEFAULT_REPLY
+    request = pet.last_request
+    assert request.done and not request.cancelled
+    assert 0 <= request.ttft <= request.total
+    assert set(request.timing_fields()) == {"ttft_ms", "total_ms"}
+
+
+def test_repeated_question_is_answered_from_the_cache(pet, server, core):
+    pet.ask("what is frost")
+    server.reset_stats()
+    tokens = []
+    assert pet.ask("What is frost?", on_token=tokens.append) == DEFAULT_REPLY
+    assert tokens == [DEFAULT_REPLY]
+    assert server.stats()["requests"] == 0
+
+
+def test_superseded_ask_is_cancelled_and_not_cached(pet, server, core):
+    cache = core.open_reply_cache()
+    older, newer = [], []
+
+    def on_token(delta):
+        if older:
+            return
+        older.append(pet.last_request)
+        thread = threading.Thread(target=lambda: newer.append(pet.ask("a newer question")))
+        thread.start()
+        older.append(thread)
+        for _ in range(250):  # hold the stream until the newer ask has superseded it
+            if older[0].cancelled:
+                break
+            threading.Event().wait(0.02)
+
+    partial = pet.ask("an older question", on_token=on_token)
+    older[1].join(5)
+    assert older[0].cancelled
+    assert newer == [DEFAULT_REPLY]
+    assert partial != DEFAULT_REPLY and DEFAULT_REPLY.startswith(partial)
+    assert cache.stats()["entries"] == 1  # only the newer, complete reply
@@ -0,0 +1,45 @@
+# tests/test_batch.py
+import json
+
+SCRIPT = """# warm-up script
+
+feed
+status
+bogus command
+ask what is your name
+quit
+play
+"""
+
+
+def test_batch_prints_one_json_line_per_command(core, tmp_path, capsys, monkeypatch):
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    monkeypatch.setattr(core, "client", core._PENDING)
+    monkeypatch.setattr(core.journal, "compact_in_background", lambda on_done=None: None)
+    flushes = []
+    flush = core.journal.flush
+    monkeypatch.setattr(core.journal, "flush", lambda: flushes.append(1) or flush())
+    before = core.journal.count()
+    script = tmp_path / "script.txt"
+    script.write_text(SCRIPT, encoding="utf8")
+
+    core.main(["--batch", str(script)])
+    captured = capsys.readouterr()
+    rows = [json.loads(line) for line in captured.out.splitlines()]
+
+    assert [r["line"] for r in rows] == [3, 4, 5, 6, 7]  # comments and blank lines skipped
+    assert [r["command"] for r in rows] == ["feed", "status", "bogus command",
+                                            "ask what is your name", "quit"]  # stops at quit
+    assert [r["ok"] for r in rows] == [True, True, False, True, True]
+    assert all(set(r) == {"line", "command", "ok", "output", "ms"} for r in rows)
+    assert all(isinstance(r["ms"], float) and r["ms"] >= 0 for r in rows)
+    assert "Unknown command" in rows[2]["output"]
+    assert "They call me Jimbruz" in rows[3]["output"]
+    assert "Goodbye" in rows[4]["output"]
+
+    assert flushes == [1]  # feed + ask memories committed together
+    assert core.journal.count() == before + 2
+    report = captured.err.splitlines()
+    assert report[0].startswith("5 commands in ")
+    assert any(line.split()[0] == "?" for line in report[1:])
+    assert any(line.split()[0] == "feed" for line in report[1:])
@@ -0,0 +1,100 @@
+# tests/test_log.py
+import os
+import sys
+import time
+import subprocess
+
+from jimbruz_log import HIGH, LOW, NORMAL, SessionLogger, format_fields
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+
+def logger(tmp_path, **kw):
+    # the writer only runs on flush(): batches and the interval are out of reach
+    kw = {"batch_size": 10000, "flush_interval": 60, **kw}
+    return SessionLogger(tmp_path / "session.log", **kw)
+
+
+def lines(path):
+    return path.read_text(encoding="utf8").splitlines()
+
+
+def test_format_fields():
+    assert format_fields({"a": 1, "b": None, "c": 0.123456, "d": 'say "hi"', "e": ""}) == \
+        'a=1 c=0.1235 d="say \\"hi\\"" e=""'
+
+
+def test_records_are_written_in_one_batch(tmp_path):
+    log = logger(tmp_path)
+    for i in range(5):
+        log.log("tick", n=i)
+    assert not log.path.exists()  # nothing touches the disk until the writer runs
+    log.flush()
+    out = lines(log.path)
+    assert len(out) == 5
+    assert out[0].endswith("] tick n=0") and out[4].endswith("] tick n=4")
+    log.close()
+
+
+def test_batch_size_wakes_the_writer(tmp_path):
+    log = logger(tmp_path, batch_size=3)
+    for i in range(3):
+        log.log("tick", n=i)
+    for _ in range(250):  # no flush(): the third record alone must wake the writer
+        if log.path.exists() and len(lines(log.path)) == 3:
+            break
+        time.sleep(0.02)
+    assert len(lines(log.path)) == 3
+    log.close()
+
+
+def test_full_queue_drops_low_priority_first(tmp_path):
+    log = logger(tmp_path, max_queue=4)
+    log.log("low-1", LOW)
+    log.log("low-2", LOW)
+    log.log("normal-1", NORMAL)
+    log.log("normal-2", NORMAL)
+    log.log("high", HIGH)      # evicts low-1
+    log.log("normal-3", NORMAL)  # evicts low-2
+    log.log("low-3", LOW)      # nothing lower to evict: dropped itself
+    log.flush()
+    events = [line.split("] ", 1)[1] for line in lines(log.path)]
+    assert events == ["normal-1", "normal-2", "high", "normal-3", "log-dropped count=3"]
+    log.log("after")
+    log.flush()
+    assert lines(log.path)[-1].endswith("] after")  # the counter was reset
+    log.close()
+
+
+def test_rotation_keeps_a_bounded_number_of_backups(tmp_path):
+    log = logger(tmp_path, max_bytes=200, backups=3)
+    for batch in range(6):
+        for i in range(5):
+            log.log("event", batch=batch, n=i)
+        log.flush()
+    names = sorted(p.name for p in tmp_path.iterdir())
+    assert names == ["session.log.1", "session.log.2", "session.log.3"]
+    assert "batch=5" in (tmp_path / "session.log.1").read_text(encoding="utf8")
+    assert "batch=3" in (tmp_path / "session.log.3").read_text(encoding="utf8")
+    log.log("fresh")
+    log.flush()
+    assert len(lines(log.path)) == 1
+    log.close()
+
+
+def test_closed_logger_ignores_records(tmp_path):
+    log = logger(tmp_path)
+    log.log("before")
+    log.close()
+    log.log("after")
+    assert [line.split("] ", 1)[1] for line in lines(log.path)] == ["before"]
+
+
+def test_queued_records_are_flushed_at_exit(tmp_path):
+    path = tmp_path / "session.log"
+    code = ("import jimbruz_log\n"
+            f"log = jimbruz_log.open_logger({str(path)!r})\n"
+            "log.flush_interval = 60\n"
+            "log.log('bye', reason='exit')\n")
+    subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True, timeout=30)
+    assert lines(path)[-1].endswith("] bye reason=exit")
@@ -0,0 +1,93 @@
+# tests/test_memdb.py
+import sqlite3
+
+import pytest
+
+from jimbruz_memory import MemoryJournal
+from jimbruz_memdb import SQLiteMemoryStore
+
+NOTES = ["Snowy day", "tea and snow", "rain", "SNOWFALL", "100% sure", "x_y", "xzy", "I am ok",
+         'say "hi"', "Asked: what is frost? -> cold"]
+
+
+@pytest.fixture
+def journal(tmp_path):
+    j = MemoryJournal(tmp_path / "memories.jsonl", commit_interval=0)
+    with j.group():
+        for i, note in enumerate(NOTES):
+            j.append(note, t=float(i))
+    return j
+
+
+def open_store(tmp_path, journal_path=None):
+    return SQLiteMemoryStore(tmp_path / "memories.db", journal_path, commit_interval=0)
+
+
+def test_import_copies_the_journal_once(tmp_path, journal):
+    store = open_store(tmp_path, journal.path)
+    assert store.load_all() == journal.load_all()
+    store.close()
+    store = open_store(tmp_path, journal.path)
+    assert store.count() == len(NOTES)  # the meta marker stops a second import
+    store.close()
+
+
+def test_import_is_decided_by_the_marker_not_the_row_count(tmp_path, journal):
+    store = open_store(tmp_path)  # opened without a journal: nothing imported
+    store.append("written first", t=100.0)
+    store.close()
+    store = open_store(tmp_path, journal.path)
+    assert store.count() == len(NOTES) + 1
+    store.close()
+
+
+def test_failed_import_is_rolled_back(tmp_path, journal, monkeypatch):
+    def broken(m):
+        raise ValueError("bad row")
+    monkeypatch.setattr("jimbruz_memdb._params", broken)
+    with pytest.raises(ValueError):
+        open_store(tmp_path, journal.path)
+    monkeypatch.undo()
+    store = open_store(tmp_path, journal.path)
+    assert store.count() == len(NOTES)
+    store.close()
+
+
+@pytest.mark.parametrize("query", ["snow", "SNOW", "snow tea", "now", "ok", "am ok", "%", "x_y", "_",
+                                   '"hi"', "frost?", "zebra", "  "])
+def test_search_matches_the_journal(tmp_path, journal, query):
+    store = open_store(tmp_path, journal.path)
+    assert list(store.search(query)) == list(journal.search(query))
+    store.close()
+
+
+def test_search_pages_newest_first(tmp_path, journal):
+    store = open_store(tmp_path, journal.path)
+    assert [m["note"] for m in store.search("snow", limit=2)] == ["SNOWFALL", "tea and snow"]
+    assert [m["note"] for m in store.search("snow", limit=2, offset=2)] == ["Snowy day"]
+    store.close()
+
+
+def test_word_tokenizer_index_is_rebuilt_as_trigram(tmp_path, journal):
+    db = sqlite3.connect(tmp_path / "memories.db")
+    db.executescript("""
+        CREATE TABLE memories (id INTEGER PRIMARY KEY, time REAL NOT NULL, note TEXT NOT NULL, extra TEXT);
+        CREATE VIRTUAL TABLE memories_fts USING fts5(note, content='memories', content_rowid='id');
+        INSERT INTO memories (time, note) VALUES (1.0, 'Snowy day');
+    """)
+    db.close()
+    store = open_store(tmp_path)
+    if not store.fts:
+        pytest.skip("SQLite built without trigram FTS5")
+    assert [m["note"] for m in store.search("now")] == ["Snowy day"]
+    store.close()
+
+
+def test_since_tail_and_between(tmp_path, journal):
+    store = open_store(tmp_path, journal.path)
+    store.commit_interval = 60
+    store.append("pending", t=50.0)  # not committed yet
+    assert [m["time"] for m in store.since(7)] == [8.0, 9.0, 50.0]
+    assert [m["note"] for m in store.tail(2)] == ['Asked: what is frost? -> cold', "pending"]
+    assert [m["time"] for m in store.between(2, 5)] == [2.0, 3.0, 4.0]
+    store.close()
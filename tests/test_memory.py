@@ -0,0 +1,118 @@
+# tests/test_memory.py
+import json
+
+from jimbruz_memory import MemoryJournal, open_journal
+from jimbruz_startup import getenv
+
+
+def journal(tmp_path, **kw):
+    return MemoryJournal(tmp_path / "memories.jsonl", commit_interval=0, **kw)
+
+
+def test_append_flushes_one_line_per_entry(tmp_path):
+    j = journal(tmp_path)
+    j.append("hello", t=1.0)
+    j.append("world", t=2.0)
+    lines = j.path.read_text(encoding="utf8").splitlines()
+    assert [json.loads(line)["note"] for line in lines] == ["hello", "world"]
+
+
+def test_group_commits_once(tmp_path):
+    j = MemoryJournal(tmp_path / "memories.jsonl", batch_size=1000, commit_interval=60)
+    with j.group():
+        for i in range(5):
+            j.append(f"n{i}", t=float(i))
+        assert not j.path.exists()
+        assert [m["note"] for m in j.tail(2)] == ["n3", "n4"]  # pending entries are visible
+    assert len(j.path.read_text(encoding="utf8").splitlines()) == 5
+
+
+def test_torn_tail_is_skipped_and_not_glued_onto(tmp_path):
+    j = journal(tmp_path)
+    j.append("before", t=1.0)
+    with open(j.path, "a", encoding="utf8") as f:
+        f.write('{"time": 2.0, "note": "cut of')  # crash mid-write
+    j = journal(tmp_path)
+    assert [m["note"] for m in j.load_all()] == ["before"]
+    j.append("after", t=3.0)
+    assert [m["note"] for m in j.load_all()] == ["before", "after"]
+    assert [m["note"] for m in j.tail(5)] == ["before", "after"]
+
+
+def test_tail_reads_across_blocks(tmp_path, monkeypatch):
+    monkeypatch.setattr("jimbruz_memory.TAIL_BLOCK", 64)
+    j = journal(tmp_path)
+    with j.group():
+        for i in range(100):
+            j.append(f"note {i}", t=float(i))
+    assert [m["note"] for m in j.tail(3)] == ["note 97", "note 98", "note 99"]
+    assert len(j.tail(500)) == 100
+
+
+def test_since_and_between(tmp_path):
+    j = journal(tmp_path)
+    with j.group():
+        for i in range(200):
+            j.append(f"note {i}", t=float(i))
+    assert [m["time"] for m in j.since(195)] == [196.0, 197.0, 198.0, 199.0]
+    assert j.since(500) == []
+    assert len(j.since(-1)) == 200
+    assert [m["time"] for m in j.between(10, 13)] == [10.0, 11.0, 12.0]
+    assert [m["time"] for m in j.between(10, 20, limit=2, offset=3)] == [13.0, 14.0]
+    assert [m["time"] for m in j.between(198)] == [198.0, 199.0]
+
+
+def test_search_is_case_insensitive_substring_newest_first(tmp_path):
+    j = journal(tmp_path)
+    for i, note in enumerate(["Snowy day", "tea and snow", "rain", "SNOWFALL"]):
+        j.append(note, t=float(i))
+    assert [m["note"] for m in j.search("snow")] == ["SNOWFALL", "tea and snow", "Snowy day"]
+    assert [m["note"] for m in j.search("snow tea")] == ["tea and snow"]
+    assert list(j.search("   ")) == []
+
+
+def test_legacy_list_is_migrated_once(tmp_path):
+    legacy = tmp_path / "memories.json"
+    legacy.write_text(json.dumps([{"time": 1.0, "note": "old"}]), encoding="utf8")
+    j = journal(tmp_path, legacy_path=legacy)
+    assert [m["note"] for m in j.load_all()] == ["old"]
+    assert not legacy.exists()
+    assert (tmp_path / "memories.json.migrated").exists()
+
+
+def test_compact_rolls_up_old_events(tmp_path):
+    j = journal(tmp_path)
+    day = 86400
+    now = 10 * day
+    with j.group():
+        for i in range(3):
+            j.append("Slept; energy restored.", t=day + i)
+        j.append("I like tea", t=day + 10)
+        j.append("Slept; energy restored.", t=now - 60)
+    j.compact(older_than_days=3, now=now)
+    notes = [m["note"] for m in j.load_all()]
+    assert "I like tea" in notes
+    assert notes.count("Slept; energy restored.") == 1  # only the recent one stays verbatim
+    assert any(n.startswith("Daily summary ") for n in notes)
+
+
+def test_backend_is_chosen_when_the_journal_is_opened(tmp_path, monkeypatch):
+    monkeypatch.setenv("JIMBRUZ_MEMORY_BACKEND", "jsonl")  # after import, like a late .env load
+    assert isinstance(open_journal(tmp_path / "a.jsonl"), MemoryJournal)
+    monkeypatch.delenv("JIMBRUZ_MEMORY_BACKEND")
+    monkeypatch.setattr("jimbruz_startup._HERE", str(tmp_path))
+    (tmp_path / ".env").write_text("# settings\nexport JIMBRUZ_MEMORY_BACKEND='jsonl'  \n", encoding="utf8")
+    assert isinstance(open_journal(tmp_path / "b.jsonl"), MemoryJournal)
+    (tmp_path / ".env").write_text("OPENAI_API_KEY=x\n", encoding="utf8")
+    assert not isinstance(open_journal(tmp_path / "c.jsonl"), MemoryJournal)  # SQLite by default
+
+
+def test_getenv_reads_dotenv_lines(tmp_path, monkeypatch):
+    monkeypatch.setattr("jimbruz_startup._HERE", str(tmp_path / "sub"))
+    monkeypatch.delenv("JIMBRUZ_X", raising=False)
+    assert getenv("JIMBRUZ_X", "default") == "default"
+    (tmp_path / ".env").write_text('JIMBRUZ_X = "a b"\nJIMBRUZ_Y=1 # comment\n', encoding="utf8")
+    assert getenv("JIMBRUZ_X") == "a b"  # found in a parent directory
+    assert getenv("JIMBRUZ_Y") == "1"
+    monkeypatch.setenv("JIMBRUZ_X", "env wins")
+    assert getenv("JIMBRUZ_X") == "env wins"
@@ -0,0 +1,93 @@
+# tests/test_motion.py
+import pytest
+
+from jimbruz_motion import MAX_SLIDE_DT, MoveCounter, Mover, ease_in_out
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_ease_in_out():
+    assert ease_in_out(0.0) == 0.0
+    assert ease_in_out(0.5) == 0.5
+    assert ease_in_out(1.0) == 1.0
+    assert ease_in_out(0.1) < 0.1 and ease_in_out(0.9) > 0.9  # slow at both ends
+
+
+def test_leg_is_eased_and_takes_distance_over_speed():
+    clock = Clock()
+    m = Mover(0, 0, clock=clock)
+    m.go(100, 0, speed=100)
+    m.step(0.0)
+    m.step(0.25)
+    assert m.x == pytest.approx(100 * ease_in_out(0.25))
+    m.step(0.5)
+    assert m.x == pytest.approx(50)
+    m.step(1.0)
+    assert (m.x, m.y) == (100, 0)
+    assert not m.moving
+
+
+def test_result_does_not_depend_on_tick_rate():
+    a, b = Mover(0, 0, clock=Clock()), Mover(0, 0, clock=Clock())
+    for m in (a, b):
+        m.go(200, 50, speed=100)
+        m.step(0.0)
+    for i in range(1, 101):
+        a.step(i * 0.01)
+    b.step(1.0)
+    assert (a.x, a.y) == pytest.approx((b.x, b.y))
+
+
+def test_waypoints_are_walked_in_order_carrying_leftover_time():
+    m = Mover(0, 0, clock=Clock())
+    m.queue(100, 0, 100)
+    m.queue(100, 100, 100)
+    m.step(0.0)
+    assert m.heading() == 1
+    m.step(1.5)  # first leg done at 1.0, then half of the second
+    assert (m.x, m.y) == pytest.approx((100, 50))
+    assert m.target == (100, 100)
+    m.step(2.0)
+    assert not m.moving
+
+
+def test_step_reports_whole_pixel_changes_only():
+    m = Mover(0, 0, clock=Clock())
+    m.go(100, 0, speed=100)
+    assert m.step(0.0) is False
+    assert m.step(0.5) is True
+    assert m.step(0.5) is False
+
+
+def test_slide_caps_a_stalled_timer():
+    clock = Clock()
+    m = Mover(0, 0, clock=clock)
+    clock.now = 10.0
+    m.slide(100, 0)
+    assert m.x == pytest.approx(100 * MAX_SLIDE_DT)
+
+
+def test_jump_drops_the_route():
+    m = Mover(0, 0, clock=Clock())
+    m.go(100, 0, speed=100)
+    assert m.jump(30, 40) is True
+    assert not m.moving and (m.x, m.y) == (30, 40)
+
+
+def test_move_counter_window():
+    clock = Clock()
+    counter = MoveCounter(clock=clock)
+    for _ in range(3):
+        counter.record()
+    clock.now = 0.5
+    counter.record()
+    assert counter.per_second() == 4
+    clock.now = 1.2
+    assert counter.per_second() == 1
+    assert counter.total == 4
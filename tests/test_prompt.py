@@ -0,0 +1,52 @@
+# tests/test_prompt.py
+from jimbruz_prompt import build_prompt, count_tokens, truncate_tokens
+
+LABEL = " Related memories: "
+
+
+def test_everything_fits_in_a_large_budget():
+    built = build_prompt("hi?", ["I like tea", "Slept"], budget=1000)
+    assert built.text == "hi?" + LABEL + "I like tea | Slept"
+    assert built.notes == ["I like tea", "Slept"]
+    assert built.dropped == 0
+    assert built.tokens == count_tokens("hi?") + built.context_tokens
+
+
+def test_budget_is_never_exceeded():
+    notes = [f"Asked: question {i} -> answer number {i} about snow" for i in range(50)]
+    for budget in (20, 60, 150, 400):
+        built = build_prompt("what about snow?", notes, system_prompt="You are Jimbruz.", budget=budget)
+        assert built.tokens <= budget
+
+
+def test_user_notes_win_over_events_and_keep_their_order():
+    notes = ["I like tea", "Slept", "Played together", "My sister is Ana"]
+    room = count_tokens("q") + count_tokens(LABEL) + count_tokens("I like tea | My sister is Ana")
+    built = build_prompt("q", notes, budget=room)
+    assert built.notes == ["I like tea", "My sister is Ana"]
+    assert built.dropped == 2
+
+
+def test_duplicates_are_dropped_keeping_the_newest():
+    built = build_prompt("q", ["I like tea", "i  like TEA", "Slept"], budget=1000)
+    assert built.notes == ["i  like TEA", "Slept"]
+    assert built.dropped == 1
+
+
+def test_long_notes_are_shortened():
+    long = "Asked: " + " ".join(["snowflake"] * 100)
+    built = build_prompt("q", [long], budget=1000, max_note_tokens=10)
+    assert built.shortened == 1
+    assert count_tokens(built.notes[0]) <= 10
+    assert built.notes[0].endswith("…")
+
+
+def test_no_room_for_notes():
+    built = build_prompt("q", ["I like tea"], budget=1)
+    assert built.text == "q"
+    assert built.context_tokens == 0
+    assert built.dropped == 1
+
+
+def test_truncate_tokens_keeps_short_text():
+    assert truncate_tokens("short", 10) == "short"
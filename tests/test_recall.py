@@ -0,0 +1,55 @@
+# tests/test_recall.py
+from jimbruz_memory import MemoryJournal
+from jimbruz_recall import MemoryIndex, index_for, tokenize
+
+
+def entries(*notes):
+    return [{"time": float(i), "note": note} for i, note in enumerate(notes)]
+
+
+def notes(results):
+    return [m["note"] for m in results]
+
+
+def test_tokenize_drops_stopwords_and_single_letters():
+    assert tokenize("What is the Snow like, x?") == ["snow", "like"]
+
+
+def test_rarer_and_repeated_terms_rank_higher():
+    index = MemoryIndex()
+    index.add_many(entries("tea garden", "tea", "tea tea lichen", "garden party", "snow"))
+    assert notes(index.query("lichen tea", k=2)) == ["tea tea lichen", "tea"]
+    assert notes(index.query("garden", k=5)) == ["garden party", "tea garden"]
+
+
+def test_no_match():
+    index = MemoryIndex()
+    assert index.query("snow") == []
+    index.add_many(entries("tea"))
+    assert index.query("snow") == []
+    assert index.query("the") == []
+
+
+def test_ties_go_to_newer_entries():
+    index = MemoryIndex()
+    index.add_many(entries(*["snow day"] * 6))
+    top = index.query("snow", k=3)
+    assert [m["time"] for m in top] == [5.0, 4.0, 3.0]
+
+
+def test_entries_added_after_a_query_are_found():
+    index = MemoryIndex()
+    index.add_many(entries("tea"))
+    assert len(index.query("tea")) == 1
+    index.add({"time": 9.0, "note": "more tea"})
+    assert notes(index.query("tea")) == ["tea", "more tea"]  # shorter note scores higher
+
+
+def test_index_for_builds_once_and_follows_appends(tmp_path):
+    journal = MemoryJournal(tmp_path / "memories.jsonl", commit_interval=0)
+    journal.append("I like lichen", t=1.0)
+    index = index_for(journal)
+    assert index_for(journal) is index
+    journal.append("lichen on rocks", t=2.0)
+    assert len(index) == 2
+    assert notes(index.query("lichen rocks", k=1)) == ["lichen on rocks"]
@@ -0,0 +1,68 @@
+# tests/test_replycache.py
+from jimbruz_replycache import ReplyCache, normalize_prompt
+
+
+def cache(tmp_path, **kw):
+    return ReplyCache(tmp_path / "reply_cache.sqlite3", **kw)
+
+
+def test_key_ignores_case_punctuation_and_event_notes():
+    k = ReplyCache.key("Tell me a JOKE!!", "m", "sys", ["Slept", "I like tea"])
+    assert k == ReplyCache.key("  tell me a joke ", "m", "sys", ["I like tea", "Played together"])
+    assert k != ReplyCache.key("tell me a joke", "m", "sys", ["I like coffee"])
+    assert k != ReplyCache.key("tell me a joke", "other", "sys", ["I like tea"])
+    assert normalize_prompt("  Tell me a JOKE!! ") == "tell me a joke"
+
+
+def test_hit_and_miss(tmp_path):
+    c = cache(tmp_path)
+    assert c.get("k") is None
+    c.put("k", "hello")
+    assert c.get("k") == "hello"
+    assert (c.stats()["hits"], c.stats()["misses"]) == (1, 1)
+
+
+def test_entries_expire_after_ttl(tmp_path, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("jimbruz_replycache.time.time", lambda: now[0])
+    c = cache(tmp_path, ttl=60)
+    c.put("k", "hello")
+    now[0] += 59
+    assert c.get("k") == "hello"
+    now[0] += 2
+    assert c.get("k") is None
+    c.put("other", "x")  # eviction drops the expired row
+    assert c.stats()["entries"] == 1
+
+
+def test_least_recently_used_is_evicted(tmp_path, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("jimbruz_replycache.time.time", lambda: now[0])
+    c = cache(tmp_path, max_entries=2)
+    for key in ("a", "b"):
+        now[0] += 1
+        c.put(key, key.upper())
+    now[0] += 1
+    assert c.get("a") == "A"  # b is now the least recently used
+    now[0] += 1
+    c.put("c", "C")
+    assert c.get("b") is None
+    assert (c.get("a"), c.get("c")) == ("A", "C")
+
+
+def test_byte_limit(tmp_path):
+    c = cache(tmp_path, max_bytes=10)
+    c.put("a", "12345")
+    c.put("b", "67890")
+    c.put("c", "xyz")
+    s = c.stats()
+    assert s["bytes"] <= 10
+    assert c.get("a") is None
+
+
+def test_variety_collects_replies_before_serving(tmp_path):
+    c = cache(tmp_path, variety=2)
+    c.put("k", "one")
+    assert c.get("k") is None
+    c.put("k", "two")
+    assert c.get("k") in ("one", "two")
@@ -0,0 +1,40 @@
+# tests/test_sim.py
+import numpy as np
+
+from jimbruz_sim import MOODS, OUTCOMES, POLICIES, parity_check, random_policy, simulate, summarize
+
+
+def test_parity_with_the_core_class(core):
+    assert parity_check(pets=50, ticks=40, seed=3) == []
+
+
+def test_parity_with_the_caring_policy(core):
+    assert parity_check(pets=20, ticks=40, policy=POLICIES["caring"], seed=5) == []
+
+
+def test_simulate_shapes():
+    result = simulate(100, 25, seed=1, chunk=32)
+    assert result["state"].shape == (3, 100)
+    assert result["first_friendly"].shape == (100,)
+    assert sum(result["outcomes"].values()) == 100 * 25
+    assert set(result["outcomes"]) == set(OUTCOMES)
+    stats = summarize(result)
+    assert abs(sum(stats["final_moods"].values()) - 1) < 1e-9
+    assert set(stats["final_moods"]) == set(MOODS)
+    assert ((result["state"] >= 0) & (result["state"] <= 10)).all()
+
+
+def test_same_seed_same_result():
+    a = simulate(200, 30, seed=7, chunk=64)
+    b = simulate(200, 30, seed=7, chunk=64)
+    c = simulate(200, 30, seed=8, chunk=64)
+    assert np.array_equal(a["state"], b["state"])
+    assert np.array_equal(a["first_friendly"], b["first_friendly"])
+    assert a["outcomes"] == b["outcomes"]
+    assert not np.array_equal(a["state"], c["state"])
+
+
+def test_random_policy_weights():
+    policy = random_policy((0, 0, 0, 1))
+    action = policy(0, np.zeros((3, 10)), np.random.default_rng(0))
+    assert (action == 3).all()
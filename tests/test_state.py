@@ -0,0 +1,83 @@
+# tests/test_state.py
+import time
+
+from jimbruz_memory import MemoryJournal
+from jimbruz_state import SIZE, StateStore, apply_note, restore
+
+
+class Pet:
+    def __init__(self, energy=5, happiness=5, trust=0):
+        self.energy, self.happiness, self.trust = energy, happiness, trust
+
+    def _clamp_stats(self):
+        self.energy = max(0, min(10, self.energy))
+        self.happiness = max(0, min(10, self.happiness))
+        self.trust = max(0, min(10, self.trust))
+
+
+def test_snapshot_round_trip(tmp_path):
+    store = StateStore(tmp_path / "pet_state.bin", checkpoint_interval=60)
+    store.update(7, 4.5, 2)
+    assert store.load() is None  # nothing written before the checkpoint
+    store.flush()
+    assert (tmp_path / "pet_state.bin").stat().st_size == SIZE
+    snap = StateStore(tmp_path / "pet_state.bin").load()
+    assert (snap.seq, snap.energy, snap.happiness, snap.trust) == (1, 7, 4.5, 2)
+
+
+def test_updates_are_coalesced(tmp_path):
+    store = StateStore(tmp_path / "pet_state.bin", checkpoint_interval=60)
+    for e in range(10):
+        store.update(e, 5, 0)
+    store.flush()
+    store.flush()
+    assert store.writes == 1
+    assert store.load().energy == 9
+    store.update(9, 5, 0)  # unchanged since the last write
+    store.flush()
+    assert store.writes == 1
+
+
+def test_corrupt_snapshot_is_ignored(tmp_path):
+    path = tmp_path / "pet_state.bin"
+    store = StateStore(path, checkpoint_interval=60)
+    store.update(1, 2, 3)
+    store.flush()
+    data = bytearray(path.read_bytes())
+    data[20] ^= 0xFF
+    path.write_bytes(bytes(data))
+    assert StateStore(path).load() is None
+
+
+def test_apply_note():
+    pet = Pet()
+    assert apply_note(pet, "Accepted food. Energy->9, Trust->4")
+    assert (pet.energy, pet.happiness, pet.trust) == (9, 6, 4)
+    assert apply_note(pet, "Slept")
+    assert pet.energy == 8
+    assert not apply_note(pet, "I like tea")
+
+
+def test_restore_replays_only_newer_entries(tmp_path):
+    store = StateStore(tmp_path / "pet_state.bin", checkpoint_interval=60)
+    journal = MemoryJournal(tmp_path / "memories.jsonl", commit_interval=0)
+    journal.append("Played together", t=time.time() - 100)  # already in the snapshot
+    store.update(5, 5, 1)
+    store.flush()
+    later = time.time() + 1
+    journal.append("Played together", t=later)
+    journal.append("Refused food", t=later)
+    journal.append("I like tea", t=later)
+
+    pet = Pet(0, 0, 0)
+    assert restore(pet, store, journal) == 2
+    assert (pet.energy, pet.happiness, pet.trust) == (4, 7, 1.5)
+
+
+def test_restore_without_snapshot_keeps_stats(tmp_path):
+    store = StateStore(tmp_path / "pet_state.bin")
+    journal = MemoryJournal(tmp_path / "memories.jsonl", commit_interval=0)
+    journal.append("Slept")
+    pet = Pet(3, 3, 3)
+    assert restore(pet, store, journal) == 0
+    assert (pet.energy, pet.happiness, pet.trust) == (3, 3, 3)